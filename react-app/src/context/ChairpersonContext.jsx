@@ -1,4 +1,5 @@
 import { createContext, useContext, useState, useEffect } from 'react';
+import { conditionalFetch } from '../utils/conditionalFetch';
 
 const ChairpersonContext = createContext(null);
 
@@ -14,7 +15,7 @@ export function ChairpersonProvider({ children }) {
 
     // Load chairpersons from API
     const fetchChairpersons = () => {
-        fetch('http://localhost:5000/api/chairpersons')
+        conditionalFetch('http://localhost:5000/api/chairpersons')
             .then(res => res.json())
             .then(data => {
                 if (data.success) {
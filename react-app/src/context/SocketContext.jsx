@@ -1,4 +1,4 @@
-import { createContext, useContext, useEffect, useState, useCallback } from 'react';
+import { createContext, useContext, useEffect, useState, useCallback, useRef } from 'react';
 import { io } from 'socket.io-client';
 
 const SocketContext = createContext(null);
@@ -8,6 +8,9 @@ export function SocketProvider({ children }) {
     const [isConnected, setIsConnected] = useState(false);
     const [selectedSeat, setSelectedSeat] = useState(null);
     const [memberData, setMemberData] = useState(null);
+    const socketRef = useRef(null);
+    // Latency trace id of the most recent seat_selected event (see /api/latency-stats)
+    const seatTraceRef = useRef(null);
 
     // Fetch member data when seat changes
     const fetchMemberData = useCallback(async (seat) => {
@@ -15,11 +18,20 @@ export function SocketProvider({ children }) {
             setMemberData(null);
             return;
         }
+        const traceId = seatTraceRef.current;
+        seatTraceRef.current = null;
         try {
-            const response = await fetch(`http://localhost:5000/api/member/${seat}`);
+            const query = traceId ? `?trace=${traceId}` : '';
+            const response = await fetch(`http://localhost:5000/api/member/${seat}${query}`);
             const data = await response.json();
             if (data.success) {
                 setMemberData(data.data);
+                if (traceId) {
+                    // Acknowledge once the member has been painted
+                    requestAnimationFrame(() => {
+                        socketRef.current?.emit('seat_rendered', { trace_id: traceId, seat_no: seat });
+                    });
+                }
             } else {
                 setMemberData(null);
             }
@@ -48,9 +60,11 @@ export function SocketProvider({ children }) {
         // Listen for seat selection from UDP
         socketInstance.on('seat_selected', (data) => {
             console.log('Seat selected:', data.seat_no);
+            seatTraceRef.current = data.trace_id || null;
             setSelectedSeat(data.seat_no);
         });
 
+        socketRef.current = socketInstance;
         setSocket(socketInstance);
 
         return () => {
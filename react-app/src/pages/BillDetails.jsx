@@ -3,9 +3,12 @@ import Header from '../components/Header';
 import Footer from '../components/Footer';
 import { FilePlus, FileText, Clock, Plus, Trash2, Save, X, Check, Edit, Eye, User, ChevronDown, ChevronUp, Search, Archive, History, Printer } from 'lucide-react';
 import { useBroadcast } from '../context/BroadcastContext';
+import { useSocket } from '../context/SocketContext';
+import { conditionalFetch } from '../utils/conditionalFetch';
 
 export default function BillDetails() {
     const { isBroadcasting, broadcastType, updateBroadcastData } = useBroadcast();
+    const { socket } = useSocket();
     const [activeTab, setActiveTab] = useState(null);
     const [loading, setLoading] = useState(false);
     const [message, setMessage] = useState({ type: '', text: '' });
@@ -68,7 +71,7 @@ export default function BillDetails() {
 
     const fetchAllMembers = async () => {
         try {
-            const response = await fetch('http://localhost:5000/api/members');
+            const response = await conditionalFetch('http://localhost:5000/api/members');
             const data = await response.json();
             if (data.success) {
                 const members = data.data.filter(m => m.name && m.name !== 'VACANT');
@@ -209,7 +212,7 @@ export default function BillDetails() {
         setLoading(true);
         }
         try {
-            const response = await fetch(`http://localhost:5000/api/bill-details?status=${normalizedStatus}`);
+            const response = await conditionalFetch(`http://localhost:5000/api/bill-details?status=${normalizedStatus}`);
             const data = await response.json();
             if (data.success) {
                 if (isPast) {
@@ -229,11 +232,27 @@ export default function BillDetails() {
         }
     };
 
+    // Keep the open details modal live: the server pushes fresh totals on every log change
+    const detailsBillIdRef = useRef(null);
+    useEffect(() => {
+        detailsBillIdRef.current = showDetailsModal ? selectedBillDetails?.id : null;
+    }, [showDetailsModal, selectedBillDetails]);
+
+    useEffect(() => {
+        if (!socket) return;
+        const handleBillTimeUpdated = (update) => {
+            if (!update?.bill || update.bill_id !== detailsBillIdRef.current) return;
+            setConsumedTimeData(update.consumed_time || {});
+        };
+        socket.on('bill_time_updated', handleBillTimeUpdated);
+        return () => socket.off('bill_time_updated', handleBillTimeUpdated);
+    }, [socket]);
+
     // Fetch consumed time for a specific bill
     const fetchBillConsumedTime = async (bill) => {
         setLoadingDetails(true);
         try {
-            const response = await fetch(`http://localhost:5000/api/bill-consumed-time/${bill.id}`);
+            const response = await conditionalFetch(`http://localhost:5000/api/bill-consumed-time/${bill.id}`);
             const data = await response.json();
             if (data.success) {
                 setConsumedTimeData(data.data);
@@ -601,7 +620,7 @@ export default function BillDetails() {
         if (!bill) return;
         setLoadingPastLogs((prev) => ({ ...prev, [bill.id]: true }));
         try {
-            const response = await fetch(`http://localhost:5000/api/activity-logs/bill/${encodeURIComponent(bill.bill_name)}`);
+            const response = await conditionalFetch(`http://localhost:5000/api/activity-logs/bill/${encodeURIComponent(bill.bill_name)}`);
             const data = await response.json();
             if (data.success) {
                 setPastBillLogs((prev) => ({ ...prev, [bill.id]: data.data || [] }));
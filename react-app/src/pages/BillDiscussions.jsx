@@ -9,11 +9,13 @@ import { useChairperson } from '../context/ChairpersonContext';
 import { useBroadcast } from '../context/BroadcastContext';
 import { FileText, Clock } from 'lucide-react';
 import { getISTNow, formatISTForMySQL, normalizeSeatNo, seatsEqual } from '../utils/timezone';
+import { postActivityLog, beaconActivityLog } from '../utils/activityLog';
+import { conditionalFetch } from '../utils/conditionalFetch';
 
 export default function BillDiscussions() {
     const LOCAL_STORAGE_KEY = 'bd_selected_bill_id';
     const BD_SESSION_KEY = 'bd_active_session'; // Session storage for active broadcast session
-    const { selectedSeat, setSelectedSeat, memberData } = useSocket();
+    const { socket, selectedSeat, setSelectedSeat, memberData } = useSocket();
     const { chairperson, selectedChairpersonData } = useChairperson();
     const { setChairpersonData, isBroadcasting, globalTimerState, startBroadcastType, isBroadcastWindowOpen, startGlobalTimer, setGlobalTimer } = useBroadcast();
     const [bills, setBills] = useState([]);
@@ -57,6 +59,7 @@ export default function BillDiscussions() {
     const pausedElapsedRef = useRef(0); // Store elapsed time when paused for logging on seat change
     const memberSpokenTotalsRef = useRef({}); // Ref to track member totals synchronously (avoids React state timing issues)
     const consumedTimeRef = useRef({}); // Ref to track party consumed time synchronously
+    const snapshotCacheRef = useRef({ billId: null, etag: null, data: null }); // Last /snapshot response for ETag revalidation
     
     // Persist BD session state to sessionStorage (survives navigation)
     const persistBDSession = useCallback(() => {
@@ -184,7 +187,7 @@ export default function BillDiscussions() {
         }
         try {
             // Fetch total spoken time for ALL sessions (no date filter)
-            const response = await fetch(`http://localhost:5000/api/bill-member-totals/${billId}`);
+            const response = await conditionalFetch(`http://localhost:5000/api/bill-member-totals/${billId}`);
             const data = await response.json();
             if (data.success) {
                 console.log('BD: Raw API response for member totals:', data.data);
@@ -279,39 +282,57 @@ export default function BillDiscussions() {
 
     useEffect(() => {
         fetchBills();
-        
-        // Re-fetch bills when window regains focus or becomes visible (to catch edits made in Bill Details)
-        const handleRefresh = () => {
-            console.log('BD: Refreshing bills due to focus/visibility change');
-            fetchBills();
-            // Also refresh selected bill if it exists
-            if (selectedBillRef.current?.id) {
-                fetchMemberTotals(selectedBillRef.current.id);
+    }, []);
+
+    // The server pushes `bill_time_updated` whenever a Bill Discussion log is written,
+    // edited or deleted, or a bill's allocations/status change, so no polling is needed.
+    useEffect(() => {
+        if (!socket) return;
+
+        const handleBillTimeUpdated = (update) => {
+            const { bill, bill_id: billId } = update || {};
+            if (!bill || bill.status === 'Past') {
+                // Deleted or archived - fetchBills also clears it if it was selected
+                fetchBills();
+                return;
             }
-        };
-        
-        const handleVisibilityChange = () => {
-            if (document.visibilityState === 'visible') {
-                handleRefresh();
+            setBills(prev => prev.some(b => b.id === billId)
+                ? prev.map(b => (b.id === billId ? bill : b))
+                : [bill, ...prev]);
+
+            if (selectedBillRef.current?.id !== billId) return;
+            setSelectedBill(prev => (prev && prev.id === billId ? bill : prev));
+
+            // Server totals are authoritative once the write is committed
+            const consumed = update.consumed_time || {};
+            consumedTimeRef.current = consumed;
+            setConsumedTime(consumed);
+
+            const normalizedTotals = {};
+            for (const [seat, value] of Object.entries(update.member_totals || {})) {
+                const seatKey = normalizeSeatNo(seat);
+                normalizedTotals[seatKey] = (normalizedTotals[seatKey] || 0) + (parseInt(value, 10) || 0);
             }
+            memberSpokenTotalsRef.current = normalizedTotals;
+            setMemberSpokenTotals(normalizedTotals);
+            console.log('BD: bill_time_updated applied for bill', billId);
         };
-        
-        window.addEventListener('focus', handleRefresh);
-        document.addEventListener('visibilitychange', handleVisibilityChange);
-        
-        // Poll for bill updates every 5 seconds (to catch allocation changes made in Bill Details)
-        const pollInterval = setInterval(() => {
+
+        // Catch up on anything missed while disconnected
+        const handleReconnect = () => {
+            fetchBills();
             if (selectedBillRef.current?.id) {
-                fetchBills();
+                fetchBillSnapshot(selectedBillRef.current.id);
             }
-        }, 5000);
-        
+        };
+
+        socket.on('bill_time_updated', handleBillTimeUpdated);
+        socket.on('connect', handleReconnect);
         return () => {
-            window.removeEventListener('focus', handleRefresh);
-            document.removeEventListener('visibilitychange', handleVisibilityChange);
-            clearInterval(pollInterval);
+            socket.off('bill_time_updated', handleBillTimeUpdated);
+            socket.off('connect', handleReconnect);
         };
-    }, [fetchMemberTotals]);
+    }, [socket]);
 
     // Keep selectedBillRef in sync with selectedBill state
     useEffect(() => {
@@ -498,24 +519,20 @@ export default function BillDiscussions() {
                     console.log('BD seat change: Updated totals - member:', normalizedPrevSeat, '=', newMemberTotal, 'party:', currentParty, '=', newPartyTotal);
 
                     // Now do the API call in the background (fire-and-forget)
-                    fetch('http://localhost:5000/api/activity-log', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({
-                            activity_type: 'Bill Discussion',
-                            member_name: prevMemberRef.current.name,
-                            chairperson: chairperson || '',
-                            start_time: formatISTForMySQL(startTimeRef.current),
-                            end_time: formatISTForMySQL(endTime),
-                            duration_seconds: durationSeconds,
-                            spoken_seconds: durationSeconds,
-                            allotted_seconds: memberAllottedSeconds,
-                            bill_name: selectedBillRef.current?.bill_name || '',
-                            bill_id: selectedBillRef.current?.id || null,
-                            party: currentParty,
-                            seat_no: prevSeat,
-                            notes: 'Seat changed - timer reset'
-                        }),
+                    postActivityLog({
+                        activity_type: 'Bill Discussion',
+                        member_name: prevMemberRef.current.name,
+                        chairperson: chairperson || '',
+                        start_time: formatISTForMySQL(startTimeRef.current),
+                        end_time: formatISTForMySQL(endTime),
+                        duration_seconds: durationSeconds,
+                        spoken_seconds: durationSeconds,
+                        allotted_seconds: memberAllottedSeconds,
+                        bill_name: selectedBillRef.current?.bill_name || '',
+                        bill_id: selectedBillRef.current?.id || null,
+                        party: currentParty,
+                        seat_no: prevSeat,
+                        notes: 'Seat changed - timer reset'
                     }).then(response => response.json())
                       .then(result => {
                           console.log('BD seat change: Activity log response:', result);
@@ -719,7 +736,7 @@ export default function BillDiscussions() {
                     const memberSeat = currentMember.seat_no || currentMember.seat || '';
                     const memberAlloc = getMemberTimeAllocation(memberSeat);
                     const memberAllottedSeconds = memberAlloc?.totalSeconds || 0;
-                    const logData = JSON.stringify({
+                    beaconActivityLog({
                         activity_type: 'Bill Discussion',
                         member_name: currentMember.name,
                         chairperson: chairperson || '',
@@ -734,20 +751,6 @@ export default function BillDiscussions() {
                         seat_no: memberSeat,
                         notes: 'Page navigated away'
                     });
-                    
-                    if (navigator.sendBeacon) {
-                        navigator.sendBeacon(
-                            'http://localhost:5000/api/activity-log',
-                            new Blob([logData], { type: 'application/json' })
-                        );
-                    } else {
-                        fetch('http://localhost:5000/api/activity-log', {
-                            method: 'POST',
-                            headers: { 'Content-Type': 'application/json' },
-                            body: logData,
-                            keepalive: true
-                        }).catch(() => {});
-                    }
                 }
             }
         };
@@ -756,15 +759,15 @@ export default function BillDiscussions() {
     useEffect(() => {
         const effectiveBillId = selectedBill?.id || activeBillSession?.id;
         if (effectiveBillId) {
-            fetchConsumedTime(effectiveBillId);
+            fetchBillSnapshot(effectiveBillId);
         } else {
             setConsumedTime({});
         }
-    }, [selectedBill, activeBillSession]);
+    }, [selectedBill?.id, activeBillSession?.id]);
 
     const fetchBills = async () => {
         try {
-            const response = await fetch('http://localhost:5000/api/bill-details?status=current');
+            const response = await conditionalFetch('http://localhost:5000/api/bill-details?status=current');
             const data = await response.json();
             if (data.success) {
                 const list = data.data || [];
@@ -812,12 +815,60 @@ export default function BillDiscussions() {
         return result;
     };
 
+    // Load consumed time and member totals for a bill in one request. The snapshot is
+    // revalidated with its ETag, so an unchanged bill costs a bodyless 304.
+    const fetchBillSnapshot = async (billId) => {
+        if (!billId) return;
+        const cached = snapshotCacheRef.current;
+        try {
+            const headers = cached.billId === billId && cached.etag ? { 'If-None-Match': cached.etag } : {};
+            const response = await fetch(`http://localhost:5000/api/bills/${billId}/snapshot`, { headers });
+            let snapshot;
+            if (response.status === 304) {
+                snapshot = cached.data;
+            } else {
+                const data = await response.json();
+                if (!data.success) return;
+                snapshot = data.data;
+                snapshotCacheRef.current = { billId, etag: response.headers.get('ETag'), data: snapshot };
+            }
+            if (selectedBillRef.current && selectedBillRef.current.id !== billId) return;
+
+            // MERGE with existing ref data (higher value wins) to keep synchronous
+            // updates that may not be in the DB yet, as fetchConsumedTime does
+            const dbConsumed = { ...snapshot.consumed_time };
+            for (const [seat, seconds] of Object.entries(snapshot.member_durations || {})) {
+                dbConsumed[`member_${seat}`] = seconds;
+            }
+            const mergedConsumed = { ...consumedTimeRef.current };
+            for (const [party, dbValue] of Object.entries(dbConsumed)) {
+                mergedConsumed[party] = Math.max(mergedConsumed[party] || 0, dbValue);
+            }
+            consumedTimeRef.current = mergedConsumed;
+            setConsumedTime(mergedConsumed);
+
+            const mergedTotals = { ...memberSpokenTotalsRef.current };
+            const normalizedTotals = {};
+            for (const [seat, value] of Object.entries(snapshot.member_totals || {})) {
+                const seatKey = normalizeSeatNo(seat);
+                normalizedTotals[seatKey] = (normalizedTotals[seatKey] || 0) + (parseInt(value, 10) || 0);
+            }
+            for (const [seat, dbValue] of Object.entries(normalizedTotals)) {
+                mergedTotals[seat] = Math.max(mergedTotals[seat] || 0, dbValue);
+            }
+            memberSpokenTotalsRef.current = mergedTotals;
+            setMemberSpokenTotals(mergedTotals);
+        } catch (error) {
+            console.error('Error fetching bill snapshot:', error);
+        }
+    };
+
     const fetchConsumedTime = async (billIdOverride = null) => {
         const targetBillId = billIdOverride || selectedBill?.id || activeBillSession?.id;
         if (!targetBillId) return;
         try {
             // Fetch total consumed time across ALL days for this bill
-            const response = await fetch(`http://localhost:5000/api/bill-consumed-time/${targetBillId}`);
+            const response = await conditionalFetch(`http://localhost:5000/api/bill-consumed-time/${targetBillId}`);
             const data = await response.json();
             if (data.success) {
                 const dbData = data.data || {};
@@ -1024,24 +1075,20 @@ export default function BillDiscussions() {
             console.log('BD handleTimerEnd: currentElapsed=', currentElapsed, 'sessionStartBase=', baseSpoken, 'sessionDuration=', sessionDuration, 'durationSeconds=', durationSeconds);
 
             try {
-                await fetch('http://localhost:5000/api/activity-log', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        activity_type: 'Bill Discussion',
-                        member_name: memberName,
-                        chairperson: chairperson || '',
-                        start_time: formatISTForMySQL(startTimeRef.current),
-                        end_time: formatISTForMySQL(endTime),
-                        duration_seconds: durationSeconds,
-                        spoken_seconds: durationSeconds,
-                        allotted_seconds: memberAllottedSeconds,
-                        bill_name: selectedBill?.bill_name || '',
-                        bill_id: selectedBill?.id || null,
-                        party: currentParty,
-                        seat_no: seatForLog,
-                        notes: `Bill discussion ended - ${currentParty}`
-                    }),
+                await postActivityLog({
+                    activity_type: 'Bill Discussion',
+                    member_name: memberName,
+                    chairperson: chairperson || '',
+                    start_time: formatISTForMySQL(startTimeRef.current),
+                    end_time: formatISTForMySQL(endTime),
+                    duration_seconds: durationSeconds,
+                    spoken_seconds: durationSeconds,
+                    allotted_seconds: memberAllottedSeconds,
+                    bill_name: selectedBill?.bill_name || '',
+                    bill_id: selectedBill?.id || null,
+                    party: currentParty,
+                    seat_no: seatForLog,
+                    notes: `Bill discussion ended - ${currentParty}`
                 });
                 // Refresh consumed time after logging
                 incrementPartyConsumed(currentParty, durationSeconds);
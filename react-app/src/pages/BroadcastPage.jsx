@@ -1,6 +1,8 @@
 import { useState, useEffect, useRef } from 'react';
 import { useSearchParams } from 'react-router-dom';
 import { Maximize2 } from 'lucide-react';
+import { photoSrc } from '../utils/photos';
+import { conditionalFetch } from '../utils/conditionalFetch';
 
 const getApiBaseUrl = () => {
     if (import.meta.env.VITE_API_BASE_URL) {
@@ -186,7 +188,7 @@ export default function BroadcastPage() {
             if (receivedFromParent) return;
             
             try {
-                const response = await fetch(`${API_BASE_URL}/api/chairpersons`);
+                const response = await conditionalFetch(`${API_BASE_URL}/api/chairpersons`);
                 const data = await response.json();
                 if (data.success && data.data.length > 0) {
                     // Find selected chairperson or use the first one
@@ -700,7 +702,7 @@ const getPartyShortName = (party) => {
                 <div className="mb-10">
                     {chairpersonPhoto ? (
                         <img
-                            src={`data:image/jpeg;base64,${chairpersonPhoto}`}
+                            src={photoSrc(chairpersonPhoto, API_BASE_URL)}
                             alt={chairperson}
                             className="w-56 h-64 md:w-64 md:h-72 object-cover rounded-2xl border-4 border-[#a00000] shadow-2xl"
                         />
@@ -5,6 +5,8 @@ import Footer from '../components/Footer';
 import { useChairperson } from '../context/ChairpersonContext';
 import { Database, Upload, Save, Trash2, Edit, Search, Plus, X, Check, Users, UserCog, ChevronDown, Crown } from 'lucide-react';
 import { formatISTDateForInput } from '../utils/timezone';
+import { photoSrc } from '../utils/photos';
+import { conditionalFetch } from '../utils/conditionalFetch';
 
 export default function DatabaseEntry() {
     const navigate = useNavigate();
@@ -73,7 +75,7 @@ export default function DatabaseEntry() {
 
     const fetchAllMembers = async () => {
         try {
-            const response = await fetch('http://localhost:5000/api/members');
+            const response = await conditionalFetch('http://localhost:5000/api/members');
             const data = await response.json();
             if (data.success) {
                 setAllMembers(data.data.filter(m => m.name && m.name !== 'VACANT'));
@@ -92,7 +94,7 @@ export default function DatabaseEntry() {
     const fetchMembers = async () => {
         setLoading(true);
         try {
-            const response = await fetch('http://localhost:5000/api/members');
+            const response = await conditionalFetch('http://localhost:5000/api/members');
             const data = await response.json();
             if (data.success) {
                 setMembers(data.data);
@@ -107,7 +109,7 @@ export default function DatabaseEntry() {
     const fetchChairpersons = async () => {
         setLoading(true);
         try {
-            const response = await fetch('http://localhost:5000/api/chairpersons');
+            const response = await conditionalFetch('http://localhost:5000/api/chairpersons');
             const data = await response.json();
             if (data.success) {
                 setChairpersonsList(data.data);
@@ -302,7 +304,7 @@ export default function DatabaseEntry() {
         setShowChairForm(true);
         // Load existing photo preview if available
         if (chair.picture) {
-            setChairImagePreview(`data:image/jpeg;base64,${chair.picture}`);
+            setChairImagePreview(photoSrc(chair.picture));
         } else {
             setChairImagePreview(null);
         }
@@ -520,7 +522,7 @@ export default function DatabaseEntry() {
                                     <div className="w-24 h-32 bg-gray-200 rounded-lg overflow-hidden flex-shrink-0">
                                         {chairman.picture ? (
                                             <img 
-                                                src={`data:image/jpeg;base64,${chairman.picture}`} 
+                                                src={photoSrc(chairman.picture)} 
                                                 alt={chairman.name}
                                                 className="w-full h-full object-cover"
                                             />
@@ -557,7 +559,7 @@ export default function DatabaseEntry() {
                                     <div className="w-24 h-32 bg-gray-200 rounded-lg overflow-hidden flex-shrink-0">
                                         {deputyChairman.picture ? (
                                             <img 
-                                                src={`data:image/jpeg;base64,${deputyChairman.picture}`} 
+                                                src={photoSrc(deputyChairman.picture)} 
                                                 alt={deputyChairman.name}
                                                 className="w-full h-full object-cover"
                                             />
@@ -784,7 +786,7 @@ export default function DatabaseEntry() {
                                                     <div className="w-12 h-16 bg-gray-200 rounded overflow-hidden">
                                                         {chair.picture ? (
                                                             <img 
-                                                                src={`data:image/jpeg;base64,${chair.picture}`} 
+                                                                src={photoSrc(chair.picture)} 
                                                                 alt={chair.name}
                                                                 className="w-full h-full object-cover"
                                                             />
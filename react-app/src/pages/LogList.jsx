@@ -4,6 +4,39 @@ import Footer from '../components/Footer';
 import { ClipboardList, Calendar, Clock, User, FileText, Trash2, RefreshCw, X, Download, FileSpreadsheet, ArrowLeft, ChevronDown, ChevronUp, Edit2, Check } from 'lucide-react';
 import { useNavigate } from 'react-router-dom';
 import { formatISTDateForInput, normalizeSeatNo } from '../utils/timezone';
+import { awaitJobResult, formatJobProgress } from '../utils/jobs';
+import { conditionalFetch } from '../utils/conditionalFetch';
+
+// Open a server-rendered PDF report. The backend answers 202 with a job id while the
+// report is still rendering, so poll the job; call fallback() if server PDFs are unavailable.
+async function openServerPdf(url, fallback) {
+    const pdfWindow = window.open('', '_blank');
+    try {
+        for (let attempt = 0; attempt < 120; attempt++) {
+            const response = await fetch(url);
+            if (response.status === 202) {
+                const job = await response.json();
+                if (job.status_url) url = `http://localhost:5000${job.status_url}`;
+                const retryAfter = Number(response.headers.get('Retry-After')) || 1;
+                await new Promise(resolve => setTimeout(resolve, retryAfter * 1000));
+                continue;
+            }
+            if (!response.ok) break;
+            const blob = await response.blob();
+            const blobUrl = URL.createObjectURL(blob);
+            if (pdfWindow) {
+                pdfWindow.location.href = blobUrl;
+            } else {
+                window.open(blobUrl, '_blank');
+            }
+            return;
+        }
+    } catch (error) {
+        console.error('Error fetching PDF report:', error);
+    }
+    if (pdfWindow) pdfWindow.close();
+    fallback();
+}
 
 export default function LogList() {
     const [logs, setLogs] = useState([]);
@@ -24,7 +57,7 @@ export default function LogList() {
     const [editTimeInput, setEditTimeInput] = useState({ hours: 0, minutes: 0, seconds: 0 });
     const [editLoading, setEditLoading] = useState(false);
     const [migrationRunning, setMigrationRunning] = useState(false);
-    const [allBillDiscussionLogs, setAllBillDiscussionLogs] = useState([]); // All bill discussion logs (not date filtered)
+    const [billLogSummary, setBillLogSummary] = useState({}); // bill_id -> all-time totals (not date filtered)
     const [currentSessionBills, setCurrentSessionBills] = useState([]); // Bills in current session (Running status)
     const [billViewMode, setBillViewMode] = useState('memberDetails'); // 'memberDetails' or 'sequential'
     const navigate = useNavigate();
@@ -73,7 +106,7 @@ export default function LogList() {
 
     useEffect(() => {
         fetchBillDirectory();
-        fetchAllBillDiscussionLogs();
+        fetchBillLogSummary();
     }, []);
 
     useEffect(() => {
@@ -102,7 +135,7 @@ export default function LogList() {
 
     const fetchBillDirectory = async () => {
         try {
-            const response = await fetch('http://localhost:5000/api/bill-details');
+            const response = await conditionalFetch('http://localhost:5000/api/bill-details');
             const data = await response.json();
             if (data.success) {
                 const directory = {};
@@ -133,19 +166,21 @@ export default function LogList() {
         }
     };
     
-    // Fetch ALL bill discussion logs (not date filtered) for current session bills
-    const fetchAllBillDiscussionLogs = async () => {
+    // All-time totals per bill (speeches, speakers, time), aggregated by the backend
+    // from its rollups, so archived months count and no log rows are downloaded
+    const fetchBillLogSummary = async () => {
         try {
-            // Fetch all Bill Discussion logs without date limit
-            const response = await fetch('http://localhost:5000/api/activity-logs?activity_type=Bill%20Discussion&all=true');
+            const response = await conditionalFetch('http://localhost:5000/api/bill-log-summary');
             const data = await response.json();
             if (data.success) {
-                // Filter to only Bill Discussion logs
-                const billLogs = (data.data || []).filter(log => log.activity_type === 'Bill Discussion');
-                setAllBillDiscussionLogs(billLogs);
+                const summary = {};
+                (data.data || []).forEach(row => {
+                    summary[row.bill_id] = row;
+                });
+                setBillLogSummary(summary);
             }
         } catch (error) {
-            console.error('Error fetching all bill discussion logs:', error);
+            console.error('Error fetching bill log summary:', error);
         }
     };
 
@@ -270,14 +305,16 @@ export default function LogList() {
             const response = await fetch(`http://localhost:5000/api/activity-logs/by-bill?${params.toString()}`, {
                 method: 'DELETE'
             });
-            const data = await response.json();
+            const data = await awaitJobResult(response, (job) =>
+                setBillActionMessage({ type: 'info', text: formatJobProgress(job) })
+            );
             if (data.success) {
                 setBillActionMessage({ 
                     type: 'success', 
                     text: `Deleted ${data.deleted_count || 0} log entries for "${bill.name}".` 
                 });
                 fetchLogs();
-                fetchAllBillDiscussionLogs(); // Refresh bill discussion logs
+                fetchBillLogSummary(); // Refresh bill totals
             } else {
                 setBillActionMessage({ type: 'error', text: data.error || 'Unable to delete logs.' });
             }
@@ -337,7 +374,7 @@ export default function LogList() {
                 setBillActionMessage({ type: 'success', text: 'Speech time updated successfully.' });
                 // Refresh logs to update the UI
                 fetchLogs();
-                fetchAllBillDiscussionLogs(); // Refresh bill discussion logs
+                fetchBillLogSummary(); // Refresh bill totals
                 // If we're viewing bill details, refresh those too
                 if (selectedBill) {
                     fetchBillLogs(selectedBill);
@@ -361,11 +398,13 @@ export default function LogList() {
             const response = await fetch('http://localhost:5000/api/activity-logs/migrate-bill-ids', {
                 method: 'POST'
             });
-            const data = await response.json();
+            const data = await awaitJobResult(response, (job) =>
+                setBillActionMessage({ type: 'info', text: formatJobProgress(job) })
+            );
             if (data.success) {
                 setBillActionMessage({ type: 'success', text: data.message });
                 fetchLogs();
-                fetchAllBillDiscussionLogs(); // Refresh bill discussion logs
+                fetchBillLogSummary(); // Refresh bill totals
             } else {
                 setBillActionMessage({ type: 'error', text: data.error || 'Migration failed.' });
             }
@@ -391,11 +430,13 @@ export default function LogList() {
                     target_bill_id: targetBillId
                 })
             });
-            const data = await response.json();
+            const data = await awaitJobResult(response, (job) =>
+                setBillActionMessage({ type: 'info', text: formatJobProgress(job) })
+            );
             if (data.success) {
                 setBillActionMessage({ type: 'success', text: data.message });
                 fetchLogs();
-                fetchAllBillDiscussionLogs(); // Refresh bill discussion logs
+                fetchBillLogSummary(); // Refresh bill totals
             } else {
                 setBillActionMessage({ type: 'error', text: data.error || 'Merge failed.' });
             }
@@ -469,7 +510,7 @@ export default function LogList() {
                 // Pull latest allocations from bill details so updates reflect immediately
                 let latestBillData = null;
                 try {
-                    const billDetailsResponse = await fetch('http://localhost:5000/api/bill-details');
+                    const billDetailsResponse = await conditionalFetch('http://localhost:5000/api/bill-details');
                     const billDetailsData = await billDetailsResponse.json();
                     if (billDetailsData.success) {
                         latestBillData = (billDetailsData.data || []).find(b =>
@@ -505,60 +546,6 @@ export default function LogList() {
         }
     };
 
-    // Get unique bills from ALL Bill Discussion logs (not date filtered)
-    // Only shows bills that are in current session (Running/Active status)
-    const getUniqueBills = () => {
-        // Use ALL bill discussion logs, not date-filtered ones
-        const billLogs = allBillDiscussionLogs;
-        const billMap = {};
-        
-        // Create a set of current session bill IDs and names for quick lookup
-        const currentBillIds = new Set(currentSessionBills.map(b => b.id));
-        const currentBillNames = new Set(currentSessionBills.map(b => b.bill_name?.toLowerCase()));
-        
-        billLogs.forEach(log => {
-            // Check if this log belongs to a current session bill
-            const logBillId = log.bill_id;
-            const logBillName = (log.bill_name || '').toLowerCase();
-            
-            // Skip if bill is not in current session
-            const isCurrentSession = 
-                (logBillId && currentBillIds.has(logBillId)) || 
-                (!logBillId && currentBillNames.has(logBillName));
-            
-            if (!isCurrentSession && currentSessionBills.length > 0) {
-                return; // Skip logs for past session bills
-            }
-            
-            // Use bill_id as the key if available, otherwise fall back to bill_name
-            const key = log.bill_id ? `id_${log.bill_id}` : `name_${log.bill_name || 'Unknown Bill'}`;
-            const billName = log.bill_name || 'Unknown Bill';
-            
-            if (!billMap[key]) {
-                billMap[key] = {
-                    name: billName,
-                    bill_id: log.bill_id || null,
-                    logs: [],
-                    totalDuration: 0,
-                    oldNames: new Set() // Track if there are logs with different names
-                };
-            }
-            billMap[key].logs.push(log);
-            billMap[key].totalDuration += log.duration_seconds || 0;
-            
-            // Track different bill names under the same bill_id
-            if (log.bill_name && log.bill_name !== billMap[key].name) {
-                billMap[key].oldNames.add(log.bill_name);
-            }
-        });
-        
-        // Convert Set to Array for easier handling
-        return Object.values(billMap).map(bill => ({
-            ...bill,
-            oldNames: Array.from(bill.oldNames)
-        }));
-    };
-
     // Build aggregated party/member dataset with individual speech history and allocations
     function buildPartyData(billLogs = [], partyAllocations = [], othersTime = null) {
         const partyMap = {};
@@ -667,63 +654,33 @@ export default function LogList() {
             });
     }
 
-    // Export bill party-wise data to Excel
+    // Export bill party-wise data to Excel (generated and streamed by the backend)
     const exportBillToExcel = () => {
         if (!selectedBill) return;
-        
-        const partyData = buildPartyData(selectedBill.logs || [], selectedBill.party_allocations || [], selectedBill.others_time || null);
-        const headers = ['Party', 'S.No', 'Seat No', 'Member Name', '# Speeches', 'Aggregate Duration', 'Speech Detail', 'Speech Duration'];
-        
-        let csvContent = `Bill: ${selectedBill.name}\nDate: ${dateFilter}\n\n`;
-        csvContent += headers.join(',') + '\n';
-        
-        partyData.forEach(party => {
-            party.members.forEach((member, index) => {
-                const row = [
-                    index === 0 ? `"${party.party}"` : '',
-                    index + 1,
-                    `"${member.seat_no || '-'}"`,
-                    `"${member.member_name || '-'}"`,
-                    member.speeches.length,
-                    `"${formatDuration(member.totalDuration)}"`,
-                    '',
-                    ''
-                ];
-                csvContent += row.join(',') + '\n';
-                member.speeches.forEach((speech, speechIndex) => {
-                    const speechRow = [
-                        '',
-                        '',
-                        '',
-                        '',
-                        '',
-                        '',
-                        `"Speech ${speechIndex + 1} - ${formatDateTimeReadable(speech.start_time)}"`,
-                        `"${formatDuration(speech.duration_seconds)}"`
-                    ];
-                    csvContent += speechRow.join(',') + '\n';
-                });
-            });
-            // Party total row
-            const totalRow = ['', '', '', `"${party.party} Total:"`, '', `"${formatDuration(party.totalDuration)}"`, '', ''];
-            csvContent += totalRow.join(',') + '\n';
-            csvContent += '\n';
-        });
-        
-        // Grand total
-        const grandTotal = partyData.reduce((sum, p) => sum + p.totalDuration, 0);
-        csvContent += `\n,,,"Grand Total:","${formatDuration(grandTotal)}"\n`;
-        
-        const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
+        const billId = selectedBill.bill_id
+            || billDirectory[(selectedBill.name || '').trim().toLowerCase()]?.[0]?.id;
         const link = document.createElement('a');
-        link.href = URL.createObjectURL(blob);
-        link.download = `Bill_Discussion_${selectedBill.name.replace(/[^a-zA-Z0-9]/g, '_')}_${dateFilter}.csv`;
+        // Logs not linked to a bill record yet are exported by name
+        link.href = billId
+            ? `http://localhost:5000/api/export/bill/${billId}?format=xlsx`
+            : `http://localhost:5000/api/export/bill?name=${encodeURIComponent(selectedBill.name || '')}&format=xlsx`;
         link.click();
     };
 
-    // Export bill data to PDF (respects current view)
+    // Export bill data to PDF; the party-wise view is rendered and cached by the backend
     const exportBillToPDF = () => {
         if (!selectedBill) return;
+        const billId = selectedBill.bill_id
+            || billDirectory[(selectedBill.name || '').trim().toLowerCase()]?.[0]?.id;
+        if (billId && billViewMode === 'memberDetails') {
+            openServerPdf(`http://localhost:5000/api/reports/bill/${billId}.pdf`, printBillReport);
+        } else {
+            printBillReport();
+        }
+    };
+
+    // Print the bill report in the browser (sequential view, or when server PDFs are unavailable)
+    const printBillReport = () => {
         
         const partyData = buildPartyData(selectedBill.logs || [], selectedBill.party_allocations || [], selectedBill.others_time || null);
         const grandTotal = partyData.reduce((sum, p) => sum + p.totalDuration, 0);
@@ -831,69 +788,28 @@ export default function LogList() {
     const exportToExcel = () => {
         if (!selectedCategory) return;
         
-        const categoryLogs = getLogsByCategory(selectedCategory.type);
-        let headers;
-        if (selectedCategory.type === 'Member Speaking') {
-            headers = ['S.No', 'Time', 'Member Name', 'Heading', 'Chairperson', 'Duration', 'Notes'];
-        } else if (selectedCategory.type === 'Zero Hour') {
-            headers = ['S.No', 'Time', 'Member Name', 'Party', 'Chairperson', 'Allotted', 'Duration', 'Notes'];
-        } else {
-            headers = ['S.No', 'Time', 'Member Name', 'Chairperson', 'Duration', 'Notes'];
+        // The backend streams the XLSX straight from the database for the selected date
+        const category = selectedCategory.type.toLowerCase().replace(/\s+/g, '-');
+        const params = new URLSearchParams({ format: 'xlsx' });
+        if (dateFilter) {
+            params.set('from', dateFilter);
+            params.set('to', dateFilter);
         }
-        
-        let csvContent = headers.join(',') + '\n';
-        
-        categoryLogs.forEach((log, index) => {
-            let row;
-            if (selectedCategory.type === 'Member Speaking') {
-                row = [
-                    index + 1,
-                    `"${formatTime(log.start_time)}"`,
-                    `"${log.member_name || '-'}"`,
-                    `"${log.heading || '-'}"`,
-                    `"${log.chairperson || '-'}"`,
-                    `"${formatDuration(log.duration_seconds)}"`,
-                    `"${log.notes || '-'}"`
-                ];
-            } else if (selectedCategory.type === 'Zero Hour') {
-                row = [
-                    index + 1,
-                    `"${formatTime(log.start_time)}"`,
-                    `"${log.member_name || '-'}"`,
-                    `"${log.party || '-'}"`,
-                    `"${log.chairperson || '-'}"`,
-                    `"${formatDuration(log.allotted_seconds || 180)}"`,
-                    `"${formatDuration(log.duration_seconds)}"`,
-                    `"${log.notes || '-'}"`
-                ];
-            } else {
-                row = [
-                    index + 1,
-                    `"${formatTime(log.start_time)}"`,
-                    `"${log.member_name || '-'}"`,
-                    `"${log.chairperson || '-'}"`,
-                    `"${formatDuration(log.duration_seconds)}"`,
-                    `"${log.notes || '-'}"`
-                ];
-            }
-            csvContent += row.join(',') + '\n';
-        });
-        
-        // Add total row
-        const totalColSpan = selectedCategory.type === 'Zero Hour' ? 6 : (selectedCategory.type === 'Member Speaking' ? 5 : 4);
-        const emptyColsForTotal = ','.repeat(totalColSpan - 1);
-        csvContent += `\n${emptyColsForTotal}Total:,"${formatDuration(getTotalDuration(selectedCategory.type))}",\n`;
-        
-        const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
         const link = document.createElement('a');
-        link.href = URL.createObjectURL(blob);
-        link.download = `${selectedCategory.type.replace(' ', '_')}_${dateFilter}.csv`;
+        link.href = `http://localhost:5000/api/export/logs/${category}?${params.toString()}`;
         link.click();
     };
 
-    // Export to PDF (opens print dialog)
+    // Export to PDF (rendered and cached by the backend for the selected date)
     const exportToPDF = () => {
         if (!selectedCategory) return;
+        const category = selectedCategory.type.toLowerCase().replace(/\s+/g, '-');
+        const query = dateFilter ? `?date=${dateFilter}` : '';
+        openServerPdf(`http://localhost:5000/api/reports/category/${category}.pdf${query}`, printCategoryReport);
+    };
+
+    // Print the category log in the browser when server PDFs are unavailable
+    const printCategoryReport = () => {
         
         const categoryLogs = getLogsByCategory(selectedCategory.type);
         const totalDuration = getTotalDuration(selectedCategory.type);
@@ -1019,9 +935,9 @@ export default function LogList() {
                             if (category.type === 'Bill Discussion') {
                                 // Use currentSessionBills for count (ALL bills, not just ones with logs)
                                 const billCount = currentSessionBills.length;
-                                // Calculate total time from bills that have logs
-                                const uniqueBills = getUniqueBills();
-                                const totalBillTime = uniqueBills.reduce((sum, bill) => sum + (bill.totalDuration || 0), 0);
+                                // Total time across the current bills (all dates)
+                                const totalBillTime = currentSessionBills.reduce(
+                                    (sum, bill) => sum + (billLogSummary[bill.id]?.total_seconds || 0), 0);
                                 
                                 return (
                                     <div
@@ -1252,7 +1168,9 @@ export default function LogList() {
                                     className={`px-4 py-2 rounded-xl text-sm font-semibold ${
                                         billActionMessage.type === 'success'
                                             ? 'bg-green-100 text-green-800'
-                                            : 'bg-red-100 text-red-700'
+                                            : billActionMessage.type === 'info'
+                                                ? 'bg-blue-100 text-blue-800'
+                                                : 'bg-red-100 text-red-700'
                                     }`}
                                 >
                                     {billActionMessage.text}
@@ -1266,15 +1184,11 @@ export default function LogList() {
                                 <div className="space-y-3">
                                     {/* Show ALL current session bills, merging with log data if available */}
                                     {currentSessionBills.map((sessionBill, index) => {
-                                        // Find matching log data for this bill
-                                        const billsWithLogs = getUniqueBills();
-                                        const logData = billsWithLogs.find(b => 
-                                            b.bill_id === sessionBill.id || 
-                                            b.name?.toLowerCase() === sessionBill.bill_name?.toLowerCase()
-                                        );
-                                        const totalDuration = logData?.totalDuration || 0;
-                                        const logs = logData?.logs || [];
-                                        const uniqueMembers = new Set(logs.map(l => l.seat_no || l.member_name)).size;
+                                        // All-time totals for this bill
+                                        const summary = billLogSummary[sessionBill.id];
+                                        const totalDuration = summary?.total_seconds || 0;
+                                        const speechCount = summary?.speech_count || 0;
+                                        const uniqueMembers = summary?.speaker_count || 0;
                                         const actionBusy = billActionLoadingId === sessionBill.id;
                                         
                                         return (
@@ -1300,7 +1214,7 @@ export default function LogList() {
                                                         <div>
                                                             <h4 className={`font-bold ${totalDuration > 0 ? 'text-green-800' : 'text-gray-600'}`}>{sessionBill.bill_name}</h4>
                                                             <p className="text-sm text-gray-600">
-                                                                {uniqueMembers} unique members • {logs.length} speeches
+                                                                {uniqueMembers} unique members • {speechCount} speeches
                                                             </p>
                                                         </div>
                                                     </div>
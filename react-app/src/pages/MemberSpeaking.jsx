@@ -9,6 +9,7 @@ import { useChairperson } from '../context/ChairpersonContext';
 import { useBroadcast } from '../context/BroadcastContext';
 import { Mic } from 'lucide-react';
 import { getISTNow, formatISTForMySQL, normalizeSeatNo, seatsEqual } from '../utils/timezone';
+import { postActivityLog, beaconActivityLog } from '../utils/activityLog';
 
 const MS_TIMER_SNAPSHOT_KEY = 'ms_timer_snapshot';
 const MS_HEADINGS_KEY = 'ms_headings';
@@ -294,23 +295,19 @@ export default function MemberSpeaking() {
                         }
 
             try {
-                await fetch('http://localhost:5000/api/activity-log', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        activity_type: 'Member Speaking',
-                                    member_name: prevMemberRef.current.name,
-                                    chairperson: chairperson || '',
-                                    start_time: formatISTForMySQL(startTimeRef.current),
-                                    end_time: formatISTForMySQL(endTime),
-                                    duration_seconds: durationSeconds,
-                                    spoken_seconds: durationSeconds,
-                                    seat_no: prevMemberRef.current.seat_no || prevSeatRef.current || '',
-                                    party: prevMemberRef.current.party || '',
-                                    heading: selectedHeading || '',
-                                    notes: 'Seat changed - timer reset'
-                                }),
-                            });
+                await postActivityLog({
+                    activity_type: 'Member Speaking',
+                    member_name: prevMemberRef.current.name,
+                    chairperson: chairperson || '',
+                    start_time: formatISTForMySQL(startTimeRef.current),
+                    end_time: formatISTForMySQL(endTime),
+                    duration_seconds: durationSeconds,
+                    spoken_seconds: durationSeconds,
+                    seat_no: prevMemberRef.current.seat_no || prevSeatRef.current || '',
+                    party: prevMemberRef.current.party || '',
+                    heading: selectedHeading || '',
+                    notes: 'Seat changed - timer reset'
+                });
                             console.log('MS: Logged activity for', prevMemberRef.current.name, 'party:', prevMemberRef.current.party, 'duration:', durationSeconds);
                         } catch (error) {
                             console.error('MS: Error logging activity:', error);
@@ -407,7 +404,7 @@ export default function MemberSpeaking() {
                     const endTime = getISTNow();
                     const durationSeconds = Math.floor((endTime - startTimeRef.current) / 1000);
                     
-                    const logData = JSON.stringify({
+                    beaconActivityLog({
                         activity_type: 'Member Speaking',
                         member_name: currentMember.name,
                         chairperson: chairperson || '',
@@ -420,20 +417,6 @@ export default function MemberSpeaking() {
                         heading: selectedHeading || '',
                         notes: 'Page navigated away'
                     });
-                    
-                    if (navigator.sendBeacon) {
-                        navigator.sendBeacon(
-                            'http://localhost:5000/api/activity-log',
-                            new Blob([logData], { type: 'application/json' })
-                        );
-                    } else {
-                        fetch('http://localhost:5000/api/activity-log', {
-                            method: 'POST',
-                            headers: { 'Content-Type': 'application/json' },
-                            body: logData,
-                            keepalive: true
-                        }).catch(() => {});
-                    }
                 }
             }
         };
@@ -495,22 +478,18 @@ export default function MemberSpeaking() {
             const durationSeconds = elapsedSeconds > 0 ? elapsedSeconds : Math.floor((endTime - startTimeRef.current) / 1000);
 
             try {
-                await fetch('http://localhost:5000/api/activity-log', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        activity_type: 'Member Speaking',
-                        member_name: memberName,
-                        chairperson: chairperson || '',
-                        start_time: formatISTForMySQL(startTimeRef.current),
-                        end_time: formatISTForMySQL(endTime),
-                        duration_seconds: durationSeconds,
-                        spoken_seconds: durationSeconds,
-                        seat_no: selectedSeat || prevMemberRef.current?.seat_no || '',
-                        party: memberData?.party || prevMemberRef.current?.party || '',
-                        heading: selectedHeading || '',
-                        notes: 'Speaking session ended'
-                    }),
+                await postActivityLog({
+                    activity_type: 'Member Speaking',
+                    member_name: memberName,
+                    chairperson: chairperson || '',
+                    start_time: formatISTForMySQL(startTimeRef.current),
+                    end_time: formatISTForMySQL(endTime),
+                    duration_seconds: durationSeconds,
+                    spoken_seconds: durationSeconds,
+                    seat_no: selectedSeat || prevMemberRef.current?.seat_no || '',
+                    party: memberData?.party || prevMemberRef.current?.party || '',
+                    heading: selectedHeading || '',
+                    notes: 'Speaking session ended'
                 });
             } catch (error) {
                 console.error('Error logging activity:', error);
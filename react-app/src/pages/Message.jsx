@@ -5,6 +5,7 @@ import Footer from '../components/Footer';
 import { useBroadcast } from '../context/BroadcastContext';
 import { useSocket } from '../context/SocketContext';
 import { Heart, Cake, Plus, Trash2, Edit2, Play, Square, ChevronLeft, ChevronRight, Image } from 'lucide-react';
+import { conditionalFetch } from '../utils/conditionalFetch';
 
 const STORAGE_KEY_OBITUARY = 'parliament_obituary_entries';
 const STORAGE_KEY_BIRTHDAY = 'parliament_birthday_entries';
@@ -169,7 +170,7 @@ export default function Message() {
             return;
         }
         try {
-            const response = await fetch(`http://localhost:5000/api/member/${seatNo}`);
+            const response = await conditionalFetch(`http://localhost:5000/api/member/${seatNo}`);
             const data = await response.json();
             if (data.success && data.data) {
                 setBirthdayMemberData(data.data);
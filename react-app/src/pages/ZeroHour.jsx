@@ -9,6 +9,7 @@ import { useChairperson } from '../context/ChairpersonContext';
 import { useBroadcast } from '../context/BroadcastContext';
 import { Clock } from 'lucide-react';
 import { getISTNow, formatISTForMySQL, normalizeSeatNo, seatsEqual } from '../utils/timezone';
+import { postActivityLog, beaconActivityLog } from '../utils/activityLog';
 
 const ZH_TIMER_SNAPSHOT_KEY = 'zh_timer_snapshot';
 const ZH_TIMER_DURATION_KEY = 'zh_timer_duration';
@@ -316,22 +317,18 @@ export default function ZeroHour() {
                         }
 
             try {
-                await fetch('http://localhost:5000/api/activity-log', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        activity_type: 'Zero Hour',
-                                    member_name: prevMemberRef.current.name,
-                        chairperson: chairperson || '',
-                                    start_time: formatISTForMySQL(startTimeRef.current),
-                                    end_time: formatISTForMySQL(endTime),
-                        duration_seconds: durationSeconds,
-                                    allotted_seconds: initialTimeSeconds,
-                                    spoken_seconds: durationSeconds,
-                                    seat_no: prevMemberRef.current.seat_no || prevSeatNormalized || '',
-                                    party: prevMemberRef.current.party || '',
-                                    notes: 'Seat changed while running - timer reset'
-                    }),
+                await postActivityLog({
+                    activity_type: 'Zero Hour',
+                    member_name: prevMemberRef.current.name,
+                    chairperson: chairperson || '',
+                    start_time: formatISTForMySQL(startTimeRef.current),
+                    end_time: formatISTForMySQL(endTime),
+                    duration_seconds: durationSeconds,
+                    allotted_seconds: initialTimeSeconds,
+                    spoken_seconds: durationSeconds,
+                    seat_no: prevMemberRef.current.seat_no || prevSeatNormalized || '',
+                    party: prevMemberRef.current.party || '',
+                    notes: 'Seat changed while running - timer reset'
                 });
                             console.log('ZH: Logged activity for', prevMemberRef.current.name, 'party:', prevMemberRef.current.party, 'duration:', durationSeconds);
             } catch (error) {
@@ -570,7 +567,7 @@ export default function ZeroHour() {
                     const endTime = getISTNow();
                     const durationSeconds = Math.floor((endTime - startTimeRef.current) / 1000);
                     
-                    const logData = JSON.stringify({
+                    beaconActivityLog({
                         activity_type: 'Zero Hour',
                         member_name: currentMember.name,
                         chairperson: chairperson || '',
@@ -583,20 +580,6 @@ export default function ZeroHour() {
                         party: currentMember.party || '',
                         notes: 'Page navigated away'
                     });
-                    
-                    if (navigator.sendBeacon) {
-                        navigator.sendBeacon(
-                            'http://localhost:5000/api/activity-log',
-                            new Blob([logData], { type: 'application/json' })
-                        );
-                    } else {
-                        fetch('http://localhost:5000/api/activity-log', {
-                            method: 'POST',
-                            headers: { 'Content-Type': 'application/json' },
-                            body: logData,
-                            keepalive: true
-                        }).catch(() => {});
-                    }
                 }
             }
         };
@@ -705,22 +688,18 @@ export default function ZeroHour() {
             const durationSeconds = Math.max(timerTracked, actualDuration, 1);
 
             try {
-                await fetch('http://localhost:5000/api/activity-log', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        activity_type: 'Zero Hour',
-                        member_name: memberName,
-                        chairperson: chairperson || '',
-                        start_time: formatISTForMySQL(startTimeRef.current),
-                        end_time: formatISTForMySQL(endTime),
-                        duration_seconds: durationSeconds,
-                        allotted_seconds: initialTimeSeconds,
-                        spoken_seconds: durationSeconds,
-                        seat_no: selectedSeat || prevMemberRef.current?.seat_no || '',
-                        party: memberData?.party || prevMemberRef.current?.party || '',
-                        notes: 'Timer ended'
-                    }),
+                await postActivityLog({
+                    activity_type: 'Zero Hour',
+                    member_name: memberName,
+                    chairperson: chairperson || '',
+                    start_time: formatISTForMySQL(startTimeRef.current),
+                    end_time: formatISTForMySQL(endTime),
+                    duration_seconds: durationSeconds,
+                    allotted_seconds: initialTimeSeconds,
+                    spoken_seconds: durationSeconds,
+                    seat_no: selectedSeat || prevMemberRef.current?.seat_no || '',
+                    party: memberData?.party || prevMemberRef.current?.party || '',
+                    notes: 'Timer ended'
                 });
                 console.log('ZH: Logged current member', memberName, 'party:', memberData?.party, 'duration:', durationSeconds);
             } catch (error) {
@@ -739,22 +718,18 @@ export default function ZeroHour() {
             const stored = seatPausedTimesRef.current[storedSeat];
             if (stored && stored.member && stored.member.name && stored.member.name.trim() !== '') {
                 try {
-                    await fetch('http://localhost:5000/api/activity-log', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({
-                            activity_type: 'Zero Hour',
-                            member_name: stored.member.name,
-                            chairperson: chairperson || '',
-                            start_time: stored.startTime ? formatISTForMySQL(new Date(stored.startTime)) : formatISTForMySQL(endTime),
-                            end_time: formatISTForMySQL(endTime),
-                            duration_seconds: stored.elapsed,
-                            allotted_seconds: initialTimeSeconds,
-                            spoken_seconds: stored.elapsed,
-                            seat_no: stored.member.seat_no || storedSeat || '',
-                            party: stored.member.party || '',
-                            notes: 'Paused timer ended - END pressed'
-                        }),
+                    await postActivityLog({
+                        activity_type: 'Zero Hour',
+                        member_name: stored.member.name,
+                        chairperson: chairperson || '',
+                        start_time: stored.startTime ? formatISTForMySQL(new Date(stored.startTime)) : formatISTForMySQL(endTime),
+                        end_time: formatISTForMySQL(endTime),
+                        duration_seconds: stored.elapsed,
+                        allotted_seconds: initialTimeSeconds,
+                        spoken_seconds: stored.elapsed,
+                        seat_no: stored.member.seat_no || storedSeat || '',
+                        party: stored.member.party || '',
+                        notes: 'Paused timer ended - END pressed'
                     });
                     console.log('ZH: Logged stored paused member', stored.member.name, 'party:', stored.member.party, 'duration:', stored.elapsed);
                 } catch (error) {
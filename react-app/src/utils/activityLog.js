@@ -0,0 +1,131 @@
+/**
+ * Activity log submission with idempotency keys.
+ *
+ * Every entry is sent with a client_key (UUID). The key is derived from the
+ * speech itself (activity type, start time and member), so the seat-change,
+ * timer-end and page-unload handlers for the same speech - and any retries
+ * of a failed request - are stored as one row by the backend. Keys the server
+ * has not answered yet are also kept in sessionStorage, so a reload that sends
+ * the same speech again (e.g. a restored session) reuses its key.
+ */
+
+const ACTIVITY_LOG_URL = 'http://localhost:5000/api/activity-log';
+const RETRY_DELAYS_MS = [500, 2000, 5000];
+const MAX_REMEMBERED_KEYS = 200;
+const PENDING_KEYS_STORAGE_KEY = 'activityLogPendingKeys';
+
+const keysBySpeech = new Map(loadPendingKeys());
+
+// [speech, key] pairs not yet confirmed by the server, oldest first
+function loadPendingKeys() {
+    try {
+        const saved = JSON.parse(sessionStorage.getItem(PENDING_KEYS_STORAGE_KEY) || '[]');
+        return Array.isArray(saved) ? saved : [];
+    } catch (e) {
+        return [];
+    }
+}
+
+function savePendingKeys(pairs) {
+    try {
+        sessionStorage.setItem(PENDING_KEYS_STORAGE_KEY, JSON.stringify(pairs.slice(-MAX_REMEMBERED_KEYS)));
+    } catch (e) {
+        console.warn('Failed to persist activity log keys', e);
+    }
+}
+
+function rememberPendingKey(speech, key) {
+    savePendingKeys([...loadPendingKeys().filter(([s]) => s !== speech), [speech, key]]);
+}
+
+// The server has answered for this key; keep it in memory for later handlers of the same speech
+function forgetPendingKey(key) {
+    const pairs = loadPendingKeys();
+    const remaining = pairs.filter(([, k]) => k !== key);
+    if (remaining.length !== pairs.length) savePendingKeys(remaining);
+}
+
+function speechOf(entry) {
+    return `${entry.activity_type}|${entry.start_time}|${entry.member_name || ''}`;
+}
+
+/**
+ * Generate a random UUID (v4)
+ * @returns {string}
+ */
+export function newClientKey() {
+    if (typeof crypto !== 'undefined' && crypto.randomUUID) {
+        return crypto.randomUUID();
+    }
+    return 'xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx'.replace(/[xy]/g, (c) => {
+        const r = (Math.random() * 16) | 0;
+        return (c === 'x' ? r : (r & 0x3) | 0x8).toString(16);
+    });
+}
+
+/**
+ * Return the entry with a client_key, reusing the key already given to the same speech
+ * @param {Object} entry - Activity log fields as sent to /api/activity-log
+ * @returns {Object}
+ */
+export function withClientKey(entry) {
+    if (entry.client_key) return entry;
+    const speech = speechOf(entry);
+    let key = keysBySpeech.get(speech);
+    if (!key) {
+        key = newClientKey();
+        keysBySpeech.set(speech, key);
+        if (keysBySpeech.size > MAX_REMEMBERED_KEYS) {
+            keysBySpeech.delete(keysBySpeech.keys().next().value);
+        }
+    }
+    rememberPendingKey(speech, key);
+    return { ...entry, client_key: key };
+}
+
+/**
+ * POST an activity log, retrying network errors and 5xx responses with the same key
+ * @param {Object} entry - Activity log fields
+ * @returns {Promise<Response>}
+ */
+export async function postActivityLog(entry) {
+    const keyed = withClientKey(entry);
+    const body = JSON.stringify(keyed);
+    for (let attempt = 0; ; attempt++) {
+        try {
+            const response = await fetch(ACTIVITY_LOG_URL, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body
+            });
+            if (response.status < 500) {
+                // Stored (or rejected as invalid): nothing left to retry after a reload
+                forgetPendingKey(keyed.client_key);
+                return response;
+            }
+            if (attempt >= RETRY_DELAYS_MS.length) {
+                return response;
+            }
+        } catch (error) {
+            if (attempt >= RETRY_DELAYS_MS.length) throw error;
+        }
+        await new Promise((resolve) => setTimeout(resolve, RETRY_DELAYS_MS[attempt]));
+    }
+}
+
+/**
+ * Send an activity log while the page is unloading (sendBeacon, else keepalive fetch)
+ * @param {Object} entry - Activity log fields
+ */
+export function beaconActivityLog(entry) {
+    const body = JSON.stringify(withClientKey(entry));
+    if (navigator.sendBeacon && navigator.sendBeacon(ACTIVITY_LOG_URL, new Blob([body], { type: 'application/json' }))) {
+        return;
+    }
+    fetch(ACTIVITY_LOG_URL, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body,
+        keepalive: true
+    }).catch(() => {});
+}
@@ -0,0 +1,60 @@
+/**
+ * GET requests revalidated with ETags.
+ *
+ * The backend tags read APIs (members, chairpersons, bill details, consumed
+ * time, member totals, logs) with an ETag and answers 304 when nothing
+ * changed. conditionalFetch() remembers the last body per URL, sends
+ * If-None-Match, and turns a 304 back into a 200 Response with the
+ * remembered body, so callers keep using response.ok / response.json().
+ */
+
+const MAX_CACHED_URLS = 100;
+
+const cachedBodies = new Map();
+
+/**
+ * fetch() for GET requests that reuses the last body when the server answers 304
+ * @param {string} url - Request URL
+ * @param {Object} options - fetch options (GET only; other methods go straight to fetch)
+ * @returns {Promise<Response>}
+ */
+export async function conditionalFetch(url, options = {}) {
+    const method = (options.method || 'GET').toUpperCase();
+    if (method !== 'GET') {
+        return fetch(url, options);
+    }
+
+    const cached = cachedBodies.get(url);
+    const headers = new Headers(options.headers || {});
+    if (cached) {
+        headers.set('If-None-Match', cached.etag);
+    }
+    // no-store: the browser cache would otherwise turn 304s into 200s and hide them from us
+    const response = await fetch(url, { ...options, headers, cache: 'no-store' });
+
+    if (response.status === 304 && cached) {
+        cachedBodies.delete(url);
+        cachedBodies.set(url, cached);
+        return new Response(cached.body, {
+            status: 200,
+            headers: { 'Content-Type': cached.contentType, ETag: cached.etag }
+        });
+    }
+
+    const etag = response.headers.get('ETag');
+    if (response.ok && etag) {
+        const body = await response.clone().text();
+        cachedBodies.delete(url);
+        cachedBodies.set(url, {
+            etag,
+            body,
+            contentType: response.headers.get('Content-Type') || 'application/json'
+        });
+        if (cachedBodies.size > MAX_CACHED_URLS) {
+            cachedBodies.delete(cachedBodies.keys().next().value);
+        }
+    } else if (!response.ok) {
+        cachedBodies.delete(url);
+    }
+    return response;
+}
@@ -0,0 +1,49 @@
+/**
+ * Helpers for maintenance endpoints that run as background jobs.
+ * They answer with the job's result when it finishes quickly, or with
+ * 202 and a job_id to poll at /api/jobs/<job_id>.
+ */
+
+const API_BASE = 'http://localhost:5000';
+const POLL_INTERVAL_MS = 1000;
+
+/**
+ * Resolve a maintenance endpoint response to the job's final result
+ * @param {Response} response - fetch() response from a job-backed endpoint
+ * @param {Function} [onProgress] - called with the job status while it runs
+ * @returns {Promise<Object>} { success, ...result } or { success: false, error }
+ */
+export async function awaitJobResult(response, onProgress) {
+    const data = await response.json();
+    if (response.status !== 202 || !data.job_id) {
+        return data;
+    }
+    for (;;) {
+        await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+        const statusResponse = await fetch(`${API_BASE}/api/jobs/${data.job_id}`);
+        const status = await statusResponse.json();
+        if (!status.success) {
+            return status;
+        }
+        const job = status.data;
+        if (job.status === 'succeeded') {
+            return { success: true, job_id: job.job_id, ...(job.result || {}) };
+        }
+        if (job.status === 'failed' || job.status === 'cancelled') {
+            return { success: false, job_id: job.job_id, error: job.error || job.message };
+        }
+        if (onProgress) onProgress(job);
+    }
+}
+
+/**
+ * Human-readable progress line for a running job
+ * @param {Object} job - job status from /api/jobs/<id>
+ * @returns {string}
+ */
+export function formatJobProgress(job) {
+    if (job.total) {
+        return `${job.progress} of ${job.total} log entries processed...`;
+    }
+    return job.message || 'Working...';
+}
@@ -0,0 +1,22 @@
+/**
+ * Image sources for photos returned by the API.
+ *
+ * Chairperson photos come from /api/chairpersons as URLs
+ * (/api/chairperson/<id>/photo?v=<hash>); member photos and older saved
+ * selections are still base64 JPEG strings.
+ */
+
+const API_BASE = 'http://localhost:5000';
+
+/**
+ * Build an <img> src from a photo URL or a base64 string
+ * @param {string|null} photo - URL path, absolute URL or base64 JPEG data
+ * @param {string} apiBase - Backend origin for URL paths
+ * @returns {string|null}
+ */
+export function photoSrc(photo, apiBase = API_BASE) {
+    if (!photo) return null;
+    if (photo.startsWith('/')) return `${apiBase}${photo}`;
+    if (/^(https?:|data:|blob:)/.test(photo)) return photo;
+    return `data:image/jpeg;base64,${photo}`;
+}
@@ -0,0 +1,325 @@
+"""
+Bill Consumed-Time Benchmark
+Compares three ways of computing a bill's consumed time per party and per
+member on a synthetic multi-year activity log:
+
+  loop     the original endpoint: fetch every Bill Discussion row for the
+           bill and map parties to allocations case-insensitively in Python
+  groupby  one GROUP BY over activity_logs on the normalized party_key,
+           LEFT JOINed to bill_party_allocations
+  rollup   the same join over the bill_party_time / bill_seat_time rollups
+           the web app maintains (what /api/bill-consumed-time now runs)
+
+Runs in a scratch database (default <DB_NAME>_bench) which is dropped
+afterwards unless --keep is given. All three results are checked for
+equality before timings are reported.
+
+Example:
+  python bench_bill_consumed_time.py --years 5 --speeches-per-sitting 80 --repeat 50
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+import mysql.connector
+from dotenv import load_dotenv
+
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+DB_CONFIG = {
+    'host': os.getenv('DB_HOST', '127.0.0.1'),
+    'user': os.getenv('DB_USER', 'root'),
+    'password': os.getenv('DB_PASSWORD', ''),
+}
+
+PARTIES = ['BJP', 'INC', 'AITC', 'DMK', 'AAP', 'YSRCP', 'BJD', 'RJD', 'CPI(M)', 'SP',
+           'JD(U)', 'NCP', 'SS', 'BRS', 'AIADMK', 'IND', 'NOMINATED']
+PARTY_KEY_SQL = "LOWER(TRIM(COALESCE(party, '')))"
+
+
+def create_schema(cursor):
+    cursor.execute(f"""
+        CREATE TABLE activity_logs (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            activity_type VARCHAR(50) NOT NULL,
+            member_name VARCHAR(255),
+            start_time DATETIME NOT NULL,
+            duration_seconds INT DEFAULT 0,
+            spoken_seconds INT DEFAULT 0,
+            bill_name VARCHAR(255),
+            bill_id INT,
+            party VARCHAR(100),
+            seat_no VARCHAR(20),
+            party_key VARCHAR(100) AS ({PARTY_KEY_SQL}) STORED,
+            INDEX idx_activity_bill_party (activity_type, bill_id, party_key)
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE bill_details (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            bill_name VARCHAR(500) NOT NULL,
+            party_allocations JSON
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE bill_party_allocations (
+            bill_id INT NOT NULL,
+            party_key VARCHAR(100) NOT NULL,
+            party VARCHAR(100) NOT NULL,
+            allotted_seconds INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (bill_id, party_key)
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE bill_party_time (
+            bill_id INT NOT NULL,
+            party_key VARCHAR(100) NOT NULL,
+            log_date DATE NOT NULL,
+            duration_seconds BIGINT NOT NULL DEFAULT 0,
+            speech_count INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (bill_id, party_key, log_date)
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE bill_seat_time (
+            bill_id INT NOT NULL,
+            seat_no VARCHAR(20) NOT NULL,
+            log_date DATE NOT NULL,
+            duration_seconds BIGINT NOT NULL DEFAULT 0,
+            spoken_seconds BIGINT NOT NULL DEFAULT 0,
+            speech_count INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (bill_id, seat_no, log_date)
+        )
+    """)
+
+
+def generate_data(connection, args, rng):
+    """Insert bills with allocations and a multi-year log of speeches.
+    Party spellings vary in case/whitespace like hand-entered data does."""
+    import json
+    cursor = connection.cursor()
+    seat_party = {seat: rng.choice(PARTIES) for seat in range(1, 246)}
+    bills = []
+    for index in range(args.bills):
+        allocated = rng.sample(PARTIES, rng.randint(4, 10))
+        allocations = [{'party': p, 'hours': rng.randint(0, 3), 'minutes': rng.choice([0, 15, 30, 45])}
+                       for p in allocated]
+        cursor.execute("INSERT INTO bill_details (bill_name, party_allocations) VALUES (%s, %s)",
+                       (f"Synthetic Bill {index + 1}", json.dumps(allocations)))
+        bill_id = cursor.lastrowid
+        bills.append((bill_id, f"Synthetic Bill {index + 1}"))
+        cursor.executemany("""
+            INSERT INTO bill_party_allocations (bill_id, party_key, party, allotted_seconds)
+            VALUES (%s, %s, %s, %s)
+        """, [(bill_id, a['party'].strip().lower(), a['party'], a['hours'] * 3600 + a['minutes'] * 60)
+              for a in allocations])
+
+    start_day = datetime(2026, 1, 1) - timedelta(days=365 * args.years)
+    sittings = args.years * args.sittings_per_year
+    batch = []
+    total = 0
+    for sitting in range(sittings):
+        day = start_day + timedelta(days=int(sitting * 365 / args.sittings_per_year))
+        # A sitting discusses a handful of bills; older ones keep collecting speeches
+        day_bills = rng.sample(bills, min(3, len(bills)))
+        clock = day.replace(hour=11)
+        for _ in range(args.speeches_per_sitting):
+            bill_id, bill_name = rng.choice(day_bills)
+            seat = rng.randint(1, 245)
+            party = seat_party[seat]
+            party = rng.choice([party, party.lower(), f" {party} ", party.title()]) if rng.random() < 0.2 else party
+            if rng.random() < 0.02:
+                party = ''
+            duration = rng.randint(30, 900)
+            # Some old logs predate bill ids and are linked by name only
+            linked_id = None if rng.random() < 0.1 else bill_id
+            batch.append(('Bill Discussion', f"Member {seat}", clock, duration, duration,
+                          bill_name, linked_id, party, str(seat)))
+            clock += timedelta(seconds=duration + 30)
+            if len(batch) >= 5000:
+                total += insert_logs(cursor, batch)
+                connection.commit()
+                batch = []
+        # Unrelated activity types share the table, as in production
+        for _ in range(args.speeches_per_sitting // 4):
+            batch.append(('Zero Hour', 'Member', clock, 180, 180, '', None, rng.choice(PARTIES), '1'))
+    total += insert_logs(cursor, batch)
+    connection.commit()
+    return bills, total
+
+
+def insert_logs(cursor, rows):
+    if not rows:
+        return 0
+    cursor.executemany("""
+        INSERT INTO activity_logs
+        (activity_type, member_name, start_time, duration_seconds, spoken_seconds, bill_name, bill_id, party, seat_no)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, rows)
+    return len(rows)
+
+
+def build_rollups(connection):
+    cursor = connection.cursor()
+    bill_join = """
+        FROM bill_details b
+        JOIN activity_logs a
+          ON a.activity_type = 'Bill Discussion'
+         AND (a.bill_id = b.id OR (a.bill_id IS NULL AND a.bill_name = b.bill_name))
+    """
+    cursor.execute(f"""
+        INSERT INTO bill_party_time (bill_id, party_key, log_date, duration_seconds, speech_count)
+        SELECT b.id, a.party_key, DATE(a.start_time), SUM(COALESCE(a.duration_seconds, 0)), COUNT(*)
+        {bill_join}
+        GROUP BY b.id, a.party_key, DATE(a.start_time)
+    """)
+    cursor.execute(f"""
+        INSERT INTO bill_seat_time (bill_id, seat_no, log_date, duration_seconds, spoken_seconds, speech_count)
+        SELECT b.id, TRIM(COALESCE(a.seat_no, '')), DATE(a.start_time),
+               SUM(COALESCE(a.duration_seconds, 0)), SUM(COALESCE(a.spoken_seconds, 0)), COUNT(*)
+        {bill_join}
+        GROUP BY b.id, TRIM(COALESCE(a.seat_no, '')), DATE(a.start_time)
+    """)
+    connection.commit()
+
+
+def consumed_loop(cursor, bill_id, bill_name):
+    """The original endpoint's algorithm."""
+    import json
+    cursor.execute("SELECT party_allocations FROM bill_details WHERE id = %s", (bill_id,))
+    allocations = json.loads(cursor.fetchone()['party_allocations'] or '[]')
+    allocated_party_lower = {p.get('party', '').lower().strip(): p.get('party', '') for p in allocations}
+    cursor.execute("""
+        SELECT party, duration_seconds, seat_no
+        FROM activity_logs
+        WHERE activity_type = 'Bill Discussion'
+          AND (bill_id = %s OR (bill_id IS NULL AND bill_name = %s))
+    """, (bill_id, bill_name))
+    consumed = {}
+    members = {}
+    for row in cursor.fetchall():
+        duration = row['duration_seconds'] or 0
+        party = row['party']
+        name = allocated_party_lower.get(party.lower().strip(), 'Others') if party else 'Others'
+        consumed[name] = consumed.get(name, 0) + duration
+        if row['seat_no']:
+            members[row['seat_no']] = members.get(row['seat_no'], 0) + duration
+    return consumed, members
+
+
+def consumed_groupby(cursor, bill_id, bill_name):
+    """One statement over activity_logs using the normalized party_key."""
+    cursor.execute("""
+        SELECT 'party' AS kind, COALESCE(al.party, 'Others') AS name, SUM(a.duration_seconds) AS duration
+        FROM activity_logs a
+        LEFT JOIN bill_party_allocations al
+          ON al.bill_id = %s AND al.party_key = a.party_key AND a.party_key <> ''
+        WHERE a.activity_type = 'Bill Discussion'
+          AND (a.bill_id = %s OR (a.bill_id IS NULL AND a.bill_name = %s))
+        GROUP BY COALESCE(al.party, 'Others')
+        UNION ALL
+        SELECT 'member', a.seat_no, SUM(a.duration_seconds)
+        FROM activity_logs a
+        WHERE a.activity_type = 'Bill Discussion'
+          AND (a.bill_id = %s OR (a.bill_id IS NULL AND a.bill_name = %s))
+          AND a.seat_no <> ''
+        GROUP BY a.seat_no
+    """, (bill_id, bill_id, bill_name, bill_id, bill_name))
+    return split_rows(cursor.fetchall())
+
+
+def consumed_rollup(cursor, bill_id, bill_name):
+    """The web app's query over the maintained rollups."""
+    cursor.execute("""
+        SELECT 'party' AS kind, COALESCE(al.party, 'Others') AS name, SUM(t.duration_seconds) AS duration
+        FROM bill_party_time t
+        LEFT JOIN bill_party_allocations al
+          ON al.bill_id = t.bill_id AND al.party_key = t.party_key AND t.party_key <> ''
+        WHERE t.bill_id = %s
+        GROUP BY COALESCE(al.party, 'Others')
+        UNION ALL
+        SELECT 'member', t.seat_no, SUM(t.duration_seconds)
+        FROM bill_seat_time t
+        WHERE t.bill_id = %s AND t.seat_no <> ''
+        GROUP BY t.seat_no
+    """, (bill_id, bill_id))
+    return split_rows(cursor.fetchall())
+
+
+def split_rows(rows):
+    consumed = {}
+    members = {}
+    for row in rows:
+        target = consumed if row['kind'] == 'party' else members
+        target[row['name']] = int(row['duration'] or 0)
+    return consumed, members
+
+
+METHODS = [('loop', consumed_loop), ('groupby', consumed_groupby), ('rollup', consumed_rollup)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bill consumed-time computations")
+    parser.add_argument('--database', help="scratch database name (default: <DB_NAME>_bench)")
+    parser.add_argument('--years', type=int, default=5)
+    parser.add_argument('--sittings-per-year', type=int, default=70)
+    parser.add_argument('--speeches-per-sitting', type=int, default=60)
+    parser.add_argument('--bills', type=int, default=150)
+    parser.add_argument('--repeat', type=int, default=30, help="timed calls per method")
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--keep', action='store_true', help="keep the scratch database afterwards")
+    args = parser.parse_args()
+
+    database = args.database or f"{os.getenv('DB_NAME', 'dashboard_db')}_bench"
+    if database == os.getenv('DB_NAME', 'dashboard_db'):
+        parser.error("refusing to benchmark in the live database")
+    rng = random.Random(args.seed)
+
+    connection = mysql.connector.connect(**DB_CONFIG)
+    cursor = connection.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS `{database}`")
+    cursor.execute(f"CREATE DATABASE `{database}` CHARACTER SET utf8mb4")
+    cursor.execute(f"USE `{database}`")
+    try:
+        create_schema(cursor)
+        print(f"Generating {args.years} years of synthetic logs in `{database}`...")
+        started = time.perf_counter()
+        bills, total = generate_data(connection, args, rng)
+        build_rollups(connection)
+        cursor.execute("ANALYZE TABLE activity_logs, bill_party_time, bill_seat_time")
+        cursor.fetchall()
+        print(f"  {total} log rows, {len(bills)} bills in {time.perf_counter() - started:.1f}s")
+
+        dict_cursor = connection.cursor(dictionary=True)
+        sample = [rng.choice(bills) for _ in range(args.repeat)]
+        for bill_id, bill_name in sample[:5]:
+            results = [method(dict_cursor, bill_id, bill_name) for _, method in METHODS]
+            if any(result != results[0] for result in results[1:]):
+                print(f"Result mismatch for bill {bill_id}: {results}")
+                sys.exit(1)
+        print("  All methods agree on sampled bills")
+
+        print("-" * 60)
+        print(f"{'method':<10}{'mean ms':>12}{'p95 ms':>12}{'max ms':>12}")
+        for name, method in METHODS:
+            timings = []
+            for bill_id, bill_name in sample:
+                t0 = time.perf_counter()
+                method(dict_cursor, bill_id, bill_name)
+                timings.append((time.perf_counter() - t0) * 1000.0)
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            print(f"{name:<10}{statistics.mean(timings):>12.2f}{p95:>12.2f}{timings[-1]:>12.2f}")
+    finally:
+        if not args.keep:
+            cursor.execute(f"DROP DATABASE IF EXISTS `{database}`")
+        connection.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,236 @@
+"""
+Server Mode Benchmark - compares the backend's SERVER_MODE settings
+Starts web_app/app.py once per mode (threading, eventlet, gevent, ...) and
+measures, for each:
+
+  connections   Socket.IO clients connected at once (and how many were refused)
+  emit latency  UDP seat signal -> seat_selected received by every client
+  throughput    GET requests per second from concurrent HTTP workers
+
+With --server-workers N each mode runs as N worker processes behind the
+sticky proxy (SERVER_WORKERS), so the numbers show how far it scales with cores.
+The endpoints used need no database, so the numbers reflect the server
+itself. Needs the client extras: pip install "python-socketio[client]" requests
+
+Examples:
+  python bench_server_modes.py
+  python bench_server_modes.py --modes threading eventlet --clients 500 --workers 32
+  python bench_server_modes.py --modes gevent --path /api/members --duration 20
+  python bench_server_modes.py --modes eventlet --server-workers 1 4 --clients 1000
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import requests
+import socketio
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'web_app', 'app.py')
+UDP_PORT = 65432
+STARTUP_TIMEOUT = 30
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def start_server(mode, port, server_workers=1):
+    """Run app.py in the given SERVER_MODE and wait until every worker answers HTTP."""
+    env = dict(os.environ, SERVER_MODE=mode, SERVER_PORT=str(port), SERVER_WORKERS=str(server_workers))
+    proc = subprocess.Popen([sys.executable, APP_PATH], cwd=os.path.dirname(APP_PATH), env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + STARTUP_TIMEOUT
+    workers_seen = set()
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with code {proc.returncode} (is {mode} installed?)")
+        try:
+            # The proxy sends each request to the least busy worker, so all of them show up here
+            status = requests.get(f"http://127.0.0.1:{port}/api/cluster/status", timeout=1).json()
+            workers_seen.add(status['data']['worker_index'])
+            if len(workers_seen) >= server_workers:
+                return proc
+        except (requests.RequestException, ValueError, KeyError):
+            time.sleep(0.5)
+    proc.terminate()
+    raise RuntimeError(f"server did not start within {STARTUP_TIMEOUT}s")
+
+
+def stop_server(proc):
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def connect_clients(api_base, count, transports):
+    """Open `count` Socket.IO clients; returns (clients, receipts, failures).
+    receipts maps seat_no -> list of receive timestamps across clients."""
+    receipts = {}
+    receipts_lock = threading.Lock()
+    clients = []
+    failures = 0
+
+    def on_seat(data):
+        received_at = time.perf_counter()
+        with receipts_lock:
+            receipts.setdefault(str(data.get('seat_no')), []).append(received_at)
+
+    for _ in range(count):
+        client = socketio.Client(reconnection=False)
+        client.on('seat_selected', on_seat)
+        try:
+            client.connect(api_base, transports=transports, wait_timeout=10)
+            clients.append(client)
+        except Exception:
+            failures += 1
+    return clients, receipts, failures
+
+
+def measure_emit_latency(clients, receipts, host, rounds, settle):
+    """Send one seat per round over UDP and time delivery to every connected client."""
+    latencies = []
+    delivered = 0
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        for round_index in range(rounds):
+            seat_no = str(100 + round_index % 100)
+            seat_receipts = receipts.setdefault(seat_no, [])
+            seat_receipts.clear()
+            sent_at = time.perf_counter()
+            sock.sendto(seat_no.encode(), (host, UDP_PORT))
+            time.sleep(settle)
+            received = list(seat_receipts)
+            delivered += len(received)
+            latencies.extend((at - sent_at) * 1000 for at in received)
+    finally:
+        sock.close()
+    expected = rounds * len(clients)
+    return {
+        'delivered_pct': round(100.0 * delivered / expected, 1) if expected else None,
+        'p50_ms': percentile(latencies, 0.5),
+        'p95_ms': percentile(latencies, 0.95),
+        'max_ms': max(latencies) if latencies else None,
+    }
+
+
+def measure_throughput(url, workers, duration):
+    """Hammer `url` from `workers` threads for `duration` seconds."""
+    counts = [0] * workers
+    errors = [0] * workers
+    latencies = [[] for _ in range(workers)]
+    stop_at = time.time() + duration
+
+    def worker(index):
+        session = requests.Session()
+        while time.time() < stop_at:
+            started = time.perf_counter()
+            try:
+                response = session.get(url, timeout=10)
+                if response.status_code == 200:
+                    counts[index] += 1
+                    latencies[index].append((time.perf_counter() - started) * 1000)
+                else:
+                    errors[index] += 1
+            except requests.RequestException:
+                errors[index] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    all_latencies = [value for values in latencies for value in values]
+    return {
+        'requests_per_s': round(sum(counts) / duration, 1),
+        'errors': sum(errors),
+        'request_p95_ms': percentile(all_latencies, 0.95),
+    }
+
+
+def bench_mode(mode, server_workers, args):
+    api_base = f"http://127.0.0.1:{args.port}"
+    proc = start_server(mode, args.port, server_workers)
+    clients = []
+    try:
+        clients, receipts, failures = connect_clients(api_base, args.clients, args.transports)
+        time.sleep(args.hold)
+        held = sum(1 for client in clients if client.connected)
+        latency = measure_emit_latency(clients, receipts, '127.0.0.1', args.rounds, args.settle)
+        # Throughput is measured while the websocket clients stay connected
+        throughput = measure_throughput(api_base + args.path, args.workers, args.duration)
+        return {'connections_held': held, 'connect_failures': failures, **latency, **throughput}
+    finally:
+        for client in clients:
+            try:
+                client.disconnect()
+            except Exception:
+                pass
+        stop_server(proc)
+
+
+def format_value(value):
+    if value is None:
+        return '-'
+    return f"{value:.1f}" if isinstance(value, float) else str(value)
+
+
+def print_report(results):
+    columns = ['connections_held', 'connect_failures', 'delivered_pct', 'p50_ms', 'p95_ms', 'max_ms',
+               'requests_per_s', 'request_p95_ms', 'errors']
+    headers = ['mode', 'held', 'refused', 'delivered%', 'emit p50', 'emit p95', 'emit max', 'req/s', 'req p95',
+               'errors']
+    rows = []
+    for mode, result in results.items():
+        if isinstance(result, Exception):
+            rows.append([mode, f"failed: {result}"])
+        else:
+            rows.append([mode] + [format_value(result[column]) for column in columns])
+    widths = [max(len(str(row[i])) for row in rows + [headers] if i < len(row)) for i in range(len(headers))]
+    print()
+    print('  '.join(header.ljust(width) for header, width in zip(headers, widths)))
+    for row in rows:
+        print('  '.join(str(value).ljust(width) for value, width in zip(row, widths)))
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare backend SERVER_MODE settings")
+    parser.add_argument('--modes', nargs='+', default=['threading', 'eventlet', 'gevent'],
+                        choices=['development', 'threading', 'eventlet', 'gevent'])
+    parser.add_argument('--port', type=int, default=5055, help="port for the benchmarked server")
+    parser.add_argument('--server-workers', type=int, nargs='+', default=[1],
+                        help="backend worker processes (SERVER_WORKERS); each count is run per mode")
+    parser.add_argument('--clients', type=int, default=200, help="Socket.IO clients to connect")
+    parser.add_argument('--transports', nargs='+', default=['websocket'], choices=['websocket', 'polling'])
+    parser.add_argument('--hold', type=float, default=2, help="seconds to hold connections before measuring")
+    parser.add_argument('--rounds', type=int, default=20, help="seat signals sent for emit latency")
+    parser.add_argument('--settle', type=float, default=0.5, help="seconds to wait for deliveries per round")
+    parser.add_argument('--workers', type=int, default=16, help="concurrent HTTP workers")
+    parser.add_argument('--duration', type=float, default=10, help="throughput run per mode, seconds")
+    parser.add_argument('--path', default='/api/latency-stats', help="GET endpoint for the throughput run")
+    args = parser.parse_args()
+
+    results = {}
+    for mode in args.modes:
+        for server_workers in args.server_workers:
+            label = mode if args.server_workers == [1] else f"{mode} x{server_workers}"
+            print(f"Benchmarking {label} ...")
+            try:
+                results[label] = bench_mode(mode, server_workers, args)
+            except Exception as e:
+                results[label] = e
+    print_report(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 """
 Hex Seat Sender - Dummy tool to simulate hardware input
 Sends seat numbers in hex format to the Parliament web app
+For headless/high-rate runs use seat_load_generator.py
 """
 
 import sys
@@ -19,6 +19,10 @@ sys.stdout.reconfigure(encoding='utf-8')
 # Load environment variables
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
 
+# Shared name normalization (name_key) from the web app
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'web_app'))
+from name_matching import add_name_key_column, name_key
+
 # Database configuration
 DB_CONFIG = {
     'host': os.getenv('DB_HOST', '127.0.0.1'),
@@ -449,6 +453,7 @@ def import_to_database(members):
         return 0, 0, 0
     
     cursor = conn.cursor(dictionary=True)
+    add_name_key_column(cursor, 'parliament_seats')
     
     inserted = 0
     updated = 0
@@ -480,6 +485,7 @@ def import_to_database(members):
             cursor.execute("""
                 UPDATE parliament_seats 
                 SET name = %s,
+                    name_key = %s,
                     name_hindi = %s,
                     party = %s,
                     party_hindi = %s,
@@ -488,15 +494,15 @@ def import_to_database(members):
                     state_hindi = NULL,
                     tenure_start = NULL
                 WHERE seat_no = %s
-            """, (name, name_hindi, party, '-' if is_minister else '', picture, seat_no))
+            """, (name, name_key(name), name_hindi, party, '-' if is_minister else '', picture, seat_no))
             updated += 1
             if picture:
                 photos_added += 1
         else:
             cursor.execute("""
-                INSERT INTO parliament_seats (seat_no, name, name_hindi, party, party_hindi, picture, state, state_hindi, tenure_start)
-                VALUES (%s, %s, %s, %s, %s, %s, NULL, NULL, NULL)
-            """, (seat_no, name, name_hindi, party, '-' if is_minister else '', picture))
+                INSERT INTO parliament_seats (seat_no, name, name_key, name_hindi, party, party_hindi, picture, state, state_hindi, tenure_start)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, NULL, NULL, NULL)
+            """, (seat_no, name, name_key(name), name_hindi, party, '-' if is_minister else '', picture))
             inserted += 1
             if picture:
                 photos_added += 1
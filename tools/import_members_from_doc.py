@@ -31,6 +31,10 @@ except ImportError:
 # Load environment variables
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
 
+# Shared name normalization (name_key) from the web app
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'web_app'))
+from name_matching import add_name_key_column, name_key, sync_name_keys
+
 # Database configuration
 DB_CONFIG = {
     'host': os.getenv('DB_HOST', '127.0.0.1'),
@@ -62,10 +66,8 @@ def clean_name(name):
     """Clean and normalize name string."""
     if not name:
         return ''
-    # Remove extra whitespace
+    # Remove extra whitespace; honorifics are kept for display and ignored by name_key()
     name = ' '.join(name.split())
-    # Remove common prefixes for standardization (optional)
-    # name = re.sub(r'^(SHRI|SMT\.?|DR\.?|PROF\.?)\s+', '', name, flags=re.IGNORECASE)
     return name.strip()
 
 
@@ -208,6 +210,7 @@ def import_to_database(members, dry_run=True):
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
         )
     """)
+    add_name_key_column(cursor, 'parliament_seats')
     
     inserted = 0
     updated = 0
@@ -228,9 +231,10 @@ def import_to_database(members, dry_run=True):
         existing = cursor.fetchone()
         
         if existing:
-            # Update existing record
+            # Update existing record (a name that only differs in case, honorifics or
+            # punctuation is the same person and is not rewritten)
             changes = []
-            if name and name != existing.get('name'):
+            if name and name_key(name) != name_key(existing.get('name')):
                 changes.append(f"name: '{existing.get('name')}' -> '{name}'")
             if name_hindi and name_hindi != existing.get('name_hindi'):
                 changes.append(f"name_hindi: '{existing.get('name_hindi')}' -> '{name_hindi}'")
@@ -246,7 +250,8 @@ def import_to_database(members, dry_run=True):
                             name_hindi = COALESCE(%s, name_hindi),
                             party = COALESCE(%s, party)
                         WHERE seat_no = %s
-                    """, (name or None, name_hindi or None, party or None, seat_no))
+                    """, (name if any(c.startswith('name:') for c in changes) else None,
+                          name_hindi or None, party or None, seat_no))
                 updated += 1
             else:
                 print(f"SKIP Seat {seat_no}: No changes needed")
@@ -262,6 +267,8 @@ def import_to_database(members, dry_run=True):
             inserted += 1
     
     if not dry_run:
+        # Refresh name_key for every row the import touched
+        sync_name_keys(conn.cursor(), 'parliament_seats', 'seat_no')
         conn.commit()
     
     print(f"\n{'='*60}")
@@ -0,0 +1,335 @@
+"""
+Seat Load Generator - headless companion to hex_seat_sender.py
+Drives seat signals into the Parliament web app at a fixed rate from one or
+more concurrent sources, then prints throughput, errors and (from the
+server's /api/latency-stats) delivery latency percentiles.
+
+Modes:
+  udp         plain decimal seat numbers to the UDP receiver (port 65432)
+  hex-http    one POST /api/hex-seat per event
+  hex-batch   POST /api/hex-seat/batch with --batch-size events per request
+  hex-tcp     hex text lines to the raw hex listener (port 65433)
+  binary      0xA5 binary frames to the raw hex listener over TCP
+
+Examples:
+  python seat_load_generator.py --mode udp --rate 2000 --duration 30
+  python seat_load_generator.py --mode binary --rate 5000 --sources 4 --batch-size 50
+  python seat_load_generator.py --mode hex-http --pattern replay --replay-file seats.txt
+"""
+
+import abc
+import argparse
+import random
+import socket
+import sys
+import threading
+import time
+
+import requests
+
+MIN_SEAT_NO = 1
+MAX_SEAT_NO = 245
+BINARY_FRAME_MAGIC = 0xA5
+
+DEFAULT_PORTS = {
+    'udp': 65432,
+    'hex-http': 5000,
+    'hex-batch': 5000,
+    'hex-tcp': 65433,
+    'binary': 65433,
+}
+
+
+def load_replay_file(path):
+    """Read seat numbers from a replay file: one seat per line, '#' comments allowed.
+    Lines may also be 'offset_seconds,seat_no' (e.g. exported from a log); only the seat is used.
+    Malformed lines are reported with their line number and skipped."""
+    seats = []
+    with open(path, encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            value = line.split(',')[-1].strip()
+            try:
+                seat_no = int(value, 16) if value.lower().startswith('0x') else int(value)
+            except ValueError:
+                print(f"{path}:{line_no}: skipping malformed seat {value!r}", file=sys.stderr)
+                continue
+            if MIN_SEAT_NO <= seat_no <= MAX_SEAT_NO:
+                seats.append(seat_no)
+    if not seats:
+        raise ValueError(f"No valid seat numbers found in {path}")
+    return seats
+
+
+def seat_pattern(pattern, source_index, replay_seats=None):
+    """Infinite generator of seat numbers for one source."""
+    if pattern == 'random':
+        rng = random.Random(source_index)
+        while True:
+            yield rng.randint(MIN_SEAT_NO, MAX_SEAT_NO)
+    elif pattern == 'sequential':
+        seat_no = MIN_SEAT_NO + source_index
+        while True:
+            yield (seat_no - MIN_SEAT_NO) % MAX_SEAT_NO + MIN_SEAT_NO
+            seat_no += 1
+    else:
+        index = source_index
+        while True:
+            yield replay_seats[index % len(replay_seats)]
+            index += 1
+
+
+class SourceStats:
+    """Per-source counters, merged at the end of the run."""
+    def __init__(self):
+        self.sent = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.errors = 0
+        self.error_samples = []
+
+    def error(self, message):
+        self.errors += 1
+        if len(self.error_samples) < 5:
+            self.error_samples.append(message)
+
+
+class Sender(abc.ABC):
+    """Base class: sends a batch of seat numbers and updates stats."""
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+
+    @abc.abstractmethod
+    def send(self, seats, stats):
+        """Send `seats`, counting sent/accepted/rejected/errors on `stats`."""
+
+    def close(self):
+        pass
+
+
+class UDPSender(Sender):
+    def __init__(self, host, port):
+        super().__init__(host, port)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def send(self, seats, stats):
+        for seat_no in seats:
+            try:
+                self.sock.sendto(str(seat_no).encode(), (self.host, self.port))
+                stats.sent += 1
+                stats.accepted += 1  # UDP is fire-and-forget; no server ack
+            except OSError as e:
+                stats.error(f"udp: {e}")
+
+    def close(self):
+        self.sock.close()
+
+
+class HexHTTPSender(Sender):
+    def __init__(self, host, port, batch=False):
+        super().__init__(host, port)
+        self.batch = batch
+        self.session = requests.Session()  # keep-alive instead of a new connection per send
+        self.base_url = f"http://{host}:{port}/api/hex-seat"
+
+    def send(self, seats, stats):
+        try:
+            if self.batch:
+                now = time.time()
+                entries = [{'hex': f"0x{s:02X}", 'ts': now} for s in seats]
+                response = self.session.post(f"{self.base_url}/batch", json={'entries': entries}, timeout=5)
+                result = response.json()
+                stats.sent += len(seats)
+                stats.accepted += result.get('accepted', 0)
+                stats.rejected += result.get('rejected', len(seats) if not result.get('success') else 0)
+            else:
+                for seat_no in seats:
+                    response = self.session.post(self.base_url, json={'hex': f"0x{seat_no:02X}"}, timeout=5)
+                    stats.sent += 1
+                    if response.json().get('success'):
+                        stats.accepted += 1
+                    else:
+                        stats.rejected += 1
+        except (requests.exceptions.RequestException, ValueError) as e:
+            stats.error(f"http: {e}")
+
+    def close(self):
+        self.session.close()
+
+
+class HexTCPSender(Sender):
+    """Raw hex listener client; reads one ACK line per batch."""
+    def __init__(self, host, port, binary=False):
+        super().__init__(host, port)
+        self.binary = binary
+        self.sock = socket.create_connection((host, port), timeout=5)
+        self.reader = self.sock.makefile('rb')
+
+    def send(self, seats, stats):
+        try:
+            if self.binary:
+                for offset in range(0, len(seats), 255):
+                    chunk = seats[offset:offset + 255]
+                    self.sock.sendall(bytes([BINARY_FRAME_MAGIC, len(chunk)] + chunk))
+                    self._read_ack(len(chunk), stats)
+            else:
+                self.sock.sendall((' '.join(f"0x{s:02X}" for s in seats) + '\n').encode('ascii'))
+                self._read_ack(len(seats), stats)
+        except OSError as e:
+            stats.error(f"tcp: {e}")
+
+    def _read_ack(self, count, stats):
+        line = self.reader.readline().decode('ascii', errors='replace').strip()
+        stats.sent += count
+        fields = dict(part.split('=', 1) for part in line.split()[1:] if '=' in part)
+        if not line.startswith('ACK'):
+            stats.error(f"bad ack: {line!r}")
+            return
+        stats.accepted += int(fields.get('accepted', 0))
+        stats.rejected += int(fields.get('rejected', 0))
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+
+def make_sender(mode, host, port):
+    if mode == 'udp':
+        return UDPSender(host, port)
+    if mode in ('hex-http', 'hex-batch'):
+        return HexHTTPSender(host, port, batch=(mode == 'hex-batch'))
+    return HexTCPSender(host, port, binary=(mode == 'binary'))
+
+
+def run_source(index, args, replay_seats, stop_at, stats):
+    """Send seats at this source's share of the total rate until the run ends."""
+    try:
+        sender = make_sender(args.mode, args.host, args.port)
+    except OSError as e:
+        stats.error(f"connect: {e}")
+        return
+    seats = seat_pattern(args.pattern, index, replay_seats)
+    batch_size = args.batch_size if args.mode in ('hex-batch', 'hex-tcp', 'binary') else 1
+    interval = batch_size * args.sources / float(args.rate)
+    next_send = time.perf_counter()
+    try:
+        while time.perf_counter() < stop_at:
+            sender.send([next(seats) for _ in range(batch_size)], stats)
+            next_send += interval
+            delay = next_send - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -1.0:
+                # Fell more than a second behind; don't try to burst to catch up
+                next_send = time.perf_counter()
+    finally:
+        sender.close()
+
+
+def fetch_server_stats(api_base, reset=False):
+    """Reset or read the server's latency histograms; returns None if unavailable."""
+    try:
+        if reset:
+            requests.post(f"{api_base}/api/latency-stats/reset", timeout=5)
+            return None
+        response = requests.get(f"{api_base}/api/latency-stats", timeout=5)
+        return response.json().get('data')
+    except (requests.exceptions.RequestException, ValueError):
+        return None
+
+
+def print_report(args, totals, elapsed, server_stats):
+    print("\n" + "=" * 60)
+    print(f"Mode: {args.mode}  Pattern: {args.pattern}  Sources: {args.sources}")
+    print(f"Target rate: {args.rate}/s  Duration: {elapsed:.1f}s")
+    print("-" * 60)
+    print(f"Events sent:      {totals.sent}")
+    print(f"Achieved rate:    {totals.sent / elapsed if elapsed else 0:.1f}/s")
+    print(f"Accepted:         {totals.accepted}")
+    print(f"Rejected:         {totals.rejected}")
+    print(f"Send errors:      {totals.errors}")
+    for sample in totals.error_samples:
+        print(f"  ! {sample}")
+    if server_stats:
+        print("-" * 60)
+        print(f"Server latency since receipt (target {server_stats['target_ms']} ms):")
+        for stage, snap in server_stats['stages'].items():
+            if not snap['count']:
+                print(f"  {stage:<7} no samples")
+                continue
+            print(f"  {stage:<7} n={snap['count']:<8} p50={snap['p50_ms']}ms  p95={snap['p95_ms']}ms  "
+                  f"p99={snap['p99_ms']}ms  max={snap['max_ms']}ms  within target={snap['within_target_pct']}%")
+    else:
+        print("(Server latency stats unavailable)")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless seat signal load generator")
+    parser.add_argument('--mode', choices=sorted(DEFAULT_PORTS), default='udp')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, help="defaults to the standard port for the mode")
+    parser.add_argument('--api', default='http://127.0.0.1:5000', help="backend base URL for latency stats")
+    parser.add_argument('--rate', type=float, default=100, help="total events per second across all sources")
+    parser.add_argument('--sources', type=int, default=1, help="concurrent sources (threads/connections)")
+    parser.add_argument('--duration', type=float, default=10, help="run duration in seconds")
+    parser.add_argument('--pattern', choices=['random', 'sequential', 'replay'], default='random')
+    parser.add_argument('--replay-file', help="seat list for --pattern replay")
+    parser.add_argument('--batch-size', type=int, default=10, help="events per request/line/frame (batch modes)")
+    parser.add_argument('--no-reset', action='store_true', help="keep existing server latency stats")
+    args = parser.parse_args()
+
+    if args.port is None:
+        args.port = DEFAULT_PORTS[args.mode]
+    if args.rate <= 0 or args.sources < 1 or args.batch_size < 1:
+        parser.error("--rate, --sources and --batch-size must be positive")
+    replay_seats = None
+    if args.pattern == 'replay':
+        if not args.replay_file:
+            parser.error("--pattern replay requires --replay-file")
+        try:
+            replay_seats = load_replay_file(args.replay_file)
+        except (OSError, ValueError) as e:
+            parser.error(f"--replay-file: {e}")
+
+    if not args.no_reset:
+        fetch_server_stats(args.api, reset=True)
+
+    print(f"Sending {args.mode} seat signals to {args.host}:{args.port} "
+          f"at {args.rate}/s for {args.duration}s from {args.sources} source(s)...")
+    stats = [SourceStats() for _ in range(args.sources)]
+    started = time.perf_counter()
+    stop_at = started + args.duration
+    threads = [
+        threading.Thread(target=run_source, args=(i, args, replay_seats, stop_at, stats[i]), daemon=True)
+        for i in range(args.sources)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        print("\nInterrupted - reporting partial results")
+    elapsed = time.perf_counter() - started
+
+    totals = SourceStats()
+    for s in stats:
+        totals.sent += s.sent
+        totals.accepted += s.accepted
+        totals.rejected += s.rejected
+        totals.errors += s.errors
+        totals.error_samples.extend(s.error_samples)
+    totals.error_samples = totals.error_samples[:5]
+
+    # Give clients a moment to render and acknowledge the tail of the run
+    time.sleep(1.0)
+    print_report(args, totals, elapsed, fetch_server_stats(args.api))
+    sys.exit(1 if totals.errors else 0)
+
+
+if __name__ == '__main__':
+    main()
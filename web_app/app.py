@@ -5,15 +5,69 @@ Flask Backend with WebSocket support
 
 import os
 import sys
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+# Server mode (SERVER_MODE):
+#   development - Werkzeug with debugger and reloader (default when run from source)
+#   threading   - Werkzeug, one thread per connection, no debugger (default for the packaged EXE)
+#   eventlet    - cooperative green-thread server
+#   gevent      - cooperative greenlet server (websockets need gevent-websocket)
+# The cooperative modes monkey-patch the standard library here, before socket and
+# threading are imported below, so blocking I/O (MySQL included) yields instead of
+# holding a thread per connection.
+SERVER_MODES = ('development', 'threading', 'eventlet', 'gevent')
+SERVER_MODE = os.getenv('SERVER_MODE', 'threading' if getattr(sys, 'frozen', False) else 'development').strip().lower()
+if SERVER_MODE not in SERVER_MODES:
+    raise SystemExit(f"SERVER_MODE must be one of: {', '.join(SERVER_MODES)} (got {SERVER_MODE!r})")
+SERVER_HOST = os.getenv('SERVER_HOST', '0.0.0.0')
+SERVER_PORT = int(os.getenv('SERVER_PORT', '5000'))
+
+# Multi-worker scale-out (SERVER_WORKERS, see cluster.py): the process started by the
+# user supervises N copies of this script, each started with its WORKER_INDEX, behind
+# a sticky proxy on SERVER_PORT. The supervisor serves nothing itself and must not be
+# monkey-patched (it runs asyncio). Rehearsal replays and --partition-activity-logs
+# always run in a single process.
+SERVER_WORKERS = os.getenv('SERVER_WORKERS', '1').strip().lower()
+SERVER_WORKERS = (os.cpu_count() or 1) if SERVER_WORKERS == 'auto' else max(1, int(SERVER_WORKERS))
+CLUSTER_WORKER = 'WORKER_INDEX' in os.environ
+WORKER_INDEX = int(os.getenv('WORKER_INDEX', '0'))
+IS_PRIMARY_WORKER = WORKER_INDEX == 0   # runs the seat receivers and maintenance
+# Served by the primary only: per-process stats, and PDF reports, so a report that is
+# still rendering is polled where it renders instead of being started on every worker
+CLUSTER_PRIMARY_PATHS = ('/api/latency-stats', '/api/event-dispatcher/stats', '/api/cache/stats',
+                         '/api/reports/')
+if (__name__ == '__main__' and SERVER_WORKERS > 1 and not CLUSTER_WORKER
+        and not {'--rehearsal', '--partition-activity-logs'} & set(sys.argv)):
+    from cluster import supervise
+    raise SystemExit(supervise(__file__, sys.argv[1:], SERVER_HOST, SERVER_PORT, SERVER_WORKERS,
+                               primary_paths=CLUSTER_PRIMARY_PATHS))
+
+if SERVER_MODE == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+elif SERVER_MODE == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+COOPERATIVE_SERVER = SERVER_MODE in ('eventlet', 'gevent')
+
 import socket
 import threading
 import logging
+import time
+import uuid
+from collections import deque, OrderedDict
 from datetime import datetime, timezone, timedelta
-from flask import Flask, render_template, jsonify, request, send_from_directory, abort
+from flask import Flask, render_template, jsonify, request, send_from_directory, abort, Response, stream_with_context, make_response
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
 import mysql.connector
-from dotenv import load_dotenv
+from export_writers import csv_stream, xlsx_stream
+from name_matching import NameIndex, add_name_key_column, name_key, sync_name_keys
+from pdf_reports import is_total_row
+from cluster import BrokerManager, StateBus, is_broker_url, worker_session_id
 
 # IST Timezone (UTC+5:30)
 IST = timezone(timedelta(hours=5, minutes=30))
@@ -22,13 +76,13 @@ def get_ist_now():
     """Get current datetime in IST timezone"""
     return datetime.now(IST)
 
-# Load environment variables
-load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+# Start of this server run; for workers, when the supervisor started
+SERVER_STARTED_AT = datetime.fromtimestamp(float(os.getenv('CLUSTER_STARTED_AT') or time.time()), IST)
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(levelname)s - ' + (f'[w{WORKER_INDEX}] ' if CLUSTER_WORKER else '') + '%(message)s'
 )
 logger = logging.getLogger(__name__)
 
@@ -39,9 +93,25 @@ REACT_DIST_DIR = os.path.join(BASE_DIR, 'react_dist')
 
 app = Flask(__name__, static_folder='static', template_folder='templates')
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'parliament-secret-key-2024')
-CORS(app)
-# Force threading to avoid missing async backends in packaged EXE
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+# ETag/Last-Modified are exposed so the React dev server (another origin) can revalidate
+CORS(app, expose_headers=['ETag', 'Last-Modified'], max_age=600)
+# Socket.IO message queue shared by the workers (set by the supervisor, or e.g.
+# redis://127.0.0.1:6379/0): every emit goes through it, so the clients of all
+# workers receive it. broker+unix:// and broker+tcp:// are the local broker in cluster.py.
+SOCKETIO_MESSAGE_QUEUE = os.getenv('SOCKETIO_MESSAGE_QUEUE', '').strip()
+socketio_queue_options = {}
+if is_broker_url(SOCKETIO_MESSAGE_QUEUE):
+    socketio_queue_options['client_manager'] = BrokerManager(SOCKETIO_MESSAGE_QUEUE, channel='flask-socketio')
+elif SOCKETIO_MESSAGE_QUEUE:
+    socketio_queue_options['message_queue'] = SOCKETIO_MESSAGE_QUEUE
+# Threading unless a cooperative SERVER_MODE was chosen (the packaged EXE bundles no async backend)
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=SERVER_MODE if COOPERATIVE_SERVER else 'threading',
+                    **socketio_queue_options)
+if CLUSTER_WORKER:
+    # Session ids name their worker so the supervisor's proxy can keep each session on it
+    socketio.server.eio.generate_id = worker_session_id(WORKER_INDEX, socketio.server.eio.generate_id)
+# Broadcast feed, timer and cache invalidation shared with the other workers (see CLUSTER below)
+cluster_bus = StateBus(SOCKETIO_MESSAGE_QUEUE if CLUSTER_WORKER else '')
 
 # Shared broadcast feed state for remote broadcast viewers
 broadcast_state = {
@@ -50,6 +120,8 @@ broadcast_state = {
     'payload': {},
     'updated_at': datetime.now(IST).strftime('%Y-%m-%d %H:%M:%S')
 }
+# Last timer_update from a controller, sent to displays as they connect
+timer_state = {}
 
 # Database configuration
 DB_CONFIG = {
@@ -58,6 +130,507 @@ DB_CONFIG = {
     'password': os.getenv('DB_PASSWORD', ''),
     'database': os.getenv('DB_NAME', 'dashboard_db'),
 }
+if COOPERATIVE_SERVER:
+    # The C extension does its own socket I/O, which monkey-patching cannot make cooperative
+    DB_CONFIG['use_pure'] = True
+
+# Seat-to-screen latency tracing
+# Each seat event gets a trace id at receipt; later stages are stamped relative to it
+LATENCY_TARGET_MS = 200
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 200, 500, 1000, 2000, 5000]
+LATENCY_STAGES = ('emit', 'lookup', 'render')
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with a bounded sample window for percentiles."""
+    def __init__(self, buckets=LATENCY_BUCKETS_MS, window=10000):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, value_ms):
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+        self.samples.append(value_ms)
+        for i, bound in enumerate(self.buckets):
+            if value_ms <= bound:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    def percentile(self, pct):
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return round(ordered[index], 2)
+
+    def snapshot(self, target_ms=LATENCY_TARGET_MS):
+        within = sum(1 for v in self.samples if v <= target_ms)
+        labels = [f"<={b}ms" for b in self.buckets] + [f">{self.buckets[-1]}ms"]
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total_ms / self.count, 2) if self.count else None,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'max_ms': round(self.max_ms, 2) if self.count else None,
+            'within_target_pct': round(100.0 * within / len(self.samples), 2) if self.samples else None,
+            'buckets': dict(zip(labels, self.counts))
+        }
+
+class LatencyTracker:
+    """Tracks seat events from receipt through emit, member lookup and client render."""
+    def __init__(self, max_traces=5000):
+        self.lock = threading.Lock()
+        self.max_traces = max_traces
+        self.traces = OrderedDict()
+        self.histograms = {stage: LatencyHistogram() for stage in LATENCY_STAGES}
+
+    def start(self, seat_no, source, received_at=None):
+        """Open a trace at receipt time and return its id."""
+        trace_id = uuid.uuid4().hex[:16]
+        with self.lock:
+            self.traces[trace_id] = {
+                'seat_no': str(seat_no),
+                'source': source,
+                'received_at': received_at if received_at is not None else time.monotonic()
+            }
+            while len(self.traces) > self.max_traces:
+                self.traces.popitem(last=False)
+        return trace_id
+
+    def stamp(self, trace_id, stage):
+        """Record the elapsed time from receipt to the given stage; unknown ids are ignored."""
+        if not trace_id or stage not in self.histograms:
+            return None
+        now = time.monotonic()
+        with self.lock:
+            trace = self.traces.get(trace_id)
+            if not trace:
+                return None
+            elapsed_ms = (now - trace['received_at']) * 1000.0
+            self.histograms[stage].record(elapsed_ms)
+        return elapsed_ms
+
+    def stats(self):
+        with self.lock:
+            return {
+                'target_ms': LATENCY_TARGET_MS,
+                'open_traces': len(self.traces),
+                'stages': {stage: hist.snapshot() for stage, hist in self.histograms.items()}
+            }
+
+    def reset(self):
+        with self.lock:
+            self.traces.clear()
+            self.histograms = {stage: LatencyHistogram() for stage in LATENCY_STAGES}
+
+latency_tracker = LatencyTracker()
+
+def stamp_latency(trace_id, stage):
+    """Stamp a trace stage. Seat traces are opened by the primary worker, so other
+    workers forward the stamp to it (the bus hop is counted in the latency)."""
+    if latency_tracker.stamp(trace_id, stage) is None and trace_id and not IS_PRIMARY_WORKER:
+        cluster_bus.publish('latency_stamp', {'trace_id': trace_id, 'stage': stage})
+
+# Outbound Socket.IO event dispatcher
+# Producers (UDP thread, request handlers) only enqueue; a dedicated sender thread
+# does the actual socketio.emit so a slow websocket client never blocks ingestion.
+EVENT_POLICY_LATEST = 'latest'   # only the newest pending payload is delivered
+EVENT_POLICY_MUST = 'must'       # every payload is delivered in order
+EVENT_POLICIES = {
+    'seat_selected': EVENT_POLICY_LATEST,
+    'broadcast_state': EVENT_POLICY_LATEST,
+    'timer_sync': EVENT_POLICY_LATEST,
+    'chairperson_update': EVENT_POLICY_LATEST,
+}
+
+class EventDispatcher:
+    """Bounded outbound event queue with per-event-type delivery policies.
+    Latest-wins events are coalesced while pending, so they hold at most one
+    slot per event type. Must-deliver events (the default, e.g. log events) are
+    queued in order and never dropped: past `capacity` they spill to an
+    unbounded overflow queue, which is logged and counted, so publishing never
+    blocks and never fails."""
+    def __init__(self, capacity=1000, policies=None):
+        self.capacity = capacity
+        self.policies = dict(policies or {})
+        self.cond = threading.Condition()
+        self.order = deque()      # keys in delivery order
+        self.pending = {}         # key -> (event, payload, on_sent)
+        self.overflow = deque()   # (key, event, payload, on_sent) of must-deliver events past capacity
+        self.must_depth = 0       # must-deliver events in `order`
+        self.seq = 0
+        self.running = False
+        self.started = False      # publish() starts the sender once, never after stop()
+        self.thread = None
+        self.metrics = {
+            'enqueued': 0, 'sent': 0, 'coalesced': 0, 'overflowed': 0, 'max_overflow': 0,
+            'send_errors': 0, 'max_depth': 0, 'last_send_ms': None, 'max_send_ms': 0.0
+        }
+        self.per_event = {}
+
+    def start(self):
+        """Start the sender thread."""
+        with self.cond:
+            if self.running:
+                return
+            self.running = True
+            self.started = True
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+        logger.info(f"Event dispatcher started (capacity {self.capacity})")
+
+    def stop(self):
+        """Stop the sender thread after waking it."""
+        with self.cond:
+            self.running = False
+            self.cond.notify_all()
+        logger.info("Event dispatcher stopped")
+
+    def publish(self, event, payload, on_sent=None):
+        """Queue an event for broadcast; never blocks on delivery."""
+        if not self.started:
+            self.start()
+        policy = self.policies.get(event, EVENT_POLICY_MUST)
+        with self.cond:
+            counts = self.per_event.setdefault(event, {'enqueued': 0, 'sent': 0, 'coalesced': 0, 'overflowed': 0})
+            self.metrics['enqueued'] += 1
+            counts['enqueued'] += 1
+            if policy == EVENT_POLICY_LATEST:
+                key = ('latest', event)
+                if key in self.pending:
+                    self.pending[key] = (event, payload, on_sent)
+                    self.metrics['coalesced'] += 1
+                    counts['coalesced'] += 1
+                    return
+            else:
+                self.seq += 1
+                key = ('must', self.seq)
+                if self.overflow or self.must_depth >= self.capacity:
+                    # Behind earlier overflow too, so must-deliver order is kept
+                    if not self.overflow:
+                        logger.warning(f"Event queue full ({self.capacity} must-deliver events); "
+                                       f"spilling to the overflow queue")
+                    self.overflow.append((key, event, payload, on_sent))
+                    self.metrics['overflowed'] += 1
+                    counts['overflowed'] += 1
+                    self.metrics['max_overflow'] = max(self.metrics['max_overflow'], len(self.overflow))
+                    return
+                self.must_depth += 1
+            self.order.append(key)
+            self.pending[key] = (event, payload, on_sent)
+            self.metrics['max_depth'] = max(self.metrics['max_depth'], len(self.order))
+            self.cond.notify()
+
+    def _refill(self):
+        """Move overflowed must-deliver events into the queue as room frees up (caller holds the lock)."""
+        while self.overflow and self.must_depth < self.capacity:
+            key, event, payload, on_sent = self.overflow.popleft()
+            self.order.append(key)
+            self.pending[key] = (event, payload, on_sent)
+            self.must_depth += 1
+
+    def _run(self):
+        while True:
+            with self.cond:
+                while self.running and not self.order:
+                    self.cond.wait(1.0)
+                if not self.running:
+                    return
+                key = self.order.popleft()
+                event, payload, on_sent = self.pending.pop(key)
+                if key[0] == 'must':
+                    self.must_depth -= 1
+                    self._refill()
+            started = time.monotonic()
+            try:
+                socketio.emit(event, payload)
+            except Exception as e:
+                with self.cond:
+                    self.metrics['send_errors'] += 1
+                logger.error(f"Event emit error ({event}): {e}")
+                continue
+            elapsed_ms = (time.monotonic() - started) * 1000.0
+            with self.cond:
+                self.metrics['sent'] += 1
+                self.per_event[event]['sent'] += 1
+                self.metrics['last_send_ms'] = round(elapsed_ms, 3)
+                self.metrics['max_send_ms'] = round(max(self.metrics['max_send_ms'], elapsed_ms), 3)
+            if on_sent:
+                try:
+                    on_sent()
+                except Exception as e:
+                    logger.error(f"Event post-send hook error ({event}): {e}")
+
+    def stats(self):
+        with self.cond:
+            return {
+                'running': self.running,
+                'capacity': self.capacity,
+                'depth': len(self.order),
+                'must_depth': self.must_depth,
+                'overflow_depth': len(self.overflow),
+                **self.metrics,
+                'policies': {event: self.policies.get(event, EVENT_POLICY_MUST) for event in self.per_event},
+                'events': {event: dict(counts) for event, counts in self.per_event.items()}
+            }
+
+event_dispatcher = EventDispatcher(
+    capacity=int(os.getenv('EVENT_QUEUE_SIZE', '1000')),
+    policies=EVENT_POLICIES
+)
+
+# Session recording (input for rehearsal replays)
+class SessionRecorder:
+    """Appends live seat, chairperson, timer and activity-log events to a JSONL file.
+    Each line is {"t": seconds since recording start, "type": ..., "data": {...}}."""
+    def __init__(self, path=None):
+        self.path = path
+        self.lock = threading.Lock()
+        self.started_at = None
+        self.file = None
+
+    @property
+    def enabled(self):
+        return bool(self.path)
+
+    def record(self, event_type, data):
+        if not self.path:
+            return
+        import json
+        with self.lock:
+            try:
+                if self.file is None:
+                    self.file = open(self.path, 'a', encoding='utf-8', buffering=1)
+                    self.started_at = time.monotonic()
+                    self.file.write(json.dumps({
+                        't': 0, 'type': 'header',
+                        'data': {'recorded_at': get_ist_now().strftime('%Y-%m-%d %H:%M:%S')}
+                    }) + "\n")
+                line = {'t': round(time.monotonic() - self.started_at, 3), 'type': event_type, 'data': data}
+                self.file.write(json.dumps(line, ensure_ascii=False, default=str) + "\n")
+            except (OSError, TypeError) as e:
+                logger.error(f"Session recording error: {e}")
+
+    def close(self):
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
+
+session_recorder = SessionRecorder(os.getenv('SESSION_RECORD_FILE'))
+
+def publish_seat_selected(seat_no, source, received_at=None):
+    """Emit a seat selection to all clients with a latency trace id attached."""
+    session_recorder.record('seat', {'seat_no': str(seat_no), 'source': source})
+    trace_id = latency_tracker.start(seat_no, source, received_at)
+    event_dispatcher.publish(
+        'seat_selected',
+        {'seat_no': str(seat_no), 'trace_id': trace_id},
+        on_sent=lambda: latency_tracker.stamp(trace_id, 'emit')
+    )
+    return trace_id
+
+# Per-table data versions, bumped by every write path in this process.
+# Caches derived from a table (counts, rendered reports) key on its version.
+data_versions = {'activity_logs': 0, 'bill_details': 0, 'chairpersons': 0, 'parliament_seats': 0}
+data_versions_lock = threading.Lock()
+# Wall-clock time of each table's last bump, for Last-Modified headers
+data_versions_changed_at = {}
+DATA_VERSIONS_STARTED_AT = time.time()
+
+# BOOT_ID keeps validators from one server run from matching the next run's; the
+# workers of one cluster share it. Validators are built from write clocks rather
+# than data_versions: a clock counts the writes each server process (PROCESS_ID)
+# made, and workers merge the clocks they receive, so two workers that have seen
+# the same writes produce the same ETag. A lost bus message only costs a miss.
+BOOT_ID = (uuid.uuid5(uuid.NAMESPACE_OID, os.environ['CLUSTER_STARTED_AT']).hex[:8] if CLUSTER_WORKER
+           else uuid.uuid4().hex[:8])
+PROCESS_ID = uuid.uuid4().hex[:8]
+data_version_clocks = {table: {} for table in data_versions}
+
+def clock_tag(clock):
+    return ','.join(f"{origin}:{count}" for origin, count in sorted(clock.items()))
+
+def merge_clock(clock, other):
+    """Merge `other` into `clock` in place; True if anything advanced."""
+    advanced = False
+    for origin, count in other.items():
+        if count > clock.get(origin, 0):
+            clock[origin] = count
+            advanced = True
+    return advanced
+
+def mark_data_changed(table):
+    """Retire this process's caches derived from `table` (caller holds no lock)."""
+    with data_versions_lock:
+        data_versions[table] = data_versions.get(table, 0) + 1
+        data_versions_changed_at[table] = time.time()
+    if table == 'activity_logs':
+        invalidate_activity_log_counts()
+
+def bump_data_version(table):
+    """Mark a table as changed so caches derived from it are invalidated, here and in the other workers."""
+    with data_versions_lock:
+        clock = data_version_clocks.setdefault(table, {})
+        clock[PROCESS_ID] = clock.get(PROCESS_ID, 0) + 1
+        count = clock[PROCESS_ID]
+    mark_data_changed(table)
+    cluster_bus.publish('data_version', {'table': table, 'clock': {PROCESS_ID: count}})
+
+def merge_data_version_clock(table, clock):
+    """Apply writes reported by another worker."""
+    with data_versions_lock:
+        advanced = merge_clock(data_version_clocks.setdefault(table, {}), clock)
+    if advanced:
+        mark_data_changed(table)
+
+def get_data_version(table):
+    with data_versions_lock:
+        return data_versions.get(table, 0)
+
+# Per-bill write clocks for bill snapshots; the epoch clock moves when every bill changes at once.
+bill_version_clocks = {}
+bill_epoch_clock = {}
+
+def bump_bill_versions(bill_ids=None):
+    """Mark bills (all bills if None) as changed, here and in the other workers."""
+    bill_ids = None if bill_ids is None else list(bill_ids)
+    with data_versions_lock:
+        clocks = [bill_epoch_clock] if bill_ids is None else [bill_version_clocks.setdefault(bill_id, {})
+                                                              for bill_id in bill_ids]
+        for clock in clocks:
+            clock[PROCESS_ID] = clock.get(PROCESS_ID, 0) + 1
+        changes = {'epoch': {PROCESS_ID: bill_epoch_clock[PROCESS_ID]}} if bill_ids is None else {
+            'bills': {str(bill_id): {PROCESS_ID: bill_version_clocks[bill_id][PROCESS_ID]} for bill_id in bill_ids}}
+    cluster_bus.publish('bill_versions', changes)
+
+def merge_bill_version_clocks(changes):
+    """Apply bill changes reported by another worker ({'epoch': clock} and/or {'bills': {id: clock}})."""
+    with data_versions_lock:
+        merge_clock(bill_epoch_clock, changes.get('epoch') or {})
+        for bill_id, clock in (changes.get('bills') or {}).items():
+            merge_clock(bill_version_clocks.setdefault(int(bill_id), {}), clock)
+
+def get_bill_version(bill_id):
+    with data_versions_lock:
+        return f"{BOOT_ID}.{clock_tag(bill_epoch_clock)}.{clock_tag(bill_version_clocks.get(bill_id, {}))}"
+
+# Read-endpoint result cache. Entries are keyed by (endpoint, params) and tagged
+# with the data versions of the tables they were read from, so a write in this
+# process retires them at once; the TTL bounds staleness from writes made by
+# other processes (the tools/ scripts, another server on the same database).
+QUERY_CACHE_SIZE = int(os.getenv('QUERY_CACHE_SIZE', '256'))
+QUERY_CACHE_TTL = int(os.getenv('QUERY_CACHE_TTL', '300'))  # seconds
+
+class QueryResultCache:
+    """LRU of query results checked against per-table data versions.
+
+    Cached values are shared between requests and must not be mutated.
+    A loader returning None (a failed query) is not cached.
+    """
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.by_endpoint = {}
+
+    def get(self, endpoint, params, tables, load):
+        """Return the cached result for (endpoint, params), calling load() on a miss."""
+        key = (endpoint, params)
+        # Versions are read before the query, so a write racing the load leaves a stale tag, not stale data
+        versions = tuple(get_data_version(table) for table in tables)
+        with self.lock:
+            counts = self.by_endpoint.setdefault(endpoint, {'hits': 0, 'misses': 0})
+            entry = self.entries.get(key)
+            if entry and entry[0] == versions and time.monotonic() - entry[1] < self.ttl:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                counts['hits'] += 1
+                return entry[2]
+            self.misses += 1
+            counts['misses'] += 1
+        
+        value = load()
+        if value is not None:
+            with self.lock:
+                self.entries[key] = (versions, time.monotonic(), value)
+                self.entries.move_to_end(key)
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            result = {
+                'entries': len(self.entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+                'endpoints': {endpoint: dict(counts) for endpoint, counts in self.by_endpoint.items()},
+            }
+        with data_versions_lock:
+            result['data_versions'] = dict(data_versions)
+        return result
+
+query_cache = QueryResultCache(QUERY_CACHE_SIZE, QUERY_CACHE_TTL)
+
+def versioned_get(*tables):
+    """Decorator adding ETag/Last-Modified validators to a GET endpoint whose
+    response depends only on the request URL and the given tables.
+
+    The ETag is derived from the tables' data versions (plus the query cache
+    TTL window, so writes made outside this process still change it), so a
+    matching If-None-Match is answered with 304 before the handler - and its
+    queries - run.
+    """
+    import functools
+    import hashlib
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            with data_versions_lock:
+                versions = [clock_tag(data_version_clocks.get(table, {})) for table in tables]
+                last_modified = max([data_versions_changed_at.get(table, DATA_VERSIONS_STARTED_AT)
+                                     for table in tables])
+            window = int(time.time() // QUERY_CACHE_TTL) if QUERY_CACHE_TTL > 0 else 0
+            validator = f"{BOOT_ID}|{request.full_path}|{versions}|{window}"
+            etag = hashlib.sha1(validator.encode('utf-8')).hexdigest()[:24]
+            
+            if request.if_none_match:
+                fresh = request.if_none_match.contains_weak(etag)
+            else:
+                # Whole-second resolution: only trust If-Modified-Since once the last change is a second old
+                since = request.if_modified_since
+                fresh = (since is not None and time.time() - last_modified >= 1
+                         and int(last_modified) <= since.timestamp())
+            if fresh:
+                response = make_response('', 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200 or response.is_streamed:
+                    return response
+            response.set_etag(etag)
+            response.last_modified = datetime.fromtimestamp(int(last_modified), tz=timezone.utc)
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+    return decorator
 
 # UDP Receiver for seat signals
 class UDPReceiver:
@@ -98,10 +671,11 @@ class UDPReceiver:
             while self.running:
                 try:
                     data, addr = self.sock.recvfrom(1024)
+                    received_at = time.monotonic()
                     seat_no = data.decode().strip()
                     logger.info(f"Received seat signal: {seat_no}")
                     # Emit to all connected clients
-                    socketio.emit('seat_selected', {'seat_no': seat_no})
+                    publish_seat_selected(seat_no, 'udp', received_at)
                 except socket.timeout:
                     continue
                 except Exception as e:
@@ -116,6 +690,212 @@ class UDPReceiver:
 # Global UDP receiver instance
 udp_receiver = UDPReceiver()
 
+# Hex seat input (hardware keypads send seat numbers as hex)
+MIN_SEAT_NO = 1
+MAX_SEAT_NO = 245
+# Binary frames: 0xA5, count byte, then one byte per seat number
+HEX_BINARY_FRAME_MAGIC = 0xA5
+
+def parse_hex_seat(hex_value):
+    """Convert a hex seat value (e.g. '0x1A' or '1a') to a seat number.
+    Raises ValueError with a user-facing message if invalid or out of range."""
+    hex_value = str(hex_value or '').strip()
+    if not hex_value:
+        raise ValueError('Hex value is required')
+    hex_clean = hex_value.replace('0x', '').replace('0X', '')
+    try:
+        seat_no = int(hex_clean, 16)
+    except ValueError:
+        raise ValueError(f'Invalid hex value: {hex_value}')
+    if seat_no < MIN_SEAT_NO or seat_no > MAX_SEAT_NO:
+        raise ValueError(f'Seat number {seat_no} out of range ({MIN_SEAT_NO}-{MAX_SEAT_NO})')
+    return seat_no
+
+def ingest_hex_batch(entries, source='http'):
+    """Validate a batch of hex seat entries and emit the accepted ones in timestamp order.
+    Each entry is either a hex string or a dict with 'hex' and optional 'ts'.
+    Returns a summary with per-entry accept/reject results."""
+    received_at = time.monotonic()
+    results = []
+    accepted = []
+    for index, entry in enumerate(entries):
+        if isinstance(entry, dict):
+            hex_value = entry.get('hex', '')
+            ts = entry.get('ts')
+        else:
+            hex_value = entry
+            ts = None
+        try:
+            seat_no = parse_hex_seat(hex_value)
+        except ValueError as e:
+            results.append({'index': index, 'hex': hex_value, 'accepted': False, 'error': str(e)})
+            continue
+        result = {'index': index, 'hex': hex_value, 'accepted': True, 'seat_no': seat_no}
+        if ts is not None:
+            result['ts'] = ts
+        results.append(result)
+        accepted.append(result)
+
+    # Emit in press order; entries without a timestamp keep their batch position
+    def _sort_key(item):
+        try:
+            return (0, float(item['ts']), item['index'])
+        except (KeyError, TypeError, ValueError):
+            return (1, 0, item['index'])
+    for item in sorted(accepted, key=_sort_key):
+        publish_seat_selected(item['seat_no'], source, received_at)
+
+    summary = {
+        'accepted': len(accepted),
+        'rejected': len(results) - len(accepted),
+        'results': results
+    }
+    logger.info(f"Hex batch from {source}: {summary['accepted']} accepted, {summary['rejected']} rejected")
+    return summary
+
+def decode_hex_packet(data):
+    """Decode a raw hex listener packet into a list of entries.
+    Text packets hold hex tokens separated by whitespace or commas; binary
+    packets start with HEX_BINARY_FRAME_MAGIC and carry one seat byte each."""
+    if data and data[0] == HEX_BINARY_FRAME_MAGIC:
+        count = data[1] if len(data) > 1 else 0
+        seats = data[2:2 + count]
+        entries = [f"0x{b:02X}" for b in seats]
+        # A short frame is reported as rejected entries rather than dropped silently
+        entries.extend([''] * (count - len(seats)))
+        return entries
+    text = data.decode('ascii', errors='replace')
+    return [token for token in text.replace(',', ' ').split() if token]
+
+def format_hex_ack(summary):
+    """Plain-text per-batch acknowledgement sent back to raw socket clients."""
+    errors = ';'.join(f"{r['index']}:{r['error']}" for r in summary['results'] if not r['accepted'])
+    ack = f"ACK accepted={summary['accepted']} rejected={summary['rejected']}"
+    if errors:
+        ack += f" errors={errors}"
+    return (ack + "\n").encode('ascii', errors='replace')
+
+class HexSeatListener:
+    """Raw TCP/UDP listener for hex seat input, bypassing HTTP and JSON.
+    UDP: each datagram is one batch. TCP: each newline-terminated line (or
+    binary frame) is one batch. Every batch is acknowledged with an ACK line."""
+    def __init__(self, host='127.0.0.1', port=65433):
+        self.host = host
+        self.port = port
+        self.udp_sock = None
+        self.tcp_sock = None
+        self.running = False
+        self.threads = []
+
+    def start(self):
+        """Start the UDP and TCP listener threads."""
+        if self.running:
+            return
+        self.running = True
+        self.threads = [
+            threading.Thread(target=self._listen_udp, daemon=True),
+            threading.Thread(target=self._listen_tcp, daemon=True),
+        ]
+        for thread in self.threads:
+            thread.start()
+        logger.info(f"Hex seat listener started on {self.host}:{self.port} (TCP/UDP)")
+
+    def stop(self):
+        """Stop the hex listener."""
+        self.running = False
+        for sock in (self.udp_sock, self.tcp_sock):
+            if sock:
+                try:
+                    sock.close()
+                except:
+                    pass
+        logger.info("Hex seat listener stopped")
+
+    def _listen_udp(self):
+        """Handle hex datagrams; each datagram is one batch."""
+        try:
+            self.udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.udp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.udp_sock.settimeout(1.0)
+            self.udp_sock.bind((self.host, self.port))
+
+            while self.running:
+                try:
+                    data, addr = self.udp_sock.recvfrom(4096)
+                    summary = ingest_hex_batch(decode_hex_packet(data), source=f"udp:{addr[0]}")
+                    self.udp_sock.sendto(format_hex_ack(summary), addr)
+                except socket.timeout:
+                    continue
+                except Exception as e:
+                    if self.running:
+                        logger.error(f"Hex UDP receive error: {e}")
+        except Exception as e:
+            logger.error(f"Hex UDP socket error: {e}")
+        finally:
+            if self.udp_sock:
+                self.udp_sock.close()
+
+    def _listen_tcp(self):
+        """Accept persistent TCP connections from keypads and simulators."""
+        try:
+            self.tcp_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.tcp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.tcp_sock.settimeout(1.0)
+            self.tcp_sock.bind((self.host, self.port))
+            self.tcp_sock.listen(16)
+
+            while self.running:
+                try:
+                    conn, addr = self.tcp_sock.accept()
+                except socket.timeout:
+                    continue
+                threading.Thread(target=self._handle_tcp_client, args=(conn, addr), daemon=True).start()
+        except Exception as e:
+            if self.running:
+                logger.error(f"Hex TCP socket error: {e}")
+        finally:
+            if self.tcp_sock:
+                self.tcp_sock.close()
+
+    def _handle_tcp_client(self, conn, addr):
+        """Read line- or frame-delimited batches from one TCP client."""
+        buffer = b''
+        conn.settimeout(1.0)
+        try:
+            while self.running:
+                try:
+                    chunk = conn.recv(4096)
+                except socket.timeout:
+                    continue
+                if not chunk:
+                    break
+                buffer += chunk
+                while buffer:
+                    if buffer[0] == HEX_BINARY_FRAME_MAGIC:
+                        if len(buffer) < 2 or len(buffer) < 2 + buffer[1]:
+                            break
+                        frame_len = 2 + buffer[1]
+                        packet, buffer = buffer[:frame_len], buffer[frame_len:]
+                    elif b'\n' in buffer:
+                        packet, buffer = buffer.split(b'\n', 1)
+                        if not packet.strip():
+                            continue
+                    else:
+                        break
+                    summary = ingest_hex_batch(decode_hex_packet(packet), source=f"tcp:{addr[0]}")
+                    conn.sendall(format_hex_ack(summary))
+        except Exception as e:
+            if self.running:
+                logger.error(f"Hex TCP client error ({addr[0]}): {e}")
+        finally:
+            conn.close()
+
+# Global hex listener instance
+hex_listener = HexSeatListener(
+    host=os.getenv('HEX_LISTENER_HOST', '127.0.0.1'),
+    port=int(os.getenv('HEX_LISTENER_PORT', '65433'))
+)
+
 # Hindi Translation Setup
 try:
     from deep_translator import GoogleTranslator
@@ -184,6 +964,7 @@ def migrate_chairperson_positions():
             cursor.execute(sql[0])
         
         connection.commit()
+        bump_data_version('chairpersons')
         logger.info("Chairperson positions migrated to new naming convention")
     except mysql.connector.Error as err:
         logger.warning(f"Position migration (may already be done): {err}")
@@ -275,6 +1056,8 @@ def get_member_by_seat(seat_no):
                     """
                     cursor.execute(update_query, (name_hindi, party_hindi, state_hindi, seat_no))
                     connection.commit()
+                    if cursor.rowcount:
+                        bump_data_version('parliament_seats')
                 except:
                     pass  # Ignore caching errors
         
@@ -285,74 +1068,156 @@ def get_member_by_seat(seat_no):
     finally:
         connection.close()
 
-def get_chairpersons():
-    """Get list of chairpersons from the chairpersons table with photos from parliament_seats."""
+# Tables carrying an indexed name_key column (see name_matching.name_key) -> primary key
+NAME_KEY_TABLES = {'parliament_seats': 'seat_no', 'chairpersons': 'id'}
+name_key_tables_ready = set()
+
+def ensure_name_keys(connection, table):
+    """Add the indexed name_key column to `table` and fill missing or stale keys
+    (rows written by the import tools or older builds), once per process.
+    Returns False if the table does not exist yet."""
+    if table in name_key_tables_ready:
+        return True
+    cursor = connection.cursor()
+    add_name_key_column(cursor, table)
+    try:
+        updated = sync_name_keys(cursor, table, NAME_KEY_TABLES[table])
+    except mysql.connector.Error as err:
+        if err.errno == 1146:
+            return False
+        raise
+    connection.commit()
+    if updated:
+        logger.info(f"Filled name_key for {updated} {table} rows")
+    name_key_tables_ready.add(table)
+    return True
+
+# Chairperson roster, served from query_cache until the chairpersons or parliament_seats
+# data version moves. Photos are referenced by URL (/api/chairperson/<id>/photo).
+CHAIRPERSON_ORDER_SQL = """
+    CASE c.position 
+        WHEN 'Chairman' THEN 1 
+        WHEN 'Chairperson' THEN 1 
+        WHEN 'Deputy Chairman' THEN 2 
+        WHEN 'Deputy-Chairman' THEN 2 
+        WHEN 'Vice-Chairperson' THEN 2 
+        WHEN 'Vice Chairperson' THEN 2 
+        ELSE 3 
+    END, 
+    c.name
+"""
+# A chairperson's own photo, else the photo of the seat they are linked to
+CHAIRPERSON_PHOTO_SQL = "COALESCE(NULLIF(c.picture, ''), ps.picture)"
+
+chairperson_schema_ready = False
+
+def ensure_chairperson_schema(connection):
+    """Add the picture, name_key, seat_no and seat_explicit columns to chairpersons,
+    once per process. Returns False if the chairpersons table does not exist yet."""
+    global chairperson_schema_ready
+    if chairperson_schema_ready:
+        return True
+    if not ensure_name_keys(connection, 'chairpersons'):
+        return False
+    ensure_name_keys(connection, 'parliament_seats')
+    cursor = connection.cursor()
+    for statement in [
+        "ALTER TABLE chairpersons ADD COLUMN picture LONGBLOB",
+        "ALTER TABLE chairpersons ADD COLUMN seat_no INT NULL",
+        # 1 = seat_no was set by an operator; 0 = linked by name_key and re-checked on every roster load
+        "ALTER TABLE chairpersons ADD COLUMN seat_explicit TINYINT(1) NOT NULL DEFAULT 0",
+        "CREATE INDEX idx_chairpersons_seat_no ON chairpersons (seat_no)"
+    ]:
+        try:
+            cursor.execute(statement)
+        except mysql.connector.Error:
+            pass  # column/index already exists
+    chairperson_schema_ready = True
+    return True
+
+def link_chairperson_seats(connection):
+    """Link chairpersons without a seat_no to the one seat sharing their name_key.
+    Name-based links whose seat or chairperson has since been renamed are cleared
+    first; explicit links are left alone. Names shared by several seats (e.g.
+    VACANT) are left unlinked."""
+    cursor = connection.cursor()
+    cursor.execute("""
+        UPDATE chairpersons c
+        LEFT JOIN parliament_seats ps ON ps.seat_no = c.seat_no
+        SET c.seat_no = NULL
+        WHERE c.seat_no IS NOT NULL AND c.seat_explicit = 0
+          AND (ps.name_key IS NULL OR ps.name_key <> c.name_key)
+    """)
+    unlinked = cursor.rowcount
+    cursor.execute("""
+        UPDATE chairpersons c
+        JOIN (
+            SELECT name_key, MIN(seat_no) AS seat_no FROM parliament_seats
+            WHERE name_key IS NOT NULL AND name_key <> ''
+            GROUP BY name_key HAVING COUNT(*) = 1
+        ) ps ON ps.name_key = c.name_key
+        SET c.seat_no = ps.seat_no
+        WHERE c.seat_no IS NULL AND c.seat_explicit = 0
+    """)
+    connection.commit()
+    return unlinked + cursor.rowcount
+
+def load_chairperson_roster(connection):
+    """Query the roster with photo URLs; blobs are hashed in MySQL, never transferred."""
+    link_chairperson_seats(connection)
+    cursor = connection.cursor(dictionary=True)
+    cursor.execute(f"""
+        SELECT c.id, c.position, c.name, c.seat_no,
+               LEFT(MD5({CHAIRPERSON_PHOTO_SQL}), 12) AS photo_hash
+        FROM chairpersons c
+        LEFT JOIN parliament_seats ps ON ps.seat_no = c.seat_no
+        ORDER BY {CHAIRPERSON_ORDER_SQL}
+    """)
+    roster = []
+    for row in cursor.fetchall():
+        photo_hash = row.pop('photo_hash')
+        # The hash in the URL changes with the photo, so the image itself can be cached for good
+        row['picture'] = f"/api/chairperson/{row['id']}/photo?v={photo_hash}" if photo_hash else None
+        roster.append(row)
+    return roster
+
+def query_chairpersons():
+    """Load the chairperson roster; None if the query failed."""
     connection = get_db_connection()
     if not connection:
-        return []
+        return None
     
     try:
+        if ensure_chairperson_schema(connection):
+            return load_chairperson_roster(connection)
+        # Fallback to old on_the_chair table
         cursor = connection.cursor(dictionary=True)
-        
-        # Ensure picture column exists in chairpersons table
-        try:
-            cursor.execute("ALTER TABLE chairpersons ADD COLUMN picture LONGBLOB")
-            connection.commit()
-            logger.info("Added picture column to chairpersons table")
-        except:
-            pass  # Column already exists
-        
-        # Try new chairpersons table first, join with parliament_seats for photos
-        try:
-            cursor.execute("""
-                SELECT c.id, c.position, c.name, c.picture as chair_picture, ps.picture as mp_picture
-                FROM chairpersons c
-                LEFT JOIN parliament_seats ps ON LOWER(TRIM(c.name)) = LOWER(TRIM(ps.name))
-                ORDER BY 
-                    CASE c.position 
-                        WHEN 'Chairman' THEN 1 
-                        WHEN 'Chairperson' THEN 1 
-                        WHEN 'Deputy Chairman' THEN 2 
-                        WHEN 'Deputy-Chairman' THEN 2 
-                        WHEN 'Vice-Chairperson' THEN 2 
-                        WHEN 'Vice Chairperson' THEN 2 
-                        ELSE 3 
-                    END, 
-                    c.name
-            """)
-            results = cursor.fetchall()
-            
-            # Convert pictures to base64 and prefer chair_picture over mp_picture
-            import base64
-            for result in results:
-                picture = result.get('chair_picture') or result.get('mp_picture')
-                if picture:
-                    result['picture'] = base64.b64encode(picture).decode('utf-8')
-                else:
-                    result['picture'] = None
-                # Clean up intermediate fields
-                if 'chair_picture' in result:
-                    del result['chair_picture']
-                if 'mp_picture' in result:
-                    del result['mp_picture']
-            
-            return results
-        except Exception as e:
-            logger.error(f"Error fetching chairpersons with photos: {e}")
-            # Fallback to old on_the_chair table
-            cursor.execute("SELECT position, name FROM on_the_chair")
-            return cursor.fetchall()
+        cursor.execute("SELECT position, name FROM on_the_chair")
+        return cursor.fetchall()
     except mysql.connector.Error as err:
         logger.error(f"Database query error: {err}")
-        return []
+        return None
     finally:
         connection.close()
 
-def get_running_bills():
-    """Get list of running bills."""
+def get_chairpersons():
+    """Get list of chairpersons (photo URLs included), cached until a chairperson or member write."""
+    return query_cache.get('chairpersons', (), ('chairpersons', 'parliament_seats'), query_chairpersons) or []
+
+def image_mimetype(data):
+    """Guess an uploaded photo's type from its magic bytes (uploads are usually JPEG)."""
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return 'image/png'
+    if data[:4] == b'GIF8':
+        return 'image/gif'
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'image/webp'
+    return 'image/jpeg'
+
+def query_running_bills():
     connection = get_db_connection()
     if not connection:
-        return []
+        return None
     
     try:
         cursor = connection.cursor(dictionary=True)
@@ -360,15 +1225,18 @@ def get_running_bills():
         return cursor.fetchall()
     except mysql.connector.Error as err:
         logger.error(f"Database query error: {err}")
-        return []
+        return None
     finally:
         connection.close()
 
-def get_all_members():
-    """Get all parliament members."""
+def get_running_bills():
+    """Get list of running bills."""
+    return query_cache.get('bills/running', (), ('bill_details',), query_running_bills) or []
+
+def query_all_members():
     connection = get_db_connection()
     if not connection:
-        return []
+        return None
     
     try:
         cursor = connection.cursor(dictionary=True)
@@ -376,61 +1244,177 @@ def get_all_members():
         return cursor.fetchall()
     except mysql.connector.Error as err:
         logger.error(f"Database query error: {err}")
-        return []
+        return None
     finally:
         connection.close()
 
+def get_all_members():
+    """Get all parliament members."""
+    return query_cache.get('members', (), ('parliament_seats',), query_all_members) or []
+
+# ============ RESPONSE COMPRESSION ============
+
+# API responses above COMPRESS_MIN_SIZE bytes are gzip/brotli-compressed per
+# Accept-Encoding. React dist files are precompressed once (.gz/.br next to
+# each file) and the matching variant is sent as-is.
+COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', '1024'))
+COMPRESS_GZIP_LEVEL = 6
+COMPRESS_BROTLI_QUALITY = 5      # per-response; precompressed assets use the maximum
+COMPRESSIBLE_MIMETYPES = {
+    'application/json', 'application/javascript', 'text/javascript', 'text/html', 'text/css',
+    'text/plain', 'text/csv', 'image/svg+xml', 'application/manifest+json',
+}
+PRECOMPRESS_EXTENSIONS = ('.js', '.mjs', '.css', '.html', '.svg', '.json', '.map', '.txt', '.ico', '.webmanifest')
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+def accepted_encoding():
+    """Best encoding the client accepts: 'br', 'gzip' or None."""
+    offered = ['br', 'gzip'] if BROTLI_AVAILABLE else ['gzip']
+    return request.accept_encodings.best_match(offered)
+
+@app.after_request
+def compress_response(response):
+    """Compress buffered API/text responses; files and streamed exports pass through."""
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = accepted_encoding()
+    if not encoding or response.content_length is None or response.content_length < COMPRESS_MIN_SIZE:
+        return response
+    
+    import gzip
+    data = response.get_data()
+    if encoding == 'br':
+        response.set_data(brotli.compress(data, quality=COMPRESS_BROTLI_QUALITY))
+    else:
+        response.set_data(gzip.compress(data, compresslevel=COMPRESS_GZIP_LEVEL))
+    response.headers['Content-Encoding'] = encoding
+    # The compressed bytes differ from the identity ones, so the validator becomes weak
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+def precompress_react_dist(dist_dir=None):
+    """Write .gz (and .br) next to every compressible dist file that lacks an up-to-date one.
+    Returns the number of files written; read-only installs are skipped."""
+    import gzip
+    dist_dir = dist_dir or REACT_DIST_DIR
+    written = 0
+    for root, _, files in os.walk(dist_dir):
+        for filename in files:
+            if not filename.endswith(PRECOMPRESS_EXTENSIONS):
+                continue
+            path = os.path.join(root, filename)
+            if os.path.getsize(path) < COMPRESS_MIN_SIZE:
+                continue
+            variants = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+            if BROTLI_AVAILABLE:
+                variants.append(('.br', lambda data: brotli.compress(data, quality=11)))
+            data = None
+            for suffix, compress in variants:
+                target = path + suffix
+                if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(path):
+                    continue
+                if data is None:
+                    with open(path, 'rb') as source:
+                        data = source.read()
+                # Per-process temp name: the reloader's watcher process may run this too
+                temp_path = f"{target}.{os.getpid()}.tmp"
+                try:
+                    with open(temp_path, 'wb') as output:
+                        output.write(compress(data))
+                    os.replace(temp_path, target)
+                    written += 1
+                except OSError as e:
+                    logger.warning(f"Cannot precompress {path}: {e}")
+                    return written
+    if written:
+        logger.info(f"Precompressed {written} React dist files")
+    return written
+
+def send_react_file(asset_path):
+    """Send a React dist file, preferring its precompressed .br/.gz variant."""
+    import mimetypes
+    path = os.path.join(REACT_DIST_DIR, asset_path)
+    encoding = accepted_encoding()
+    for candidate in ([encoding] + (['gzip'] if encoding == 'br' else [])) if encoding else []:
+        suffix = '.br' if candidate == 'br' else '.gz'
+        variant = path + suffix
+        if os.path.isfile(variant) and os.path.getmtime(variant) >= os.path.getmtime(path):
+            mimetype = mimetypes.guess_type(asset_path)[0] or 'application/octet-stream'
+            response = send_from_directory(REACT_DIST_DIR, asset_path + suffix, mimetype=mimetype)
+            response.headers['Content-Encoding'] = candidate
+            response.vary.add('Accept-Encoding')
+            return response
+    response = send_from_directory(REACT_DIST_DIR, asset_path)
+    if asset_path.endswith(PRECOMPRESS_EXTENSIONS):
+        response.vary.add('Accept-Encoding')
+    return response
+
 # Flask Routes
 @app.route('/')
 def index():
     """Main dashboard page."""
     if os.path.exists(os.path.join(REACT_DIST_DIR, 'index.html')):
-        return send_from_directory(REACT_DIST_DIR, 'index.html')
+        return send_react_file('index.html')
     return render_template('index.html')
 
 @app.route('/zero-hour')
 def zero_hour():
     """Zero Hour page."""
     if os.path.exists(os.path.join(REACT_DIST_DIR, 'index.html')):
-        return send_from_directory(REACT_DIST_DIR, 'index.html')
+        return send_react_file('index.html')
     return render_template('zero_hour.html')
 
 @app.route('/member-speaking')
 def member_speaking():
     """Member Speaking page."""
     if os.path.exists(os.path.join(REACT_DIST_DIR, 'index.html')):
-        return send_from_directory(REACT_DIST_DIR, 'index.html')
+        return send_react_file('index.html')
     return render_template('member_speaking.html')
 
 @app.route('/bill-discussions')
 def bill_discussions():
     """Bill Discussions page."""
     if os.path.exists(os.path.join(REACT_DIST_DIR, 'index.html')):
-        return send_from_directory(REACT_DIST_DIR, 'index.html')
+        return send_react_file('index.html')
     return render_template('bill_discussions.html')
 
 # API Routes
 @app.route('/api/member/<seat_no>')
+@versioned_get('parliament_seats')
 def api_get_member(seat_no):
     """API endpoint to get member details."""
     member = get_member_by_seat(seat_no)
+    # Clients pass the seat_selected trace id so lookup latency can be measured
+    stamp_latency(request.args.get('trace'), 'lookup')
     if member:
         return jsonify({'success': True, 'data': member})
     return jsonify({'success': False, 'error': 'Member not found'}), 404
 
 @app.route('/api/chairpersons')
+@versioned_get('chairpersons', 'parliament_seats')
 def api_get_chairpersons():
     """API endpoint to get chairpersons list."""
     chairpersons = get_chairpersons()
     return jsonify({'success': True, 'data': chairpersons})
 
 @app.route('/api/bills/running')
+@versioned_get('bill_details')
 def api_get_running_bills():
     """API endpoint to get running bills."""
     bills = get_running_bills()
     return jsonify({'success': True, 'data': bills})
 
 @app.route('/api/members')
+@versioned_get('parliament_seats')
 def api_get_all_members():
     """API endpoint to get all members."""
     members = get_all_members()
@@ -455,6 +1439,7 @@ def api_add_bill():
         query = "INSERT INTO bill_details (tabled_date, bill_name, status) VALUES (%s, %s, %s)"
         cursor.execute(query, (tabled_date, bill_name, 'Running'))
         connection.commit()
+        bump_data_version('bill_details')
         return jsonify({'success': True, 'message': 'Bill added successfully'})
     except mysql.connector.Error as err:
         # If columns are missing (e.g., allotted_seconds/spoken_seconds), try to add them once and retry insert
@@ -522,28 +1507,33 @@ def api_login():
 @app.route('/api/hex-seat', methods=['POST'])
 def api_hex_seat():
     """API endpoint to receive seat number in hex format."""
+    received_at = time.monotonic()
     data = request.get_json()
     hex_value = data.get('hex', '').strip()
     
-    if not hex_value:
-        return jsonify({'success': False, 'error': 'Hex value is required'}), 400
-    
     try:
-        # Convert hex to decimal seat number
-        # Remove '0x' prefix if present
-        hex_clean = hex_value.replace('0x', '').replace('0X', '')
-        seat_no = int(hex_clean, 16)
-        
-        if seat_no < 1 or seat_no > 245:
-            return jsonify({'success': False, 'error': f'Seat number {seat_no} out of range (1-245)'}), 400
-        
-        # Broadcast to all connected clients
-        socketio.emit('seat_selected', {'seat_no': str(seat_no)})
-        logger.info(f"Hex seat received: {hex_value} -> Seat {seat_no}")
-        
-        return jsonify({'success': True, 'seat_no': seat_no, 'hex': hex_value})
+        seat_no = parse_hex_seat(hex_value)
     except ValueError as e:
-        return jsonify({'success': False, 'error': f'Invalid hex value: {hex_value}'}), 400
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    # Broadcast to all connected clients
+    publish_seat_selected(seat_no, 'http', received_at)
+    logger.info(f"Hex seat received: {hex_value} -> Seat {seat_no}")
+
+    return jsonify({'success': True, 'seat_no': seat_no, 'hex': hex_value})
+
+@app.route('/api/hex-seat/batch', methods=['POST'])
+def api_hex_seat_batch():
+    """API endpoint to receive many timestamped hex seat values in one request.
+    Body: {"entries": [{"hex": "0x1A", "ts": 1700000000.123}, ...]} or a bare list."""
+    data = request.get_json(silent=True)
+    entries = data.get('entries') if isinstance(data, dict) else data
+
+    if not isinstance(entries, list) or not entries:
+        return jsonify({'success': False, 'error': 'A non-empty entries list is required'}), 400
+
+    summary = ingest_hex_batch(entries, source='http')
+    return jsonify({'success': True, **summary})
 
 @app.route('/api/member', methods=['POST'])
 def api_add_member():
@@ -592,22 +1582,24 @@ def api_add_member():
             return jsonify({'success': False, 'error': 'Database connection failed'}), 500
         
         try:
+            ensure_name_keys(connection, 'parliament_seats')
             cursor = connection.cursor()
             
             if picture_data:
                 query = """
-                    INSERT INTO parliament_seats (seat_no, name, name_hindi, party, party_hindi, state, state_hindi, tenure_start, picture)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    INSERT INTO parliament_seats (seat_no, name, name_key, name_hindi, party, party_hindi, state, state_hindi, tenure_start, picture)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """
-                cursor.execute(query, (seat_no, name, name_hindi, party, party_hindi, state, state_hindi, tenure_start, picture_data))
+                cursor.execute(query, (seat_no, name, name_key(name), name_hindi, party, party_hindi, state, state_hindi, tenure_start, picture_data))
             else:
                 query = """
-                    INSERT INTO parliament_seats (seat_no, name, name_hindi, party, party_hindi, state, state_hindi, tenure_start)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    INSERT INTO parliament_seats (seat_no, name, name_key, name_hindi, party, party_hindi, state, state_hindi, tenure_start)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """
-                cursor.execute(query, (seat_no, name, name_hindi, party, party_hindi, state, state_hindi, tenure_start))
+                cursor.execute(query, (seat_no, name, name_key(name), name_hindi, party, party_hindi, state, state_hindi, tenure_start))
             
             connection.commit()
+            bump_data_version('parliament_seats')
             logger.info(f"Added member: Seat {seat_no} - {name} ({name_hindi})")
             return jsonify({'success': True, 'message': 'Member added successfully'})
         except mysql.connector.Error as err:
@@ -665,26 +1657,28 @@ def api_update_member(seat_no):
             return jsonify({'success': False, 'error': 'Database connection failed'}), 500
         
         try:
+            ensure_name_keys(connection, 'parliament_seats')
             cursor = connection.cursor()
             
             if picture_data:
                 query = """
                     UPDATE parliament_seats 
-                    SET name = %s, name_hindi = %s, party = %s, party_hindi = %s, 
+                    SET name = %s, name_key = %s, name_hindi = %s, party = %s, party_hindi = %s, 
                         state = %s, state_hindi = %s, tenure_start = %s, picture = %s
                     WHERE seat_no = %s
                 """
-                cursor.execute(query, (name, name_hindi, party, party_hindi, state, state_hindi, tenure_start, picture_data, seat_no))
+                cursor.execute(query, (name, name_key(name), name_hindi, party, party_hindi, state, state_hindi, tenure_start, picture_data, seat_no))
             else:
                 query = """
                     UPDATE parliament_seats 
-                    SET name = %s, name_hindi = %s, party = %s, party_hindi = %s, 
+                    SET name = %s, name_key = %s, name_hindi = %s, party = %s, party_hindi = %s, 
                         state = %s, state_hindi = %s, tenure_start = %s
                     WHERE seat_no = %s
                 """
-                cursor.execute(query, (name, name_hindi, party, party_hindi, state, state_hindi, tenure_start, seat_no))
+                cursor.execute(query, (name, name_key(name), name_hindi, party, party_hindi, state, state_hindi, tenure_start, seat_no))
             
             connection.commit()
+            bump_data_version('parliament_seats')
             logger.info(f"Updated member: Seat {seat_no} - {name} ({name_hindi})")
             return jsonify({'success': True, 'message': 'Member updated successfully'})
         except mysql.connector.Error as err:
@@ -707,6 +1701,7 @@ def api_delete_member(seat_no):
         cursor = connection.cursor()
         cursor.execute("DELETE FROM parliament_seats WHERE seat_no = %s", (seat_no,))
         connection.commit()
+        bump_data_version('parliament_seats')
         
         if cursor.rowcount > 0:
             logger.info(f"Deleted member: Seat {seat_no}")
@@ -727,21 +1722,24 @@ def api_set_vacant(seat_no):
         return jsonify({'success': False, 'error': 'Database connection failed'}), 500
     
     try:
+        ensure_name_keys(connection, 'parliament_seats')
         cursor = connection.cursor()
+        vacant_key = name_key('VACANT')
         
         # Check if seat exists
         cursor.execute("SELECT seat_no FROM parliament_seats WHERE seat_no = %s", (seat_no,))
         if not cursor.fetchone():
             # Create the vacant seat if it doesn't exist
             cursor.execute("""
-                INSERT INTO parliament_seats (seat_no, name, name_hindi, party, party_hindi, state, state_hindi, tenure_start, picture)
-                VALUES (%s, 'VACANT', 'रिक्त', '-', '-', '-', '-', NULL, NULL)
-            """, (seat_no,))
+                INSERT INTO parliament_seats (seat_no, name, name_key, name_hindi, party, party_hindi, state, state_hindi, tenure_start, picture)
+                VALUES (%s, 'VACANT', %s, 'रिक्त', '-', '-', '-', '-', NULL, NULL)
+            """, (seat_no, vacant_key))
         else:
             # Update existing seat to vacant
             cursor.execute("""
                 UPDATE parliament_seats 
                 SET name = 'VACANT',
+                    name_key = %s,
                     name_hindi = 'रिक्त',
                     party = '-',
                     party_hindi = '-',
@@ -750,9 +1748,10 @@ def api_set_vacant(seat_no):
                     tenure_start = NULL,
                     picture = NULL
                 WHERE seat_no = %s
-            """, (seat_no,))
+            """, (vacant_key, seat_no))
         
         connection.commit()
+        bump_data_version('parliament_seats')
         logger.info(f"Set seat {seat_no} as VACANT")
         return jsonify({'success': True, 'message': f'Seat {seat_no} marked as vacant'})
     except mysql.connector.Error as err:
@@ -777,12 +1776,16 @@ def api_add_chairperson():
         if request.content_type and 'multipart/form-data' in request.content_type:
             name = request.form.get('name', '').strip()
             position = request.form.get('position', '').strip()
+            seat_no = request.form.get('seat_no', '').strip()
             picture = request.files.get('picture')
         else:
             data = request.get_json()
             name = data.get('name', '').strip()
             position = data.get('position', '').strip()
+            seat_no = str(data.get('seat_no') or '').strip()
             picture = None
+        # Optional explicit link to the member's seat; otherwise linked by name_key
+        seat_no = int(seat_no) if seat_no.isdigit() else None
         
         if not name or not position:
             return jsonify({'success': False, 'error': 'Name and position are required'}), 400
@@ -799,26 +1802,21 @@ def api_add_chairperson():
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-        
-        # Add picture column if it doesn't exist
-        try:
-            cursor.execute("ALTER TABLE chairpersons ADD COLUMN picture LONGBLOB")
-            connection.commit()
-        except:
-            pass  # Column already exists
+        ensure_chairperson_schema(connection)
         
         if picture:
             picture_data = picture.read()
             cursor.execute(
-                "INSERT INTO chairpersons (name, position, picture) VALUES (%s, %s, %s)",
-                (name, position, picture_data)
+                "INSERT INTO chairpersons (name, name_key, position, seat_no, seat_explicit, picture) VALUES (%s, %s, %s, %s, %s, %s)",
+                (name, name_key(name), position, seat_no, seat_no is not None, picture_data)
             )
         else:
             cursor.execute(
-                "INSERT INTO chairpersons (name, position) VALUES (%s, %s)",
-                (name, position)
+                "INSERT INTO chairpersons (name, name_key, position, seat_no, seat_explicit) VALUES (%s, %s, %s, %s, %s)",
+                (name, name_key(name), position, seat_no, seat_no is not None)
             )
         connection.commit()
+        bump_data_version('chairpersons')
         logger.info(f"Added chairperson: {position} - {name}")
         return jsonify({'success': True, 'message': 'Chairperson added successfully', 'id': cursor.lastrowid})
     except mysql.connector.Error as err:
@@ -839,37 +1837,39 @@ def api_update_chairperson(id):
         if request.content_type and 'multipart/form-data' in request.content_type:
             name = request.form.get('name', '').strip()
             position = request.form.get('position', '').strip()
+            seat_given = 'seat_no' in request.form
+            seat_no = request.form.get('seat_no', '').strip()
             picture = request.files.get('picture')
         else:
             data = request.get_json()
             name = data.get('name', '').strip()
             position = data.get('position', '').strip()
+            seat_given = 'seat_no' in data
+            seat_no = str(data.get('seat_no') or '').strip()
             picture = None
+        # Optional explicit link to the member's seat; an empty seat_no reverts to
+        # linking by name_key, and an omitted one keeps the current link
+        seat_no = int(seat_no) if seat_no.isdigit() else None
         
         if not name or not position:
             return jsonify({'success': False, 'error': 'Name and position are required'}), 400
         
         cursor = connection.cursor()
         
-        # Ensure picture column exists
-        try:
-            cursor.execute("ALTER TABLE chairpersons ADD COLUMN picture LONGBLOB")
-            connection.commit()
-        except:
-            pass  # Column already exists
+        ensure_chairperson_schema(connection)
         
+        # A renamed chairperson without an explicit seat is re-linked by name_key
+        assignments = ["name = %s", "name_key = %s", "position = %s"]
+        params = [name, name_key(name), position]
+        if seat_given:
+            assignments += ["seat_no = %s", "seat_explicit = %s"]
+            params += [seat_no, seat_no is not None]
         if picture:
-            picture_data = picture.read()
-            cursor.execute(
-                "UPDATE chairpersons SET name = %s, position = %s, picture = %s WHERE id = %s",
-                (name, position, picture_data, id)
-            )
-        else:
-            cursor.execute(
-                "UPDATE chairpersons SET name = %s, position = %s WHERE id = %s",
-                (name, position, id)
-            )
+            assignments.append("picture = %s")
+            params.append(picture.read())
+        cursor.execute(f"UPDATE chairpersons SET {', '.join(assignments)} WHERE id = %s", params + [id])
         connection.commit()
+        bump_data_version('chairpersons')
         
         if cursor.rowcount > 0:
             logger.info(f"Updated chairperson: {id} - {position} - {name}")
@@ -893,6 +1893,7 @@ def api_delete_chairperson(id):
         cursor = connection.cursor()
         cursor.execute("DELETE FROM chairpersons WHERE id = %s", (id,))
         connection.commit()
+        bump_data_version('chairpersons')
         
         if cursor.rowcount > 0:
             logger.info(f"Deleted chairperson: {id}")
@@ -905,52 +1906,291 @@ def api_delete_chairperson(id):
     finally:
         connection.close()
 
-# ============ ACTIVITY LOG API ENDPOINTS ============
-
-@app.route('/api/activity-logs')
-def api_get_activity_logs():
-    """API endpoint to get all activity logs."""
+@app.route('/api/chairperson/<int:id>/photo')
+def api_get_chairperson_photo(id):
+    """API endpoint to get a chairperson's photo (their own, else their linked seat's photo)."""
     connection = get_db_connection()
     if not connection:
         return jsonify({'success': False, 'error': 'Database connection failed'}), 500
     
     try:
-        cursor = connection.cursor(dictionary=True)
-        
-        # Create table if not exists
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS activity_logs (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                activity_type VARCHAR(50) NOT NULL,
-                member_name VARCHAR(255),
-                chairperson VARCHAR(255),
-                start_time DATETIME NOT NULL,
-                end_time DATETIME,
-                duration_seconds INT DEFAULT 0,
-                bill_name VARCHAR(255),
-                notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Get filters from query params
-        date_filter = request.args.get('date', None)
-        activity_type = request.args.get('activity_type', None)
-        fetch_all = str(request.args.get('all', '')).lower() in ('1', 'true', 'yes', 'all')
-
-        if date_filter:
+        cursor = connection.cursor()
+        cursor.execute(f"""
+            SELECT {CHAIRPERSON_PHOTO_SQL}
+            FROM chairpersons c
+            LEFT JOIN parliament_seats ps ON ps.seat_no = c.seat_no
+            WHERE c.id = %s
+        """, (id,))
+        row = cursor.fetchone()
+        if not row or not row[0]:
+            return jsonify({'success': False, 'error': 'Photo not found'}), 404
+        photo = bytes(row[0])
+        response = Response(photo, mimetype=image_mimetype(photo))
+        # Roster URLs carry a content hash (?v=), so a versioned URL never changes meaning
+        if request.args.get('v'):
+            response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+        else:
+            response.headers['Cache-Control'] = 'no-cache'
+        return response
+    except mysql.connector.Error as err:
+        logger.error(f"Database error: {err}")
+        return jsonify({'success': False, 'error': str(err)}), 500
+    finally:
+        connection.close()
+
+# ============ ACTIVITY LOG API ENDPOINTS ============
+
+ACTIVITY_LOG_PAGE_SIZE = 100
+ACTIVITY_LOG_MAX_PAGE_SIZE = 500
+ACTIVITY_LOG_COUNT_TTL = 60  # seconds; writes in this process invalidate sooner
+
+# Indexes backing keyset pagination on (start_time, id), created once per process
+activity_log_indexes_ready = False
+
+def ensure_activity_log_indexes(cursor):
+    """Add the (start_time, id) and (activity_type, start_time, id) indexes if missing."""
+    global activity_log_indexes_ready
+    if activity_log_indexes_ready:
+        return
+    for index_sql in [
+        "CREATE INDEX idx_activity_start_id ON activity_logs (start_time, id)",
+        "CREATE INDEX idx_activity_type_start_id ON activity_logs (activity_type, start_time, id)"
+    ]:
+        try:
+            cursor.execute(index_sql)
+        except mysql.connector.Error:
+            pass  # index already exists
+    activity_log_indexes_ready = True
+
+def encode_log_cursor(direction, log):
+    """Build an opaque page cursor from a log row's (start_time, id) key."""
+    import json
+    import base64
+    start_time = log['start_time']
+    if hasattr(start_time, 'strftime'):
+        start_time = start_time.strftime('%Y-%m-%d %H:%M:%S')
+    raw = json.dumps([direction, start_time, log['id']]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_log_cursor(token):
+    """Decode a page cursor into (direction, start_time, id). Raises ValueError if malformed."""
+    import json
+    import base64
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        direction, start_time, log_id = json.loads(raw)
+        datetime.strptime(start_time, '%Y-%m-%d %H:%M:%S')
+    except Exception:
+        raise ValueError('Invalid cursor')
+    if direction not in ('next', 'prev'):
+        raise ValueError('Invalid cursor')
+    return direction, start_time, int(log_id)
+
+def day_range(date_str):
+    """Return [start, end) datetimes for a YYYY-MM-DD date so filters stay index-friendly."""
+    day = datetime.strptime(date_str, '%Y-%m-%d')
+    return day, day + timedelta(days=1)
+
+# Cached COUNT(*) results keyed by (activity_type, date)
+activity_log_count_cache = {}
+activity_log_count_lock = threading.Lock()
+
+def invalidate_activity_log_counts():
+    """Drop cached log counts after any insert/delete on activity_logs."""
+    with activity_log_count_lock:
+        activity_log_count_cache.clear()
+
+# Streaming responses for large log reads: rows are pulled from an unbuffered
+# cursor in chunks and written out as they arrive, so memory stays flat.
+STREAM_CHUNK_ROWS = 500
+
+def get_stream_format():
+    """Return 'json' or 'ndjson' if the request asked for a streamed response, else None."""
+    value = str(request.args.get('stream', '')).lower()
+    if value in ('ndjson', 'jsonl'):
+        return 'ndjson'
+    if value in ('1', 'true', 'yes', 'json'):
+        return 'json'
+    return None
+
+def stream_log_rows(query, params, stream_format='json', iso_dates=False):
+    """Stream query results as one JSON document ({"data": [...], "success": true})
+    or as NDJSON lines, reading STREAM_CHUNK_ROWS rows at a time."""
+    import json
+    from decimal import Decimal
+
+    def encode_value(value):
+        if isinstance(value, datetime):
+            return value.isoformat() if iso_dates else value.strftime('%Y-%m-%d %H:%M:%S')
+        if isinstance(value, Decimal):
+            return int(value) if value == value.to_integral_value() else float(value)
+        if isinstance(value, (bytes, bytearray)):
+            return None
+        return str(value)
+
+    def generate():
+        connection = get_db_connection()
+        if not connection:
+            if stream_format == 'ndjson':
+                yield json.dumps({'success': False, 'error': 'Database connection failed'}) + "\n"
+            else:
+                yield json.dumps({'success': False, 'error': 'Database connection failed', 'data': []})
+            return
+        first = True
+        try:
+            if stream_format == 'json':
+                yield '{"data": ['
+            cursor = connection.cursor(dictionary=True, buffered=False)
+            cursor.execute(query, tuple(params))
+            while True:
+                rows = cursor.fetchmany(STREAM_CHUNK_ROWS)
+                if not rows:
+                    break
+                if stream_format == 'ndjson':
+                    yield ''.join(json.dumps(row, default=encode_value, ensure_ascii=False) + "\n" for row in rows)
+                else:
+                    parts = [json.dumps(row, default=encode_value, ensure_ascii=False) for row in rows]
+                    yield ('' if first else ', ') + ', '.join(parts)
+                    first = False
+            if stream_format == 'json':
+                yield '], "success": true}'
+        except mysql.connector.Error as err:
+            logger.error(f"Database error while streaming logs: {err}")
+            # Headers are already sent; report the failure in-band
+            if stream_format == 'ndjson':
+                yield json.dumps({'success': False, 'error': str(err)}) + "\n"
+            else:
+                yield '], "success": false, "error": ' + json.dumps(str(err)) + '}'
+        finally:
+            connection.close()
+
+    mimetype = 'application/x-ndjson' if stream_format == 'ndjson' else 'application/json'
+    return Response(stream_with_context(generate()), mimetype=mimetype)
+
+def fetch_activity_logs_page(cursor, activity_type, date_filter, limit, page_cursor):
+    """Keyset-paginated read ordered by (start_time, id) DESC.
+    Returns (rows, next_cursor, prev_cursor); cost is independent of table size."""
+    conditions = []
+    params = []
+    source = 'activity_logs'   # undated pages list the hot (unarchived) logs
+    if activity_type:
+        conditions.append("activity_type = %s")
+        params.append(activity_type)
+    if date_filter:
+        day_start, day_end = day_range(date_filter)
+        conditions.append("start_time >= %s AND start_time < %s")
+        params.extend([day_start, day_end])
+        source = activity_log_source(day_start, day_end)
+
+    direction = 'next'
+    if page_cursor:
+        direction, key_time, key_id = decode_log_cursor(page_cursor)
+        op = '<' if direction == 'next' else '>'
+        conditions.append(f"(start_time {op} %s OR (start_time = %s AND id {op} %s))")
+        params.extend([key_time, key_time, key_id])
+
+    order = 'DESC' if direction == 'next' else 'ASC'
+    query = f"SELECT * FROM {source}"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += f" ORDER BY start_time {order}, id {order} LIMIT %s"
+    params.append(limit + 1)
+    cursor.execute(query, tuple(params))
+    rows = cursor.fetchall()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if direction == 'prev':
+        rows.reverse()
+
+    next_cursor = prev_cursor = None
+    if rows:
+        # Going forward, more rows exist if we over-fetched; going back, we came from a later page
+        if (direction == 'next' and has_more) or direction == 'prev':
+            next_cursor = encode_log_cursor('next', rows[-1])
+        if (direction == 'prev' and has_more) or (direction == 'next' and page_cursor):
+            prev_cursor = encode_log_cursor('prev', rows[0])
+    return rows, next_cursor, prev_cursor
+
+@app.route('/api/activity-logs')
+@versioned_get('activity_logs')
+def api_get_activity_logs():
+    """API endpoint to get all activity logs.
+    Pass `limit` and/or `cursor` for keyset pagination (newest first); the
+    response then includes opaque `next_cursor`/`prev_cursor` values."""
+    connection = get_db_connection()
+    if not connection:
+        return jsonify({'success': False, 'error': 'Database connection failed'}), 500
+    
+    try:
+        cursor = connection.cursor(dictionary=True)
+        
+        # Create table if not exists
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS activity_logs (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                activity_type VARCHAR(50) NOT NULL,
+                member_name VARCHAR(255),
+                chairperson VARCHAR(255),
+                start_time DATETIME NOT NULL,
+                end_time DATETIME,
+                duration_seconds INT DEFAULT 0,
+                bill_name VARCHAR(255),
+                notes TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        ensure_activity_log_indexes(cursor)
+        
+        # Get filters from query params
+        date_filter = request.args.get('date', None)
+        activity_type = request.args.get('activity_type', None)
+        fetch_all = str(request.args.get('all', '')).lower() in ('1', 'true', 'yes', 'all')
+        page_cursor = request.args.get('cursor')
+        limit_param = request.args.get('limit')
+
+        if page_cursor or limit_param:
+            try:
+                limit = int(limit_param) if limit_param else ACTIVITY_LOG_PAGE_SIZE
+                limit = max(1, min(limit, ACTIVITY_LOG_MAX_PAGE_SIZE))
+                logs, next_cursor, prev_cursor = fetch_activity_logs_page(
+                    cursor, activity_type, date_filter, limit, page_cursor
+                )
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
+            for log in logs:
+                if log.get('start_time'):
+                    log['start_time'] = log['start_time'].strftime('%Y-%m-%d %H:%M:%S')
+                if log.get('end_time'):
+                    log['end_time'] = log['end_time'].strftime('%Y-%m-%d %H:%M:%S')
+                if log.get('created_at'):
+                    log['created_at'] = log['created_at'].strftime('%Y-%m-%d %H:%M:%S')
+            return jsonify({
+                'success': True,
+                'data': logs,
+                'paging': {'limit': limit, 'next_cursor': next_cursor, 'prev_cursor': prev_cursor}
+            })
+
+        if date_filter:
+            try:
+                day_start, day_end = day_range(date_filter)
+            except ValueError:
+                return jsonify({'success': False, 'error': 'Invalid date'}), 400
+            source = activity_log_source(day_start, day_end)
             if activity_type:
-                cursor.execute("""
-                    SELECT * FROM activity_logs 
-                    WHERE DATE(start_time) = %s AND activity_type = %s
+                query = f"""
+                    SELECT * FROM {source} 
+                    WHERE start_time >= %s AND start_time < %s AND activity_type = %s
                     ORDER BY start_time DESC
-                """, (date_filter, activity_type))
+                """
+                params = (day_start, day_end, activity_type)
             else:
-                cursor.execute("""
-                    SELECT * FROM activity_logs 
-                    WHERE DATE(start_time) = %s
+                query = f"""
+                    SELECT * FROM {source} 
+                    WHERE start_time >= %s AND start_time < %s
                     ORDER BY start_time DESC
-                """, (date_filter,))
+                """
+                params = (day_start, day_end)
         else:
             if activity_type:
                 query = """
@@ -969,8 +2209,11 @@ def api_get_activity_logs():
             if not fetch_all:
                 query += " LIMIT 100"
 
-            cursor.execute(query, params)
-        
+        stream_format = get_stream_format()
+        if stream_format:
+            return stream_log_rows(query, params, stream_format)
+
+        cursor.execute(query, params)
         logs = cursor.fetchall()
         
         # Convert datetime objects to strings
@@ -989,89 +2232,970 @@ def api_get_activity_logs():
     finally:
         connection.close()
 
-@app.route('/api/activity-log', methods=['POST'])
-def api_add_activity_log():
-    """API endpoint to add a new activity log."""
+@app.route('/api/activity-logs/count')
+@versioned_get('activity_logs')
+def api_get_activity_logs_count():
+    """Total number of activity logs (optionally by activity_type/date), served from a cached counter."""
+    date_filter = request.args.get('date') or None
+    activity_type = request.args.get('activity_type') or None
+    key = (activity_type, date_filter)
+
+    with activity_log_count_lock:
+        cached = activity_log_count_cache.get(key)
+    if cached and time.monotonic() - cached[1] < ACTIVITY_LOG_COUNT_TTL:
+        return jsonify({'success': True, 'count': cached[0], 'cached': True})
+
+    connection = get_db_connection()
+    if not connection:
+        return jsonify({'success': False, 'error': 'Database connection failed'}), 500
+
+    try:
+        cursor = connection.cursor()
+        conditions = []
+        params = []
+        source = 'activity_logs'
+        if activity_type:
+            conditions.append("activity_type = %s")
+            params.append(activity_type)
+        if date_filter:
+            try:
+                day_start, day_end = day_range(date_filter)
+            except ValueError:
+                return jsonify({'success': False, 'error': 'Invalid date'}), 400
+            conditions.append("start_time >= %s AND start_time < %s")
+            params.extend([day_start, day_end])
+            source = activity_log_source(day_start, day_end)
+        query = f"SELECT COUNT(*) FROM {source}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        cursor.execute(query, tuple(params))
+        count = cursor.fetchone()[0]
+        with activity_log_count_lock:
+            activity_log_count_cache[key] = (count, time.monotonic())
+        return jsonify({'success': True, 'count': count, 'cached': False})
+    except mysql.connector.Error as err:
+        logger.error(f"Database error: {err}")
+        return jsonify({'success': False, 'error': str(err)}), 500
+    finally:
+        connection.close()
+
+activity_log_table_ready = False
+
+def ensure_activity_log_table(connection):
+    """Create activity_logs with all expected columns if missing (once per process)."""
+    global activity_log_table_ready
+    if activity_log_table_ready:
+        return
+    cur = connection.cursor()
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS activity_logs (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            activity_type VARCHAR(50) NOT NULL,
+            member_name VARCHAR(255),
+            chairperson VARCHAR(255),
+            start_time DATETIME NOT NULL,
+            end_time DATETIME,
+            duration_seconds INT DEFAULT 0,
+            allotted_seconds INT DEFAULT 0,
+            spoken_seconds INT DEFAULT 0,
+            bill_name VARCHAR(255),
+            bill_id INT,
+            party VARCHAR(100),
+            seat_no VARCHAR(20),
+            heading VARCHAR(255),
+            notes TEXT,
+            client_key CHAR(36) NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            party_key VARCHAR(100) AS ({party_key_sql('party')}) STORED,
+            UNIQUE KEY uq_activity_client_key (client_key),
+            INDEX idx_activity_bill_party (activity_type, bill_id, party_key)
+        )
+    """)
+    # Add columns defensively in case schema drifted
+    for col_sql in [
+        "ALTER TABLE activity_logs ADD COLUMN allotted_seconds INT DEFAULT 0",
+        "ALTER TABLE activity_logs ADD COLUMN spoken_seconds INT DEFAULT 0",
+        "ALTER TABLE activity_logs ADD COLUMN party VARCHAR(100)",
+        "ALTER TABLE activity_logs ADD COLUMN seat_no VARCHAR(20)",
+        "ALTER TABLE activity_logs ADD COLUMN bill_id INT",
+        "ALTER TABLE activity_logs ADD COLUMN heading VARCHAR(255)",
+        # Idempotency key from the client; NULLs (older clients) are not unique-checked
+        "ALTER TABLE activity_logs ADD COLUMN client_key CHAR(36) NULL",
+        "ALTER TABLE activity_logs ADD UNIQUE INDEX uq_activity_client_key (client_key)"
+    ]:
+        try:
+            cur.execute(col_sql)
+            connection.commit()
+        except mysql.connector.Error:
+            pass  # column already exists
+    activity_log_table_ready = True
+
+# ============ ACTIVITY LOG PARTITIONS ============
+
+# activity_logs is range-partitioned by month on start_time, so date-scoped
+# queries only open the partitions they need. Months older than
+# ACTIVITY_LOG_HOT_MONTHS are swapped out (EXCHANGE PARTITION) into
+# read-only activity_logs_archive_YYYYMM tables.
+ACTIVITY_LOG_PARTITIONING = os.getenv('ACTIVITY_LOG_PARTITIONING', '1') != '0'
+ACTIVITY_LOG_HOT_MONTHS = int(os.getenv('ACTIVITY_LOG_HOT_MONTHS', '12'))   # 0 = never archive
+ACTIVITY_LOG_PARTITIONS_AHEAD = 2       # empty future months kept ready
+ACTIVITY_LOG_MAINTENANCE_INTERVAL = 6 * 3600
+ACTIVITY_LOG_ARCHIVE_PREFIX = 'activity_logs_archive_'
+
+# Archive tables as [(month 'YYYYMM', oldest start_time, newest start_time)]. The
+# oldest hot partition takes any late row older than it, so an archive can hold rows
+# from before its month; reads pick archives by these real bounds, not by name.
+archived_log_months = []
+archived_log_months_lock = threading.Lock()
+
+def add_months(month, count):
+    """First day of the month `count` months after `month` (a date or datetime)."""
+    index = month.year * 12 + month.month - 1 + count
+    return datetime(index // 12, index % 12 + 1, 1)
+
+def refresh_archived_log_months(connection):
+    """Reload the archive tables and their start_time bounds from the database.
+    Archives are read-only, so the MIN/MAX index lookups stay exact."""
+    global archived_log_months
+    cursor = connection.cursor()
+    cursor.execute("""
+        SELECT TABLE_NAME FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME LIKE %s
+    """, (ACTIVITY_LOG_ARCHIVE_PREFIX.replace('_', '\\_') + '%',))
+    months = sorted(name[len(ACTIVITY_LOG_ARCHIVE_PREFIX):] for (name,) in cursor.fetchall())
+    archives = []
+    for month in months:
+        if len(month) != 6 or not month.isdigit():
+            continue
+        cursor.execute(f"SELECT MIN(start_time), MAX(start_time) FROM {ACTIVITY_LOG_ARCHIVE_PREFIX}{month}")
+        oldest, newest = cursor.fetchone()
+        if oldest is not None:
+            archives.append((month, oldest, newest))
+    with archived_log_months_lock:
+        archived_log_months = archives
+
+def activity_log_source(start=None, end=None, alias='activity_logs'):
+    """FROM-clause for activity logs in [start, end): activity_logs itself,
+    or a UNION ALL with the archive tables whose rows overlap the range. With
+    no range every archive is included; callers listing recent logs use activity_logs."""
+    with archived_log_months_lock:
+        archives = list(archived_log_months)
+    tables = []
+    for month, oldest, newest in archives:
+        if (start is not None and newest < start) or (end is not None and oldest >= end):
+            continue
+        tables.append(ACTIVITY_LOG_ARCHIVE_PREFIX + month)
+    if not tables:
+        return 'activity_logs' if alias == 'activity_logs' else f'activity_logs {alias}'
+    columns = ', '.join(('id',) + ACTIVITY_LOG_FIELDS + ('created_at', 'party_key'))
+    union = ' UNION ALL '.join(f"SELECT {columns} FROM {table}" for table in ['activity_logs'] + tables)
+    return f'({union}) AS {alias}'
+
+def archived_log_tables():
+    with archived_log_months_lock:
+        return [ACTIVITY_LOG_ARCHIVE_PREFIX + month for month, _, _ in archived_log_months]
+
+def apply_to_archived_logs(connection, statement, where_sql, params=(), where_params=()):
+    """Run `statement` ("DELETE FROM {table}" or "UPDATE {table} SET ...")
+    restricted by `where_sql` on every archive table, so bulk edits and deletes
+    reach the archived months that reads and rollup rebuilds include. Returns
+    (rows changed, ids of the bills those rows were linked to). Archived rows are
+    not in the incremental rollup deltas: the caller rebuilds those bills' rollups
+    and commits."""
+    cursor = connection.cursor()
+    changed = 0
+    bill_ids = set()
+    for table in archived_log_tables():
+        cursor.execute(f"SELECT DISTINCT bill_id FROM {table} WHERE {where_sql}", tuple(where_params))
+        bill_ids.update(bill_id for (bill_id,) in cursor.fetchall() if bill_id)
+        cursor.execute(f"{statement.format(table=table)} WHERE {where_sql}", tuple(params) + tuple(where_params))
+        changed += cursor.rowcount
+    return changed, bill_ids
+
+def bill_ids_named(connection, bill_name):
+    cursor = connection.cursor()
+    cursor.execute("SELECT id FROM bill_details WHERE bill_name = %s", (bill_name,))
+    return {bill_id for (bill_id,) in cursor.fetchall()}
+
+def activity_log_partitions(connection):
+    """[(partition_name, upper_bound_string, table_rows)] for activity_logs; [] if not partitioned."""
+    cursor = connection.cursor()
+    cursor.execute("""
+        SELECT PARTITION_NAME, PARTITION_DESCRIPTION, TABLE_ROWS
+        FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'activity_logs' AND PARTITION_NAME IS NOT NULL
+        ORDER BY PARTITION_ORDINAL_POSITION
+    """)
+    return [(name, (bound or '').strip("'"), rows) for name, bound, rows in cursor.fetchall()]
+
+def month_partition_sql(month):
+    return f"PARTITION p{month.strftime('%Y%m')} VALUES LESS THAN ('{add_months(month, 1).strftime('%Y-%m-%d')}')"
+
+def partition_activity_logs(connection):
+    """Convert an unpartitioned activity_logs to monthly partitions. This rebuilds
+    the whole table, so it is an operator action (--partition-activity-logs or
+    POST /api/activity-logs/partition), never part of routine maintenance.
+    Returns False if the table is already partitioned."""
+    cursor = connection.cursor()
+    current = add_months(get_ist_now(), 0)
+    last_needed = add_months(current, ACTIVITY_LOG_PARTITIONS_AHEAD)
+    if activity_log_partitions(connection):
+        return False
+
+    cursor.execute("SELECT MIN(start_time) FROM activity_logs")
+    oldest = cursor.fetchone()[0]
+    month = add_months(oldest, 0) if oldest else current
+    definitions = []
+    while month <= last_needed:
+        definitions.append(month_partition_sql(month))
+        month = add_months(month, 1)
+    definitions.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+    logger.info(f"Partitioning activity_logs into {len(definitions)} monthly partitions...")
+    # Every unique key of a partitioned table must include the partition column
+    cursor.execute("""
+        ALTER TABLE activity_logs
+            DROP PRIMARY KEY, ADD PRIMARY KEY (id, start_time),
+            DROP INDEX uq_activity_client_key, ADD UNIQUE INDEX uq_activity_client_key (client_key, start_time)
+    """)
+    cursor.execute(f"ALTER TABLE activity_logs PARTITION BY RANGE COLUMNS(start_time) ({', '.join(definitions)})")
+    logger.info("activity_logs partitioned by month")
+    return True
+
+def ensure_activity_log_partitions(connection):
+    """Keep ACTIVITY_LOG_PARTITIONS_AHEAD future months ready on a partitioned
+    activity_logs. Returns False (and changes nothing) if it is not partitioned."""
+    cursor = connection.cursor()
+    current = add_months(get_ist_now(), 0)
+    last_needed = add_months(current, ACTIVITY_LOG_PARTITIONS_AHEAD)
+    partitions = activity_log_partitions(connection)
+    if not partitions:
+        return False
+
+    # Partitions are contiguous; the last bounded one ends where pmax starts
+    bounded = [bound for name, bound, _ in partitions if name != 'pmax']
+    month = datetime.strptime(bounded[-1][:10], '%Y-%m-%d') if bounded else current
+    while month <= last_needed:
+        cursor.execute(f"""
+            ALTER TABLE activity_logs REORGANIZE PARTITION pmax INTO (
+                {month_partition_sql(month)}, PARTITION pmax VALUES LESS THAN (MAXVALUE)
+            )
+        """)
+        logger.info(f"Added activity_logs partition p{month.strftime('%Y%m')}")
+        month = add_months(month, 1)
+    return True
+
+def archive_activity_log_partitions(connection, hot_months=ACTIVITY_LOG_HOT_MONTHS):
+    """Move monthly partitions older than `hot_months` (counting the current
+    month) into activity_logs_archive_YYYYMM tables. EXCHANGE PARTITION swaps
+    the rows without copying them. Returns the archived table names."""
+    if hot_months <= 0:
+        return []
+    cursor = connection.cursor()
+    cutoff = add_months(get_ist_now(), 1 - hot_months)
+    archived = []
+    for name, bound, _ in activity_log_partitions(connection):
+        if name == 'pmax' or datetime.strptime(bound[:10], '%Y-%m-%d') > cutoff:
+            continue
+        table = ACTIVITY_LOG_ARCHIVE_PREFIX + name[1:]
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {table} LIKE activity_logs")
+        try:
+            cursor.execute(f"ALTER TABLE {table} REMOVE PARTITIONING")
+        except mysql.connector.Error:
+            pass  # already a plain table
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        if cursor.fetchone()[0]:
+            logger.error(f"Archive table {table} is not empty; leaving partition {name} in place")
+            continue
+        cursor.execute(f"ALTER TABLE activity_logs EXCHANGE PARTITION {name} WITH TABLE {table}")
+        cursor.execute(f"ALTER TABLE activity_logs DROP PARTITION {name}")
+        archived.append(table)
+        logger.info(f"Archived activity_logs partition {name} to {table}")
+    return archived
+
+class ActivityLogMaintenance:
+    """Background job that keeps the monthly partitions ahead of the calendar
+    and archives months past the retention window. It leaves an unpartitioned
+    table alone; converting it is run_once(convert=True)."""
+    def __init__(self, interval=ACTIVITY_LOG_MAINTENANCE_INTERVAL):
+        self.interval = interval
+        self.stop_event = threading.Event()
+        self.run_lock = threading.Lock()
+        self.thread = None
+        self.status = {'last_run': None, 'last_error': None, 'archived': [], 'partitioned': False}
+
+    def start(self):
+        if not ACTIVITY_LOG_PARTITIONING or (self.thread and self.thread.is_alive()):
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            self.run_once()
+            self.stop_event.wait(self.interval)
+
+    def run_once(self, hot_months=ACTIVITY_LOG_HOT_MONTHS, convert=False):
+        """Run one maintenance pass now, first partitioning the table if `convert`.
+        Returns the status dict."""
+        with self.run_lock:
+            connection = get_db_connection()
+            if not connection:
+                self.status['last_error'] = 'Database connection failed'
+                return dict(self.status)
+            try:
+                ensure_activity_log_table(connection)
+                ensure_bill_rollup_tables(connection)  # bill_party_allocations; party_key is a startup migration
+                if convert:
+                    partition_activity_logs(connection)
+                if not ensure_activity_log_partitions(connection) and not self.status['last_run']:
+                    logger.warning("activity_logs is not partitioned; run app.py --partition-activity-logs "
+                                   "(or POST /api/activity-logs/partition) to convert it")
+                archived = archive_activity_log_partitions(connection, hot_months)
+                refresh_archived_log_months(connection)
+                share_archived_log_months()
+                self.status['partitioned'] = bool(activity_log_partitions(connection))
+                self.status['archived'] = archived
+                self.status['last_error'] = None
+                if archived:
+                    bump_data_version('activity_logs')
+            except mysql.connector.Error as err:
+                logger.error(f"Activity log maintenance failed: {err}")
+                self.status['last_error'] = str(err)
+            finally:
+                connection.close()
+            self.status['last_run'] = get_ist_now().strftime('%Y-%m-%d %H:%M:%S')
+            return dict(self.status)
+
+activity_log_maintenance = ActivityLogMaintenance()
+
+@app.route('/api/activity-logs/partitions')
+def api_activity_log_partitions():
+    """API endpoint to list activity_logs partitions, archive tables and maintenance status"""
     connection = get_db_connection()
     if not connection:
         return jsonify({'success': False, 'error': 'Database connection failed'}), 500
     
-    def ensure_activity_table(cur):
-        """Create activity_logs table with all expected columns if missing."""
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS activity_logs (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                activity_type VARCHAR(50) NOT NULL,
-                member_name VARCHAR(255),
-                chairperson VARCHAR(255),
-                start_time DATETIME NOT NULL,
-                end_time DATETIME,
-                duration_seconds INT DEFAULT 0,
-                allotted_seconds INT DEFAULT 0,
-                spoken_seconds INT DEFAULT 0,
-                bill_name VARCHAR(255),
-                bill_id INT,
-                party VARCHAR(100),
-                seat_no VARCHAR(20),
-                heading VARCHAR(255),
-                notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    try:
+        refresh_archived_log_months(connection)
+        partitions = [{'name': name, 'less_than': bound, 'rows': rows}
+                      for name, bound, rows in activity_log_partitions(connection)]
+        with archived_log_months_lock:
+            archives = [{'table': ACTIVITY_LOG_ARCHIVE_PREFIX + month,
+                         'oldest': oldest.strftime('%Y-%m-%d %H:%M:%S'),
+                         'newest': newest.strftime('%Y-%m-%d %H:%M:%S')}
+                        for month, oldest, newest in archived_log_months]
+        return jsonify({'success': True, 'data': {
+            'enabled': ACTIVITY_LOG_PARTITIONING,
+            'hot_months': ACTIVITY_LOG_HOT_MONTHS,
+            'partitions': partitions,
+            'archives': archives,
+            'maintenance': dict(activity_log_maintenance.status)
+        }})
+    except mysql.connector.Error as err:
+        logger.error(f"Database error: {err}")
+        return jsonify({'success': False, 'error': str(err)}), 500
+    finally:
+        connection.close()
+
+@app.route('/api/activity-logs/archive', methods=['POST'])
+def api_archive_activity_logs():
+    """API endpoint to run partition maintenance and archival now (optional `hot_months`)"""
+    if not ACTIVITY_LOG_PARTITIONING:
+        return jsonify({'success': False, 'error': 'Partitioning is disabled (ACTIVITY_LOG_PARTITIONING=0)'}), 400
+    data = request.get_json(silent=True) or {}
+    try:
+        hot_months = int(data.get('hot_months', ACTIVITY_LOG_HOT_MONTHS))
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'error': 'hot_months must be a number'}), 400
+    status = activity_log_maintenance.run_once(hot_months)
+    if status['last_error']:
+        return jsonify({'success': False, 'error': status['last_error']}), 500
+    return jsonify({'success': True, 'data': status})
+
+@app.route('/api/activity-logs/partition', methods=['POST'])
+def api_partition_activity_logs():
+    """API endpoint to convert activity_logs to monthly partitions (rebuilds the table once)"""
+    if not ACTIVITY_LOG_PARTITIONING:
+        return jsonify({'success': False, 'error': 'Partitioning is disabled (ACTIVITY_LOG_PARTITIONING=0)'}), 400
+    status = activity_log_maintenance.run_once(convert=True)
+    if status['last_error']:
+        return jsonify({'success': False, 'error': status['last_error']}), 500
+    return jsonify({'success': True, 'data': status})
+
+
+# ============ ACTIVITY LOG WRITER ============
+
+ACTIVITY_LOG_FIELDS = ('activity_type', 'member_name', 'chairperson', 'start_time', 'end_time',
+                       'duration_seconds', 'allotted_seconds', 'spoken_seconds', 'bill_name', 'bill_id',
+                       'party', 'seat_no', 'heading', 'notes', 'client_key')
+# A repeated client_key replaces the earlier row (last write wins), so retries
+# and double-fired handlers never add a second row
+ACTIVITY_LOG_INSERT_SQL = f"""
+    INSERT INTO activity_logs ({', '.join(ACTIVITY_LOG_FIELDS)})
+    VALUES ({', '.join(['%s'] * len(ACTIVITY_LOG_FIELDS))})
+    ON DUPLICATE KEY UPDATE {', '.join(f'{field} = VALUES({field})' for field in ACTIVITY_LOG_FIELDS if field != 'client_key')}
+"""
+ACTIVITY_LOG_BATCH_MAX = 500   # entries per /api/activity-log/batch request
+
+# Writable folder next to the EXE when frozen (APP_DIR is the unpack dir there)
+DATA_DIR = os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else APP_DIR
+ACTIVITY_LOG_ASYNC = os.getenv('ACTIVITY_LOG_ASYNC', '1') != '0'
+ACTIVITY_LOG_SPOOL_BASE = os.getenv('ACTIVITY_LOG_SPOOL', os.path.join(DATA_DIR, 'activity_log_spool.jsonl'))
+ACTIVITY_LOG_SPOOL = ACTIVITY_LOG_SPOOL_BASE
+if CLUSTER_WORKER:
+    # One spool per worker: two writers must never append to the same file
+    ACTIVITY_LOG_SPOOL = ACTIVITY_LOG_SPOOL_BASE.replace('.jsonl', '') + f'_w{WORKER_INDEX}.jsonl'
+ACTIVITY_LOG_BATCH_SIZE = 200
+ACTIVITY_LOG_FLUSH_INTERVAL = 0.05   # seconds to gather a batch before writing
+ACTIVITY_LOG_MAX_BACKOFF = 30        # seconds between retries while MySQL is unreachable
+ACTIVITY_LOG_SPOOL_COMPACT_BYTES = 256 * 1024
+
+def parse_log_datetime(value):
+    """Normalize a client timestamp to 'YYYY-MM-DD HH:MM:SS' (IST). Raises ValueError."""
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = datetime.fromisoformat(str(value).strip().replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(IST).replace(tzinfo=None)
+    if parsed.year < 1000:
+        raise ValueError('DATETIME columns start at year 1000')
+    return parsed.strftime('%Y-%m-%d %H:%M:%S')
+
+def parse_client_key(value):
+    """Canonical lower-case UUID string for an idempotency key, or None. Raises ValueError."""
+    if value in (None, ''):
+        return None
+    try:
+        return str(uuid.UUID(str(value).strip()))
+    except ValueError:
+        raise ValueError('client_key must be a UUID')
+
+# Column widths of the activity_logs text columns (characters; notes is TEXT, in bytes).
+# Entries are checked against them before the 200 reply: under strict SQL mode a
+# longer value would only fail in the writer, after the client was told it was saved.
+ACTIVITY_LOG_TEXT_LIMITS = {
+    'activity_type': 50, 'member_name': 255, 'chairperson': 255, 'bill_name': 255,
+    'party': 100, 'seat_no': 20, 'heading': 255,
+}
+ACTIVITY_LOG_NOTES_MAX_BYTES = 65535
+ACTIVITY_LOG_INT_FIELDS = ('duration_seconds', 'allotted_seconds', 'spoken_seconds', 'bill_id')
+MYSQL_INT_MIN, MYSQL_INT_MAX = -2 ** 31, 2 ** 31 - 1
+
+def check_activity_log_columns(entry):
+    """Raise ValueError if a normalized entry would not fit the activity_logs columns."""
+    for field, limit in ACTIVITY_LOG_TEXT_LIMITS.items():
+        if not isinstance(entry[field], str):
+            raise ValueError(f'{field} must be a string')
+        if len(entry[field]) > limit:
+            raise ValueError(f'{field} must be at most {limit} characters')
+    if not isinstance(entry['notes'], str):
+        raise ValueError('notes must be a string')
+    if len(entry['notes'].encode('utf-8')) > ACTIVITY_LOG_NOTES_MAX_BYTES:
+        raise ValueError(f'notes must be at most {ACTIVITY_LOG_NOTES_MAX_BYTES} bytes')
+    for field in ACTIVITY_LOG_INT_FIELDS:
+        if entry[field] is not None and not MYSQL_INT_MIN <= entry[field] <= MYSQL_INT_MAX:
+            raise ValueError(f'{field} is out of range')
+
+def normalize_activity_log_entry(data):
+    """Validate a POSTed activity log against the column types and widths and
+    fill defaults. Raises ValueError."""
+    if not isinstance(data, dict):
+        raise ValueError('An activity log object is required')
+    if not data.get('activity_type') or not data.get('start_time'):
+        raise ValueError('Activity type and start time are required')
+    client_key = parse_client_key(data.get('client_key'))
+    try:
+        entry = {
+            'activity_type': data.get('activity_type', ''),
+            'member_name': data.get('member_name', ''),
+            'chairperson': data.get('chairperson', ''),
+            'start_time': parse_log_datetime(data['start_time']),
+            'end_time': parse_log_datetime(data['end_time']) if data.get('end_time') else None,
+            'duration_seconds': int(data.get('duration_seconds') or 0),
+            'allotted_seconds': int(data.get('allotted_seconds') or 0),
+            'spoken_seconds': int(data.get('spoken_seconds') or 0),
+            'bill_name': data.get('bill_name', ''),
+            'bill_id': int(data['bill_id']) if data.get('bill_id') else None,  # Bill ID for linking to bill_details
+            'party': data.get('party', ''),  # Party of the speaking member
+            'seat_no': str(data.get('seat_no') or ''),
+            'heading': data.get('heading', ''),
+            'notes': data.get('notes', ''),
+            'client_key': client_key,
+        }
+    except (TypeError, ValueError):
+        raise ValueError('Invalid time or number in activity log')
+    # Missing and null text fields are stored as ''
+    for field in tuple(ACTIVITY_LOG_TEXT_LIMITS) + ('notes',):
+        if entry[field] is None:
+            entry[field] = ''
+    check_activity_log_columns(entry)
+    return entry
+
+def rollup_row_for_entry(entry):
+    """The apply_bill_rollup_rows() view of a not-yet-selected log entry."""
+    return {
+        'bill_id': entry['bill_id'],
+        'bill_name': entry['bill_name'],
+        'party_key': entry['party'],   # normalized in SQL, like the generated column
+        'seat_no': entry['seat_no'],
+        'log_date': entry['start_time'][:10],
+        'duration_seconds': entry['duration_seconds'],
+        'spoken_seconds': entry['spoken_seconds'],
+    }
+
+def write_activity_logs(connection, entries):
+    """Insert or upsert normalized entries and update the bill rollups; the
+    caller commits. Returns the set of bill ids whose rollups changed."""
+    # Within one batch a repeated key keeps only its last entry
+    keyed = {}
+    unkeyed = []
+    for entry in entries:
+        if entry.get('client_key'):
+            keyed.pop(entry['client_key'], None)
+            keyed[entry['client_key']] = entry
+        else:
+            unkeyed.append(entry)
+    rows = unkeyed + list(keyed.values())
+    if not rows:
+        return set()
+
+    rollup_bill_ids = set()
+    keys = list(keyed)
+    key_sql = f"client_key IN ({', '.join(['%s'] * len(keys))})"
+    if keys:
+        # Take replaced rows out of the rollups before they are overwritten
+        rollup_bill_ids |= apply_bill_rollup(connection, key_sql, keys, -1)
+        # The unique key is (client_key, start_time) on the partitioned table,
+        # so a resend with a corrected start time must remove the old row itself
+        connection.cursor().executemany("DELETE FROM activity_logs WHERE client_key = %s AND start_time <> %s",
+                                        [(key, entry['start_time']) for key, entry in keyed.items()])
+    connection.cursor().executemany(ACTIVITY_LOG_INSERT_SQL,
+                                    [tuple(entry.get(field) for field in ACTIVITY_LOG_FIELDS) for entry in rows])
+    if keys:
+        rollup_bill_ids |= apply_bill_rollup(connection, key_sql, keys, 1)
+    rollup_bill_ids |= apply_bill_rollup_rows(
+        connection,
+        [rollup_row_for_entry(entry) for entry in unkeyed if entry['activity_type'] == 'Bill Discussion'],
+        1)
+    return rollup_bill_ids
+
+class ActivityLogWriter:
+    """Write-behind queue for activity logs.
+
+    submit() appends the entry to a local spool file and fsyncs it before
+    returning, so an acknowledged log survives a crash or a MySQL outage. A
+    background thread writes queued entries in batches (one executemany and
+    one commit per batch) and retries with backoff while MySQL is down.
+
+    Each spool has an id and entries carry a sequence number; the last
+    committed sequence is stored in activity_log_spool_state in the same
+    transaction as the batch, so replaying the spool after a crash never
+    inserts an entry twice.
+    """
+    def __init__(self, spool_path, batch_size=ACTIVITY_LOG_BATCH_SIZE, flush_interval=ACTIVITY_LOG_FLUSH_INTERVAL):
+        self.spool_path = spool_path
+        self.rejected_path = spool_path + '.rejected'
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.cond = threading.Condition()
+        self.queue = deque()      # (seq, entry) not yet committed to MySQL
+        self.file = None
+        self.spool_id = None
+        self.seq = 0
+        self.running = False
+        self.thread = None
+        self.state_table_ready = False
+        self.metrics = {
+            'submitted': 0, 'written': 0, 'batches': 0, 'replayed': 0, 'rejected': 0,
+            'db_errors': 0, 'last_batch_ms': None, 'last_error': None
+        }
+
+    def start(self):
+        """Replay any spooled entries left by a previous run and start the writer thread."""
+        with self.cond:
+            if self.running and self.thread and self.thread.is_alive():
+                return
+            if not self.running:
+                self._open_spool()
+                self.running = True
+            else:
+                # The writer thread died; carry on from the spool that is already open
+                logger.error("Activity log writer thread was not running; restarting it")
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+        logger.info(f"Activity log writer started (spool {self.spool_path}, {len(self.queue)} pending)")
+
+    def stop(self):
+        """Stop after one last attempt to write what is queued; anything left stays spooled."""
+        with self.cond:
+            if not self.running:
+                return
+            self.running = False
+            self.cond.notify_all()
+        if self.thread:
+            self.thread.join(timeout=10)
+        with self.cond:
+            if self.file:
+                self.file.close()
+                self.file = None
+        logger.info("Activity log writer stopped")
+
+    def _open_spool(self):
+        """Load unwritten entries from the spool, dropping a torn final line (caller holds the lock)."""
+        import json
+        entries = []
+        spool_id = None
+        good_end = 0
+        if os.path.exists(self.spool_path):
+            with open(self.spool_path, 'rb') as f:
+                for raw in f:
+                    if not raw.endswith(b'\n'):
+                        break  # partial write from a crash
+                    try:
+                        record = json.loads(raw)
+                    except ValueError:
+                        break
+                    good_end += len(raw)
+                    if 'spool_id' in record:
+                        spool_id = record['spool_id']
+                    elif spool_id and 'seq' in record:
+                        entries.append((record['seq'], record['entry']))
+        if spool_id is None:
+            self._reset_spool()
+            return
+        with open(self.spool_path, 'r+b') as f:
+            f.truncate(good_end)
+        self.spool_id = spool_id
+        self.queue.extend(entries)
+        self.seq = entries[-1][0] if entries else 0
+        self.metrics['replayed'] = len(entries)
+        self.file = open(self.spool_path, 'ab')
+
+    def _reset_spool(self):
+        """Start a fresh spool file under a new id (caller holds the lock, queue is empty)."""
+        import json
+        if self.file:
+            self.file.close()
+        self.spool_id = uuid.uuid4().hex
+        self.seq = 0
+        self.file = open(self.spool_path, 'wb')
+        self.file.write(json.dumps({'spool_id': self.spool_id,
+                                    'created_at': get_ist_now().strftime('%Y-%m-%d %H:%M:%S')}).encode('utf-8') + b'\n')
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def submit(self, entry):
+        """Durably queue one normalized entry; returns its sequence number. Raises OSError."""
+        import json
+        if not self.running or not (self.thread and self.thread.is_alive()):
+            self.start()
+        with self.cond:
+            self.seq += 1
+            line = json.dumps({'seq': self.seq, 'entry': entry}, ensure_ascii=False).encode('utf-8') + b'\n'
+            try:
+                self.file.write(line)
+                self.file.flush()
+                os.fsync(self.file.fileno())
+            except OSError:
+                self.seq -= 1
+                raise
+            self.queue.append((self.seq, entry))
+            self.metrics['submitted'] += 1
+            self.cond.notify()
+            return self.seq
+
+    def _run(self):
+        backoff = 0
+        while True:
+            with self.cond:
+                while self.running and not self.queue:
+                    self.cond.wait(1.0)
+                if not self.queue:
+                    return
+                if self.running and len(self.queue) < self.batch_size:
+                    # Let a burst (e.g. several members' logs at once) share one commit
+                    self.cond.wait(self.flush_interval)
+                batch = [self.queue[i] for i in range(min(self.batch_size, len(self.queue)))]
+            try:
+                if self._write_batch(batch):
+                    backoff = 0
+                    with self.cond:
+                        for _ in batch:
+                            self.queue.popleft()
+                        if not self.queue and self.file.tell() > ACTIVITY_LOG_SPOOL_COMPACT_BYTES:
+                            self._reset_spool()
+                    continue
+            except Exception as e:
+                # Anything unexpected is retried like a MySQL outage; the thread must not die
+                with self.cond:
+                    self.metrics['last_error'] = str(e)
+                logger.exception(f"Activity log writer error, will retry: {e}")
+            with self.cond:
+                if not self.running:
+                    return  # keep the rest spooled for the next start
+                backoff = min(ACTIVITY_LOG_MAX_BACKOFF, max(0.5, backoff * 2))
+                self.cond.wait(backoff)
+
+    def _ensure_state_table(self, connection):
+        if self.state_table_ready:
+            return
+        connection.cursor().execute("""
+            CREATE TABLE IF NOT EXISTS activity_log_spool_state (
+                spool_id CHAR(32) PRIMARY KEY,
+                last_seq BIGINT NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
             )
         """)
-        # Add columns defensively in case schema drifted
-        for col_sql in [
-            "ALTER TABLE activity_logs ADD COLUMN allotted_seconds INT DEFAULT 0",
-            "ALTER TABLE activity_logs ADD COLUMN spoken_seconds INT DEFAULT 0",
-            "ALTER TABLE activity_logs ADD COLUMN party VARCHAR(100)",
-            "ALTER TABLE activity_logs ADD COLUMN seat_no VARCHAR(20)",
-            "ALTER TABLE activity_logs ADD COLUMN bill_id INT",
-            "ALTER TABLE activity_logs ADD COLUMN heading VARCHAR(255)"
-        ]:
+        self.state_table_ready = True
+
+    def _write_batch(self, batch):
+        """Insert a batch in one transaction. Returns False if it should be retried later."""
+        started = time.monotonic()
+        connection = get_db_connection()
+        if not connection:
+            with self.cond:
+                self.metrics['db_errors'] += 1
+                self.metrics['last_error'] = 'Database connection failed'
+            return False
+        try:
+            ensure_activity_log_table(connection)
+            ensure_bill_rollup_tables(connection)
+            self._ensure_state_table(connection)
+            cursor = connection.cursor()
+            cursor.execute("INSERT IGNORE INTO activity_log_spool_state (spool_id, last_seq) VALUES (%s, 0)",
+                           (self.spool_id,))
+            cursor.execute("SELECT last_seq FROM activity_log_spool_state WHERE spool_id = %s FOR UPDATE",
+                           (self.spool_id,))
+            last_seq = cursor.fetchone()[0]
+            entries = [entry for seq, entry in batch if seq > last_seq]
+            rollup_bill_ids = write_activity_logs(connection, entries)
+            cursor.execute("UPDATE activity_log_spool_state SET last_seq = %s WHERE spool_id = %s",
+                           (batch[-1][0], self.spool_id))
+            connection.commit()
+        except (mysql.connector.errors.DataError, mysql.connector.errors.IntegrityError) as err:
+            # One bad row must not block the queue: retry row by row and set aside what still fails
+            connection.rollback()
+            connection.close()
+            if len(batch) > 1:
+                return all(self._write_batch([item]) for item in batch)
+            return self._reject(batch[0], err)
+        except Exception as err:
             try:
-                cur.execute(col_sql)
-                connection.commit()
+                connection.rollback()
             except mysql.connector.Error:
-                pass  # column already exists
-    
+                pass
+            connection.close()
+            with self.cond:
+                self.metrics['db_errors'] += 1
+                self.metrics['last_error'] = str(err)
+            logger.error(f"Activity log batch failed, will retry: {err}")
+            return False
+
+        # The batch is committed; a failure to announce it must not get it retried
+        try:
+            bump_data_version('activity_logs')
+            publish_bill_time_updates(connection, rollup_bill_ids)
+        except Exception as e:
+            logger.error(f"Activity log batch written but not published: {e}")
+        finally:
+            connection.close()
+        elapsed_ms = round((time.monotonic() - started) * 1000.0, 2)
+        with self.cond:
+            self.metrics['written'] += len(entries)
+            self.metrics['batches'] += 1
+            self.metrics['last_batch_ms'] = elapsed_ms
+        if entries:
+            logger.info(f"Wrote {len(entries)} activity log(s) in {elapsed_ms} ms")
+        return True
+
+    def _reject(self, item, err):
+        """Move an entry MySQL refuses to the .rejected file and mark it done."""
+        import json
+        seq, entry = item
+        logger.error(f"Activity log rejected by database ({err}): {entry}")
+        try:
+            with open(self.rejected_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'seq': seq, 'error': str(err), 'entry': entry}, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            logger.error(f"Could not record rejected activity log: {e}")
+            return False
+        connection = get_db_connection()
+        if not connection:
+            return False
+        try:
+            connection.cursor().execute("""
+                INSERT INTO activity_log_spool_state (spool_id, last_seq) VALUES (%s, %s)
+                ON DUPLICATE KEY UPDATE last_seq = GREATEST(last_seq, VALUES(last_seq))
+            """, (self.spool_id, seq))
+            connection.commit()
+        except mysql.connector.Error:
+            return False
+        finally:
+            connection.close()
+        with self.cond:
+            self.metrics['rejected'] += 1
+        return True
+
+    def stats(self):
+        with self.cond:
+            return {
+                'running': self.running,
+                'async': ACTIVITY_LOG_ASYNC,
+                'pending': len(self.queue),
+                'spool_path': self.spool_path,
+                **self.metrics,
+            }
+
+activity_log_writer = ActivityLogWriter(ACTIVITY_LOG_SPOOL)
+
+def orphan_spool_paths():
+    """Spool files no running writer owns: the single-process spool while running as a
+    cluster, per-worker spools when running alone, and spools of worker indexes beyond
+    the current SERVER_WORKERS (left behind when the worker count changes)."""
+    import glob
+    import re
+    stem = ACTIVITY_LOG_SPOOL_BASE.replace('.jsonl', '')
+    owned = {os.path.abspath(activity_log_writer.spool_path)}
+    if CLUSTER_WORKER:
+        owned |= {os.path.abspath(f"{stem}_w{index}.jsonl") for index in range(SERVER_WORKERS)}
+    candidates = [ACTIVITY_LOG_SPOOL_BASE] + [path for path in glob.glob(glob.escape(stem) + '_w*.jsonl')
+                                              if re.search(r'_w\d+\.jsonl$', path)]
+    return [path for path in candidates if os.path.exists(path) and os.path.abspath(path) not in owned]
+
+def drain_orphan_spools():
+    """Write out the entries of every orphaned spool (see orphan_spool_paths) and
+    delete the emptied files; retried with backoff while MySQL is unreachable."""
+    delay = 1
+    while True:
+        remaining = []
+        for path in orphan_spool_paths():
+            writer = ActivityLogWriter(path)
+            with writer.cond:
+                writer._open_spool()
+            pending = len(writer.queue)
+            try:
+                # running is False, so _run() writes until the queue is empty or a batch fails
+                writer._run()
+            finally:
+                writer.file.close()
+            if writer.queue:
+                remaining.append(path)
+                continue
+            os.remove(path)
+            if pending:
+                logger.info(f"Replayed {pending} activity log(s) from orphaned spool {path}")
+        if not remaining:
+            return
+        logger.warning(f"Orphaned activity log spools not yet written: {', '.join(remaining)}")
+        time.sleep(delay)
+        delay = min(ACTIVITY_LOG_MAX_BACKOFF, delay * 2)
+
+def insert_activity_logs_now(entries):
+    """Synchronous insert, used when the async writer is disabled or its spool
+    is unwritable. Returns None on success, else an error response."""
+    connection = get_db_connection()
+    if not connection:
+        return jsonify({'success': False, 'error': 'Database connection failed'}), 500
     try:
-        data = request.get_json()
-        activity_type = data.get('activity_type', '')
-        member_name = data.get('member_name', '')
-        chairperson = data.get('chairperson', '')
-        start_time = data.get('start_time', '')
-        end_time = data.get('end_time', None)
-        duration_seconds = data.get('duration_seconds', 0)
-        allotted_seconds = data.get('allotted_seconds', 0)
-        spoken_seconds = data.get('spoken_seconds', 0)
-        bill_name = data.get('bill_name', '')
-        bill_id = data.get('bill_id', None)  # Bill ID for linking to bill_details
-        notes = data.get('notes', '')
-        party = data.get('party', '')  # Party of the speaking member
-        heading = data.get('heading', '')
-        
-        if not activity_type or not start_time:
-            return jsonify({'success': False, 'error': 'Activity type and start time are required'}), 400
-        
-        cursor = connection.cursor()
-        ensure_activity_table(cursor)
-        
-        seat_no = data.get('seat_no', '')
-        
-        cursor.execute("""
-            INSERT INTO activity_logs 
-            (activity_type, member_name, chairperson, start_time, end_time, duration_seconds, allotted_seconds, spoken_seconds, bill_name, bill_id, party, seat_no, heading, notes)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (activity_type, member_name, chairperson, start_time, end_time, duration_seconds, allotted_seconds, spoken_seconds, bill_name, bill_id, party, seat_no, heading, notes))
-        
+        ensure_activity_log_table(connection)
+        ensure_bill_rollup_tables(connection)
+        rollup_bill_ids = write_activity_logs(connection, entries)
         connection.commit()
-        logger.info(f"Added activity log: {activity_type} - {member_name} (Seat: {seat_no}, Party: {party})")
-        return jsonify({'success': True, 'message': 'Activity logged successfully', 'id': cursor.lastrowid})
+        bump_data_version('activity_logs')
+        publish_bill_time_updates(connection, rollup_bill_ids)
+        for entry in entries:
+            logger.info(f"Added activity log: {entry['activity_type']} - {entry['member_name']} "
+                        f"(Seat: {entry['seat_no']}, Party: {entry['party']})")
+        return None
     except mysql.connector.Error as err:
         logger.error(f"Database error: {err}")
         return jsonify({'success': False, 'error': str(err)}), 500
     finally:
         connection.close()
 
+@app.route('/api/activity-log', methods=['POST'])
+def api_add_activity_log():
+    """API endpoint to add a new activity log. Acknowledged once it is in the
+    durable spool; the writer thread inserts it moments later."""
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({'success': False, 'error': 'An activity log object is required'}), 400
+    if request.headers.get('Idempotency-Key') and not data.get('client_key'):
+        data['client_key'] = request.headers['Idempotency-Key']
+    session_recorder.record('activity_log', data)
+    try:
+        entry = normalize_activity_log_entry(data)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    if ACTIVITY_LOG_ASYNC:
+        try:
+            seq = activity_log_writer.submit(entry)
+            return jsonify({'success': True, 'message': 'Activity logged successfully', 'queued': True,
+                            'seq': seq, 'client_key': entry['client_key']})
+        except OSError as e:
+            logger.error(f"Activity log spool unavailable, inserting directly: {e}")
+    error = insert_activity_logs_now([entry])
+    if error:
+        return error
+    return jsonify({'success': True, 'message': 'Activity logged successfully', 'client_key': entry['client_key']})
+
+@app.route('/api/activity-log/batch', methods=['POST'])
+def api_add_activity_logs_batch():
+    """API endpoint to add many activity logs at once. Every entry needs a
+    client_key, so a client can resend the whole batch after a failure."""
+    data = request.get_json(silent=True) or {}
+    raw_entries = data.get('entries')
+    if not isinstance(raw_entries, list) or not raw_entries:
+        return jsonify({'success': False, 'error': 'A non-empty entries list is required'}), 400
+    if len(raw_entries) > ACTIVITY_LOG_BATCH_MAX:
+        return jsonify({'success': False, 'error': f'At most {ACTIVITY_LOG_BATCH_MAX} entries per batch'}), 400
+    
+    results = []
+    entries = []
+    for index, raw in enumerate(raw_entries):
+        try:
+            if not isinstance(raw, dict) or not raw.get('client_key'):
+                raise ValueError('client_key is required')
+            entry = normalize_activity_log_entry(raw)
+        except ValueError as e:
+            results.append({'index': index, 'client_key': raw.get('client_key') if isinstance(raw, dict) else None,
+                            'accepted': False, 'error': str(e)})
+            continue
+        session_recorder.record('activity_log', raw)
+        entries.append(entry)
+        results.append({'index': index, 'client_key': entry['client_key'], 'accepted': True})
+    
+    queued = False
+    if entries and ACTIVITY_LOG_ASYNC:
+        try:
+            for entry in entries:
+                activity_log_writer.submit(entry)
+            queued = True
+        except OSError as e:
+            # Entries already spooled are written anyway; their keys make the direct insert an upsert
+            logger.error(f"Activity log spool unavailable, inserting directly: {e}")
+    if entries and not queued:
+        error = insert_activity_logs_now(entries)
+        if error:
+            return error
+    
+    accepted = len(entries)
+    return jsonify({'success': True, 'queued': queued, 'accepted': accepted,
+                    'rejected': len(results) - accepted, 'results': results})
+
+@app.route('/api/activity-log/writer/stats')
+def api_activity_log_writer_stats():
+    """API endpoint to get activity log writer queue and batch statistics"""
+    return jsonify({'success': True, 'data': activity_log_writer.stats()})
+
 @app.route('/api/activity-logs/clear', methods=['DELETE'])
 def api_clear_activity_logs():
     """API endpoint to clear all activity logs."""
@@ -1081,8 +3205,20 @@ def api_clear_activity_logs():
     
     try:
         cursor = connection.cursor()
+        ensure_bill_rollup_tables(connection)
+        # Archived months go too, or rollup rebuilds and date-scoped reads would bring them back
+        archives = archived_log_tables()
+        for table in archives:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
         cursor.execute("DELETE FROM activity_logs")
+        for table in BILL_ROLLUP_TABLES:
+            cursor.execute(f"DELETE FROM {table}")
         connection.commit()
+        if archives:
+            refresh_archived_log_months(connection)
+            share_archived_log_months()
+        bump_data_version('activity_logs')
+        publish_bill_time_updates(connection)
         logger.info("Cleared all activity logs")
         return jsonify({'success': True, 'message': 'All logs cleared'})
     except mysql.connector.Error as err:
@@ -1100,8 +3236,12 @@ def api_delete_activity_log(log_id):
     
     try:
         cursor = connection.cursor()
+        ensure_bill_rollup_tables(connection)
+        rollup_bill_ids = apply_bill_rollup(connection, "id = %s", (log_id,), -1)
         cursor.execute("DELETE FROM activity_logs WHERE id = %s", (log_id,))
         connection.commit()
+        bump_data_version('activity_logs')
+        publish_bill_time_updates(connection, rollup_bill_ids)
         
         if cursor.rowcount > 0:
             logger.info(f"Deleted activity log entry: {log_id}")
@@ -1122,144 +3262,563 @@ def api_update_activity_log(log_id):
         return jsonify({'success': False, 'error': 'Database connection failed'}), 500
     
     try:
-        data = request.get_json()
-        spoken_seconds = data.get('spoken_seconds')
-        duration_seconds = data.get('duration_seconds')
-        
-        if spoken_seconds is None and duration_seconds is None:
-            return jsonify({'success': False, 'error': 'spoken_seconds or duration_seconds is required'}), 400
-        
-        updates = []
-        update_statements = []
-        params = []
-        if duration_seconds is not None:
-            updates.append("duration_seconds = %s")
-            params.append(int(duration_seconds))
-            update_statements.append(f"duration_seconds={int(duration_seconds)}")
-        if spoken_seconds is not None:
-            updates.append("spoken_seconds = %s")
-            params.append(int(spoken_seconds))
-            update_statements.append(f"spoken_seconds={int(spoken_seconds)}")
-        
-        cursor = connection.cursor()
-        cursor.execute(
-            f"UPDATE activity_logs SET {', '.join(updates)} WHERE id = %s",
-            (*params, log_id)
-        )
-        connection.commit()
-        
-        if cursor.rowcount > 0:
-            logger.info(f"Updated activity log entry {log_id}: {', '.join(update_statements)}")
-            return jsonify({'success': True, 'message': 'Log entry updated'})
-        else:
-            return jsonify({'success': False, 'error': 'Log entry not found'}), 404
-    except mysql.connector.Error as err:
-        logger.error(f"Database error: {err}")
-        return jsonify({'success': False, 'error': str(err)}), 500
+        data = request.get_json()
+        spoken_seconds = data.get('spoken_seconds')
+        duration_seconds = data.get('duration_seconds')
+        
+        if spoken_seconds is None and duration_seconds is None:
+            return jsonify({'success': False, 'error': 'spoken_seconds or duration_seconds is required'}), 400
+        
+        updates = []
+        update_statements = []
+        params = []
+        if duration_seconds is not None:
+            updates.append("duration_seconds = %s")
+            params.append(int(duration_seconds))
+            update_statements.append(f"duration_seconds={int(duration_seconds)}")
+        if spoken_seconds is not None:
+            updates.append("spoken_seconds = %s")
+            params.append(int(spoken_seconds))
+            update_statements.append(f"spoken_seconds={int(spoken_seconds)}")
+        
+        cursor = connection.cursor()
+        ensure_bill_rollup_tables(connection)
+        rollup_bill_ids = apply_bill_rollup(connection, "id = %s", (log_id,), -1)
+        cursor.execute(
+            f"UPDATE activity_logs SET {', '.join(updates)} WHERE id = %s",
+            (*params, log_id)
+        )
+        rollup_bill_ids |= apply_bill_rollup(connection, "id = %s", (log_id,), 1)
+        connection.commit()
+        bump_data_version('activity_logs')
+        publish_bill_time_updates(connection, rollup_bill_ids)
+        
+        if cursor.rowcount > 0:
+            logger.info(f"Updated activity log entry {log_id}: {', '.join(update_statements)}")
+            return jsonify({'success': True, 'message': 'Log entry updated'})
+        else:
+            return jsonify({'success': False, 'error': 'Log entry not found'}), 404
+    except mysql.connector.Error as err:
+        logger.error(f"Database error: {err}")
+        return jsonify({'success': False, 'error': str(err)}), 500
+    finally:
+        connection.close()
+
+# ============ BACKGROUND JOBS ============
+
+# Maintenance operations (bill id migration, merges, seat backfill, bulk
+# deletes) run on a small worker pool instead of inside the request. Each
+# job commits in chunks of JOB_CHUNK_SIZE logs, can be cancelled between
+# chunks, and reports progress over Socket.IO as `job_progress`.
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '2'))
+JOB_CHUNK_SIZE = int(os.getenv('JOB_CHUNK_SIZE', '1000'))
+JOB_DEFAULT_WAIT = 10            # seconds a submitting request waits for the result
+JOB_PROGRESS_INTERVAL = 0.25     # seconds between progress events
+JOB_HISTORY_SIZE = 50            # finished jobs kept in memory
+JOB_FINISHED_STATES = ('succeeded', 'failed', 'cancelled')
+
+class JobCancelled(Exception):
+    pass
+
+class Job:
+    """One submitted job and its live state."""
+    def __init__(self, job_type, params):
+        self.id = uuid.uuid4().hex
+        self.job_type = job_type
+        self.params = params
+        self.status = 'queued'
+        self.progress = 0
+        self.total = None
+        self.message = ''
+        self.result = None
+        self.error = None
+        self.created_at = get_ist_now()
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+        self.done_event = threading.Event()
+        self.last_progress_sent = 0.0
+
+    def to_dict(self):
+        return {
+            'job_id': self.id,
+            'job_type': self.job_type,
+            'params': self.params,
+            'status': self.status,
+            'progress': self.progress,
+            'total': self.total,
+            'message': self.message,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'started_at': self.started_at.strftime('%Y-%m-%d %H:%M:%S') if self.started_at else None,
+            'finished_at': self.finished_at.strftime('%Y-%m-%d %H:%M:%S') if self.finished_at else None,
+        }
+
+    def report(self, progress, total=None, message=None, force=False, persist=False):
+        """Record progress; raises JobCancelled if cancellation was requested.
+        persist=True also stores it, for status polls answered by other workers."""
+        self.progress = progress
+        if total is not None:
+            self.total = total
+        if message is not None:
+            self.message = message
+        now = time.monotonic()
+        if force or now - self.last_progress_sent >= JOB_PROGRESS_INTERVAL:
+            self.last_progress_sent = now
+            event_dispatcher.publish('job_progress', self.to_dict())
+        if persist:
+            job_runner._save(self)
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+class JobRunner:
+    """Worker pool plus the maintenance_jobs table, which keeps a record of
+    every job (and marks jobs interrupted by a restart as failed)."""
+    def __init__(self, workers=JOB_WORKERS):
+        self.workers = workers
+        self.handlers = {}
+        self.jobs = OrderedDict()
+        self.lock = threading.Lock()
+        self.executor = None
+        self.table_ready = False
+
+    def register(self, job_type):
+        def decorator(func):
+            self.handlers[job_type] = func
+            return func
+        return decorator
+
+    def _ensure_table(self, connection):
+        if self.table_ready:
+            return
+        cursor = connection.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS maintenance_jobs (
+                id CHAR(32) PRIMARY KEY,
+                job_type VARCHAR(50) NOT NULL,
+                params TEXT,
+                status VARCHAR(20) NOT NULL,
+                progress INT DEFAULT 0,
+                total INT,
+                message VARCHAR(255),
+                result TEXT,
+                error TEXT,
+                created_at DATETIME NOT NULL,
+                started_at DATETIME,
+                finished_at DATETIME,
+                INDEX idx_jobs_created (created_at)
+            )
+        """)
+        # Jobs that were queued or running when the previous process stopped (created
+        # before this server started, so jobs running in other workers are left alone)
+        cursor.execute("""
+            UPDATE maintenance_jobs SET status = 'failed', error = 'Interrupted by server restart', finished_at = %s
+            WHERE status IN ('queued', 'running') AND created_at < %s
+        """, (get_ist_now().strftime('%Y-%m-%d %H:%M:%S'), SERVER_STARTED_AT.strftime('%Y-%m-%d %H:%M:%S')))
+        connection.commit()
+        self.table_ready = True
+
+    def _save(self, job):
+        """Upsert the job row on its own connection (never inside the job's transaction)."""
+        import json
+        connection = get_db_connection()
+        if not connection:
+            return
+        try:
+            self._ensure_table(connection)
+            state = job.to_dict()
+            connection.cursor().execute("""
+                INSERT INTO maintenance_jobs
+                    (id, job_type, params, status, progress, total, message, result, error, created_at, started_at, finished_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE status = VALUES(status), progress = VALUES(progress), total = VALUES(total),
+                    message = VALUES(message), result = VALUES(result), error = VALUES(error),
+                    started_at = VALUES(started_at), finished_at = VALUES(finished_at)
+            """, (job.id, job.job_type, json.dumps(job.params), job.status, job.progress, job.total,
+                  (job.message or '')[:255], json.dumps(job.result) if job.result is not None else None, job.error,
+                  state['created_at'], state['started_at'], state['finished_at']))
+            connection.commit()
+        except mysql.connector.Error as err:
+            logger.error(f"Could not save job {job.id}: {err}")
+        finally:
+            connection.close()
+
+    def submit(self, job_type, params):
+        from concurrent.futures import ThreadPoolExecutor
+        if job_type not in self.handlers:
+            raise ValueError(f'Unknown job type: {job_type}')
+        job = Job(job_type, params)
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='job')
+            self.jobs[job.id] = job
+            finished = [job_id for job_id, other in self.jobs.items() if other.status in JOB_FINISHED_STATES]
+            for job_id in finished[:max(0, len(finished) - JOB_HISTORY_SIZE)]:
+                del self.jobs[job_id]
+        self._save(job)
+        self.executor.submit(self._run, job)
+        logger.info(f"Queued job {job.id} ({job_type})")
+        return job
+
+    def _run(self, job):
+        if job.cancel_event.is_set():
+            self._finish(job, 'cancelled')
+            return
+        job.status = 'running'
+        job.started_at = get_ist_now()
+        self._save(job)
+        event_dispatcher.publish('job_progress', job.to_dict())
+        try:
+            job.result = self.handlers[job.job_type](job, job.params)
+            self._finish(job, 'succeeded')
+        except JobCancelled:
+            job.message = f'Cancelled after {job.progress} of {job.total or "?"}'
+            self._finish(job, 'cancelled')
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.job_type}) failed: {e}")
+            job.error = str(e)
+            self._finish(job, 'failed')
+
+    def _finish(self, job, status):
+        job.status = status
+        job.finished_at = get_ist_now()
+        self._save(job)
+        job.done_event.set()
+        event_dispatcher.publish('job_progress', job.to_dict())
+        logger.info(f"Job {job.id} ({job.job_type}) {status}")
+
+    def _stored(self, where_sql, params):
+        """Stored job rows (as to_dict() shapes) matching `where_sql`, newest first."""
+        import json
+        connection = get_db_connection()
+        if not connection:
+            return []
+        try:
+            self._ensure_table(connection)
+            cursor = connection.cursor(dictionary=True)
+            cursor.execute(f"SELECT * FROM maintenance_jobs WHERE {where_sql} ORDER BY created_at DESC LIMIT %s",
+                           tuple(params) + (JOB_HISTORY_SIZE,))
+            rows = cursor.fetchall()
+        except mysql.connector.Error as err:
+            logger.error(f"Could not read jobs: {err}")
+            return []
+        finally:
+            connection.close()
+        jobs = []
+        for row in rows:
+            for field in ('created_at', 'started_at', 'finished_at'):
+                if row.get(field):
+                    row[field] = row[field].strftime('%Y-%m-%d %H:%M:%S')
+            jobs.append({
+                'job_id': row.pop('id'), **row,
+                'params': json.loads(row['params']) if row.get('params') else None,
+                'result': json.loads(row['result']) if row.get('result') else None,
+            })
+        return jobs
+
+    def get(self, job_id):
+        """Live job state, or the stored row for jobs from earlier runs or other workers."""
+        with self.lock:
+            job = self.jobs.get(job_id)
+        if job:
+            return job.to_dict()
+        rows = self._stored("id = %s", (job_id,))
+        return rows[0] if rows else None
+
+    def list(self):
+        """Recent jobs, newest first. Workers share the list through the stored rows."""
+        with self.lock:
+            local = [job.to_dict() for job in reversed(self.jobs.values())]
+        if not CLUSTER_WORKER:
+            return local
+        live = {job['job_id']: job for job in local}
+        stored = [live.pop(job['job_id'], job) for job in self._stored("1 = 1", ())]
+        return sorted(list(live.values()) + stored, key=lambda job: job['created_at'], reverse=True)
+
+    def cancel(self, job_id):
+        """Request cancellation; a running job stops after its current chunk.
+        A job running in another worker is cancelled through the state bus."""
+        with self.lock:
+            job = self.jobs.get(job_id)
+        if job:
+            if job.status in JOB_FINISHED_STATES:
+                return False
+            job.cancel_event.set()
+            return True
+        if not CLUSTER_WORKER:
+            return False
+        stored = self.get(job_id)
+        if not stored or stored['status'] in JOB_FINISHED_STATES:
+            return False
+        cluster_bus.publish('job_cancel', {'job_id': job_id})
+        return True
+
+    def cancel_local(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+        if job and job.status not in JOB_FINISHED_STATES:
+            job.cancel_event.set()
+
+    def shutdown(self):
+        with self.lock:
+            for job in self.jobs.values():
+                job.cancel_event.set()
+            executor = self.executor
+        if executor:
+            executor.shutdown(wait=False)
+
+job_runner = JobRunner()
+
+def run_log_chunks(job, connection, select_ids_sql, params, apply_chunk, count_sql=None):
+    """Process matching activity logs in id order, JOB_CHUNK_SIZE at a time.
+    `select_ids_sql` selects log ids and must end with `id > %s ORDER BY id
+    LIMIT %s` (those two values are appended to `params`). apply_chunk(cursor,
+    ids, id_list_sql) changes the rows and returns how many changed. Rollups
+    are moved out before and back in after, and each chunk is committed and
+    announced on its own. Returns the number of rows changed."""
+    cursor = connection.cursor()
+    if count_sql:
+        cursor.execute(count_sql, tuple(params))
+        job.report(0, cursor.fetchone()[0], force=True, persist=True)
+    last_id = 0
+    changed = 0
+    while True:
+        cursor.execute(select_ids_sql, tuple(params) + (last_id, JOB_CHUNK_SIZE))
+        ids = [row[0] for row in cursor.fetchall()]
+        if not ids:
+            break
+        id_list_sql = f"id IN ({', '.join(['%s'] * len(ids))})"
+        bill_ids = apply_bill_rollup(connection, id_list_sql, ids, -1)
+        changed += apply_chunk(cursor, ids, id_list_sql)
+        bill_ids |= apply_bill_rollup(connection, id_list_sql, ids, 1)
+        connection.commit()
+        bump_data_version('activity_logs')
+        publish_bill_time_updates(connection, bill_ids)
+        last_id = ids[-1]
+        # Raises JobCancelled between chunks; committed chunks stay applied
+        job.report(changed, message=f'{changed} log entries processed', persist=True)
+        if len(ids) < JOB_CHUNK_SIZE:
+            break
+    return changed
+
+def job_connection():
+    connection = get_db_connection()
+    if not connection:
+        raise RuntimeError('Database connection failed')
+    return connection
+
+def job_response(job_type, params):
+    """Submit a job and wait up to `wait` seconds (default 10) for it. Returns the
+    job's result like a synchronous endpoint would, or 202 with the job id."""
+    try:
+        wait = float(request.args.get('wait', JOB_DEFAULT_WAIT))
+    except ValueError:
+        wait = JOB_DEFAULT_WAIT
+    job = job_runner.submit(job_type, params)
+    job.done_event.wait(max(0.0, min(wait, 60.0)))
+    state = job.to_dict()
+    if state['status'] == 'succeeded':
+        return jsonify({'success': True, 'job_id': job.id, **(state['result'] or {})})
+    if state['status'] in ('failed', 'cancelled'):
+        return jsonify({'success': False, 'job_id': job.id, 'error': state['error'] or state['message']}), 500
+    response = jsonify({'success': True, 'queued': True, 'job_id': job.id, 'status': state['status'],
+                        'message': f'{job_type} is running in the background'})
+    response.status_code = 202
+    response.headers['Location'] = f'/api/jobs/{job.id}'
+    return response
+
+@app.route('/api/jobs')
+def api_list_jobs():
+    """API endpoint to list recent background jobs (newest first)"""
+    return jsonify({'success': True, 'data': job_runner.list()})
+
+@app.route('/api/jobs', methods=['POST'])
+def api_submit_job():
+    """API endpoint to submit a background job: {"type": ..., "params": {...}}"""
+    data = request.get_json(silent=True) or {}
+    try:
+        job = job_runner.submit(data.get('type'), data.get('params') or {})
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    return jsonify({'success': True, 'data': job.to_dict()}), 202
+
+@app.route('/api/jobs/<job_id>')
+def api_get_job(job_id):
+    """API endpoint to get a background job's status, progress and result"""
+    job = job_runner.get(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'data': job})
+
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def api_cancel_job(job_id):
+    """API endpoint to cancel a queued or running job (stops after the current chunk)"""
+    if not job_runner.cancel(job_id):
+        return jsonify({'success': False, 'error': 'Job not found or already finished'}), 404
+    return jsonify({'success': True, 'message': 'Cancellation requested'})
+
+@job_runner.register('delete-bill-logs')
+def job_delete_bill_logs(job, params):
+    bill_name = params['bill_name']
+    condition = "bill_name = %s"
+    values = [bill_name]
+    if params.get('date'):
+        day_start, day_end = day_range(params['date'])
+        condition += " AND start_time >= %s AND start_time < %s"
+        values.extend([day_start, day_end])
+    
+    def delete_chunk(cursor, ids, id_list_sql):
+        cursor.execute(f"DELETE FROM activity_logs WHERE {id_list_sql}", tuple(ids))
+        return cursor.rowcount
+    
+    connection = job_connection()
+    try:
+        ensure_bill_rollup_tables(connection)
+        deleted_count = run_log_chunks(
+            job, connection,
+            f"SELECT id FROM activity_logs WHERE {condition} AND id > %s ORDER BY id LIMIT %s", values,
+            delete_chunk, count_sql=f"SELECT COUNT(*) FROM activity_logs WHERE {condition}")
+        archived_count, bill_ids = apply_to_archived_logs(
+            connection, "DELETE FROM {table}", condition, where_params=values)
+        if archived_count:
+            bill_ids |= bill_ids_named(connection, bill_name)
+            rebuild_bill_rollups(connection, bill_ids)
+            connection.commit()
+            bump_data_version('activity_logs')
+            publish_bill_time_updates(connection, bill_ids)
+            deleted_count += archived_count
     finally:
         connection.close()
+    
+    logger.info(f"Deleted {deleted_count} activity log entries for bill: {bill_name}")
+    return {'message': f'Deleted {deleted_count} log entries for "{bill_name}"', 'deleted_count': deleted_count}
 
 @app.route('/api/activity-logs/by-bill', methods=['DELETE'])
 def api_delete_activity_logs_by_bill():
-    """API endpoint to delete all activity logs for a specific bill."""
+    """API endpoint to delete all activity logs for a specific bill (runs as a background job)."""
     bill_name = request.args.get('bill_name')
     date_filter = request.args.get('date')  # Optional date filter
     
     if not bill_name:
         return jsonify({'success': False, 'error': 'bill_name parameter is required'}), 400
+    if date_filter:
+        try:
+            day_range(date_filter)
+        except ValueError:
+            return jsonify({'success': False, 'error': 'Invalid date'}), 400
+    return job_response('delete-bill-logs', {'bill_name': bill_name, 'date': date_filter})
+
+# Latest bill with each name (the old per-bill loop left the highest id's update in place)
+LATEST_BILL_BY_NAME_SQL = "(SELECT bill_name, MAX(id) AS id FROM bill_details GROUP BY bill_name) b"
+
+@job_runner.register('migrate-bill-ids')
+def job_migrate_bill_ids(job, params):
+    def link_chunk(cursor, ids, id_list_sql):
+        cursor.execute(f"""
+            UPDATE activity_logs a
+            JOIN {LATEST_BILL_BY_NAME_SQL} ON a.bill_name = b.bill_name
+            SET a.bill_id = b.id
+            WHERE a.{id_list_sql}
+        """, tuple(ids))
+        return cursor.rowcount
     
-    connection = get_db_connection()
-    if not connection:
-        return jsonify({'success': False, 'error': 'Database connection failed'}), 500
-    
+    needs_link = f"""
+        FROM activity_logs a
+        JOIN {LATEST_BILL_BY_NAME_SQL} ON a.bill_name = b.bill_name
+        WHERE (a.bill_id IS NULL OR a.bill_id != b.id)
+    """
+    connection = job_connection()
     try:
+        ensure_activity_log_table(connection)
+        ensure_bill_rollup_tables(connection)
+        updated_count = run_log_chunks(
+            job, connection,
+            f"SELECT a.id {needs_link} AND a.id > %s ORDER BY a.id LIMIT %s", [],
+            link_chunk, count_sql=f"SELECT COUNT(*) {needs_link}")
+        # Archived months in one statement each; any change means a full rollup rebuild
         cursor = connection.cursor()
-        
-        if date_filter:
-            cursor.execute("""
-                DELETE FROM activity_logs 
-                WHERE bill_name = %s AND DATE(start_time) = %s
-            """, (bill_name, date_filter))
-        else:
-            cursor.execute("DELETE FROM activity_logs WHERE bill_name = %s", (bill_name,))
-        
-        deleted_count = cursor.rowcount
-        connection.commit()
-        
-        logger.info(f"Deleted {deleted_count} activity log entries for bill: {bill_name}")
-        return jsonify({
-            'success': True, 
-            'message': f'Deleted {deleted_count} log entries for "{bill_name}"',
-            'deleted_count': deleted_count
-        })
-    except mysql.connector.Error as err:
-        logger.error(f"Database error: {err}")
-        return jsonify({'success': False, 'error': str(err)}), 500
+        archived_count = 0
+        for table in archived_log_tables():
+            cursor.execute(f"""
+                UPDATE {table} a
+                JOIN {LATEST_BILL_BY_NAME_SQL} ON a.bill_name = b.bill_name
+                SET a.bill_id = b.id
+                WHERE (a.bill_id IS NULL OR a.bill_id != b.id)
+            """)
+            archived_count += cursor.rowcount
+        if archived_count:
+            rebuild_bill_rollups(connection)
+            connection.commit()
+            bump_data_version('activity_logs')
+            publish_bill_time_updates(connection)
+            updated_count += archived_count
     finally:
         connection.close()
+    
+    logger.info(f"Migrated {updated_count} activity log entries with bill_id")
+    return {'message': f'Updated {updated_count} log entries with bill_id', 'updated_count': updated_count}
 
 @app.route('/api/activity-logs/migrate-bill-ids', methods=['POST'])
 def api_migrate_bill_ids():
     """Migrate existing activity logs to use bill_id instead of just bill_name.
-    This will match logs with bill_details entries and set the bill_id."""
-    connection = get_db_connection()
-    if not connection:
-        return jsonify({'success': False, 'error': 'Database connection failed'}), 500
+    This will match logs with bill_details entries and set the bill_id (runs as a background job)."""
+    return job_response('migrate-bill-ids', {})
+
+@job_runner.register('merge-bills')
+def job_merge_bill_logs(job, params):
+    old_bill_name = params['old_bill_name']
+    target_bill_id = int(params['target_bill_id'])
+    new_bill_name = params['new_bill_name']
+    
+    def merge_chunk(cursor, ids, id_list_sql):
+        cursor.execute(f"UPDATE activity_logs SET bill_id = %s, bill_name = %s WHERE {id_list_sql}",
+                       (target_bill_id, new_bill_name) + tuple(ids))
+        return cursor.rowcount
     
+    # Logs already merged drop out of the selection, so the scan always terminates
+    condition = "bill_name = %s AND (bill_id IS NULL OR bill_id != %s OR BINARY bill_name != BINARY %s)"
+    values = [old_bill_name, target_bill_id, new_bill_name]
+    connection = job_connection()
     try:
-        cursor = connection.cursor(dictionary=True)
-        
-        # Ensure bill_id column exists
-        try:
-            cursor.execute("ALTER TABLE activity_logs ADD COLUMN bill_id INT")
+        ensure_bill_rollup_tables(connection)
+        merged_count = run_log_chunks(
+            job, connection,
+            f"SELECT id FROM activity_logs WHERE {condition} AND id > %s ORDER BY id LIMIT %s", values,
+            merge_chunk, count_sql=f"SELECT COUNT(*) FROM activity_logs WHERE {condition}")
+        archived_count, bill_ids = apply_to_archived_logs(
+            connection, "UPDATE {table} SET bill_id = %s, bill_name = %s", condition,
+            (target_bill_id, new_bill_name), values)
+        if archived_count:
+            bill_ids |= bill_ids_named(connection, old_bill_name) | {target_bill_id}
+            rebuild_bill_rollups(connection, bill_ids)
             connection.commit()
-        except:
-            pass  # Column already exists
-        
-        # Get all bill_details
-        cursor.execute("SELECT id, bill_name FROM bill_details")
-        bills = cursor.fetchall()
-        
-        updated_count = 0
-        for bill in bills:
-            # Update logs that match this bill name but don't have bill_id set
-            cursor.execute("""
-                UPDATE activity_logs 
-                SET bill_id = %s 
-                WHERE bill_name = %s AND (bill_id IS NULL OR bill_id != %s)
-            """, (bill['id'], bill['bill_name'], bill['id']))
-            updated_count += cursor.rowcount
-        
-        connection.commit()
-        
-        logger.info(f"Migrated {updated_count} activity log entries with bill_id")
-        return jsonify({
-            'success': True,
-            'message': f'Updated {updated_count} log entries with bill_id',
-            'updated_count': updated_count
-        })
-    except mysql.connector.Error as err:
-        logger.error(f"Database error: {err}")
-        return jsonify({'success': False, 'error': str(err)}), 500
+            bump_data_version('activity_logs')
+            publish_bill_time_updates(connection, bill_ids)
+            merged_count += archived_count
     finally:
         connection.close()
+    
+    logger.info(f"Merged {merged_count} logs from '{old_bill_name}' to bill_id {target_bill_id} ('{new_bill_name}')")
+    return {'message': f'Merged {merged_count} log entries from "{old_bill_name}" to "{new_bill_name}"',
+            'merged_count': merged_count}
 
 @app.route('/api/activity-logs/merge-bills', methods=['POST'])
 def api_merge_bill_logs():
     """Merge activity logs from an old bill name to a target bill_id.
     This is used when a bill name was changed and old logs still have the old name."""
+    data = request.get_json(silent=True) or {}
+    old_bill_name = data.get('old_bill_name')
+    target_bill_id = data.get('target_bill_id')
+    
+    if not old_bill_name or not target_bill_id:
+        return jsonify({'success': False, 'error': 'old_bill_name and target_bill_id are required'}), 400
+    
     connection = get_db_connection()
     if not connection:
         return jsonify({'success': False, 'error': 'Database connection failed'}), 500
     
     try:
-        data = request.get_json()
-        old_bill_name = data.get('old_bill_name')
-        target_bill_id = data.get('target_bill_id')
-        
-        if not old_bill_name or not target_bill_id:
-            return jsonify({'success': False, 'error': 'old_bill_name and target_bill_id are required'}), 400
-        
         cursor = connection.cursor(dictionary=True)
         
         # Get the current bill name for the target
@@ -1267,99 +3826,209 @@ def api_merge_bill_logs():
         target_bill = cursor.fetchone()
         if not target_bill:
             return jsonify({'success': False, 'error': 'Target bill not found'}), 404
-        
-        new_bill_name = target_bill['bill_name']
-        
-        # Update all logs with the old bill name to use the new bill_id and name
-        cursor.execute("""
-            UPDATE activity_logs 
-            SET bill_id = %s, bill_name = %s
-            WHERE bill_name = %s
-        """, (target_bill_id, new_bill_name, old_bill_name))
-        
-        merged_count = cursor.rowcount
-        connection.commit()
-        
-        logger.info(f"Merged {merged_count} logs from '{old_bill_name}' to bill_id {target_bill_id} ('{new_bill_name}')")
-        return jsonify({
-            'success': True,
-            'message': f'Merged {merged_count} log entries from "{old_bill_name}" to "{new_bill_name}"',
-            'merged_count': merged_count
-        })
     except mysql.connector.Error as err:
         logger.error(f"Database error: {err}")
         return jsonify({'success': False, 'error': str(err)}), 500
     finally:
         connection.close()
+    
+    return job_response('merge-bills', {'old_bill_name': old_bill_name, 'target_bill_id': int(target_bill_id),
+                                        'new_bill_name': target_bill['bill_name']})
+
+# ============ SEAT NUMBER BACKFILL ============
+
+SEAT_BACKFILL_REPORT_LIMIT = 200
+
+def plan_seat_backfill(connection):
+    """Resolve each distinct member name of logs without a seat. Returns
+    (assignments [(member_name, seat_no)], report dict)."""
+    cursor = connection.cursor(dictionary=True)
+    cursor.execute("SELECT seat_no, name FROM parliament_seats")
+    index = NameIndex((seat['seat_no'], seat['name']) for seat in cursor.fetchall())
+    
+    # One row per distinct name instead of one lookup per log
+    cursor.execute("""
+        SELECT member_name, COUNT(*) AS log_count FROM activity_logs 
+        WHERE seat_no IS NULL OR seat_no = ''
+        GROUP BY member_name
+    """)
+    assignments = []
+    ambiguous = []
+    not_found = []
+    by_tier = {'exact': 0, 'normalized': 0, 'fuzzy': 0}
+    not_found_count = 0
+    for row in cursor.fetchall():
+        tier, seat_nos = index.match(row['member_name'])
+        if len(seat_nos) == 1:
+            assignments.append((row['member_name'], next(iter(seat_nos))))
+            by_tier[tier] += row['log_count']
+        elif seat_nos:
+            ambiguous.append({'member_name': row['member_name'], 'log_count': row['log_count'],
+                              'tier': tier,
+                              'candidates': [{'seat_no': c['id'], 'name': c['name']} for c in index.describe(seat_nos)]})
+        else:
+            not_found_count += row['log_count']
+            if row['member_name']:
+                not_found.append({'member_name': row['member_name'], 'log_count': row['log_count']})
+    return assignments, {
+        'updated': sum(by_tier.values()),
+        'matched_by_tier': by_tier,
+        'not_found': not_found_count,
+        'ambiguous': ambiguous[:SEAT_BACKFILL_REPORT_LIMIT],
+        'ambiguous_count': len(ambiguous),
+        'unmatched_names': not_found[:SEAT_BACKFILL_REPORT_LIMIT]
+    }
+
+@job_runner.register('update-seat-numbers')
+def job_update_seat_numbers(job, params):
+    dry_run = bool(params.get('dry_run'))
+    
+    def fill_chunk(cursor, ids, id_list_sql):
+        cursor.execute(f"""
+            UPDATE activity_logs a
+            JOIN seat_backfill s ON a.member_name = s.member_name
+            SET a.seat_no = s.seat_no
+            WHERE a.{id_list_sql}
+        """, tuple(ids))
+        return cursor.rowcount
+    
+    connection = job_connection()
+    try:
+        ensure_activity_log_table(connection)
+        ensure_bill_rollup_tables(connection)
+        assignments, report = plan_seat_backfill(connection)
+        if assignments and not dry_run:
+            # Apply the matches with UPDATE ... JOIN against a temporary table, chunk by chunk
+            cursor = connection.cursor()
+            cursor.execute("""
+                CREATE TEMPORARY TABLE seat_backfill (
+                    member_name VARCHAR(255) NOT NULL PRIMARY KEY,
+                    seat_no VARCHAR(20) NOT NULL
+                )
+            """)
+            cursor.executemany("INSERT IGNORE INTO seat_backfill (member_name, seat_no) VALUES (%s, %s)", assignments)
+            missing_seat = """
+                FROM activity_logs a
+                JOIN seat_backfill s ON a.member_name = s.member_name
+                WHERE (a.seat_no IS NULL OR a.seat_no = '')
+            """
+            report['updated'] = run_log_chunks(
+                job, connection,
+                f"SELECT a.id {missing_seat} AND a.id > %s ORDER BY a.id LIMIT %s", [],
+                fill_chunk, count_sql=f"SELECT COUNT(*) {missing_seat}")
+            cursor.execute("DROP TEMPORARY TABLE seat_backfill")
+    finally:
+        connection.close()
+    
+    verb = 'Would update' if dry_run else 'Updated'
+    logger.info(f"{verb} {report['updated']} activity logs with seat numbers, "
+                f"{report['ambiguous_count']} ambiguous names, {report['not_found']} logs not found")
+    return {'message': f"{verb} {report['updated']} activity logs with seat numbers", 'dry_run': dry_run, **report}
 
 @app.route('/api/activity-logs/update-seat-numbers', methods=['POST'])
 def api_update_activity_log_seat_numbers():
-    """API endpoint to update all activity logs with seat numbers from parliament_seats table."""
+    """API endpoint to fill in missing activity log seat numbers from parliament_seats.
+    Each distinct member name is resolved once; names matching more than one
+    seat are reported under `ambiguous` and left unchanged. Pass
+    `{"dry_run": true}` to get the report without updating. Runs as a background job."""
+    data = request.get_json(silent=True) or {}
+    return job_response('update-seat-numbers', {'dry_run': bool(data.get('dry_run'))})
+
+def bill_activity_log_query(cursor, bill_name, day_start=None, day_end=None):
+    """Build the SELECT for a bill's Bill Discussion logs, newest first. Returns (sql, params)."""
+    # First, try to find the bill_id for this bill_name
+    cursor.execute("SELECT id FROM bill_details WHERE bill_name = %s", (bill_name,))
+    bill_row = cursor.fetchone()
+    bill_id = bill_row['id'] if bill_row else None
+    source = activity_log_source(day_start, day_end)
+    
+    # Query logs by bill_id OR bill_name (to catch both old and new logs)
+    if bill_id:
+        base_query = f"""
+            SELECT * FROM {source} 
+            WHERE activity_type = 'Bill Discussion' 
+              AND (bill_id = %s OR bill_name = %s)
+        """
+        params = [bill_id, bill_name]
+    else:
+        base_query = f"""
+            SELECT * FROM {source} 
+            WHERE activity_type = 'Bill Discussion' 
+              AND bill_name = %s
+        """
+        params = [bill_name]
+    
+    if day_start:
+        base_query += " AND start_time >= %s AND start_time < %s"
+        params.extend([day_start, day_end])
+    
+    base_query += " ORDER BY start_time DESC"
+    return base_query, params
+
+def query_bill_activity_logs(bill_name, day_start=None, day_end=None):
+    """Load a bill's logs with ISO timestamps; None if the query failed."""
     connection = get_db_connection()
     if not connection:
-        return jsonify({'success': False, 'error': 'Database connection failed'}), 500
+        return None
     
     try:
         cursor = connection.cursor(dictionary=True)
+        base_query, params = bill_activity_log_query(cursor, bill_name, day_start, day_end)
+        cursor.execute(base_query, tuple(params))
+        logs = cursor.fetchall()
         
-        # First, ensure seat_no column exists
-        try:
-            cursor.execute("ALTER TABLE activity_logs ADD COLUMN seat_no VARCHAR(20)")
-            connection.commit()
-        except:
-            pass  # Column already exists
-        
-        # Get all activity logs that don't have seat_no or have empty seat_no
-        cursor.execute("""
-            SELECT id, member_name FROM activity_logs 
-            WHERE seat_no IS NULL OR seat_no = ''
-        """)
-        logs_to_update = cursor.fetchall()
-        
-        updated_count = 0
-        not_found_count = 0
-        
-        for log in logs_to_update:
-            member_name = log.get('member_name')
-            if member_name:
-                # Look up seat_no from parliament_seats by member name
-                cursor.execute("""
-                    SELECT seat_no FROM parliament_seats 
-                    WHERE name = %s OR name LIKE %s
-                    LIMIT 1
-                """, (member_name, f"%{member_name}%"))
-                
-                result = cursor.fetchone()
-                if result and result.get('seat_no'):
-                    # Update the activity log with the seat_no
-                    cursor.execute("""
-                        UPDATE activity_logs 
-                        SET seat_no = %s 
-                        WHERE id = %s
-                    """, (result['seat_no'], log['id']))
-                    updated_count += 1
-                else:
-                    not_found_count += 1
-        
-        connection.commit()
-        logger.info(f"Updated {updated_count} activity logs with seat numbers, {not_found_count} members not found")
-        
-        return jsonify({
-            'success': True, 
-            'message': f'Updated {updated_count} activity logs with seat numbers',
-            'updated': updated_count,
-            'not_found': not_found_count
-        })
+        # Convert datetime objects to strings
+        for log in logs:
+            if log.get('start_time'):
+                log['start_time'] = log['start_time'].isoformat()
+            if log.get('end_time'):
+                log['end_time'] = log['end_time'].isoformat()
+            if log.get('created_at'):
+                log['created_at'] = log['created_at'].isoformat()
+        return logs
     except mysql.connector.Error as err:
         logger.error(f"Database error: {err}")
-        return jsonify({'success': False, 'error': str(err)}), 500
+        return None
     finally:
         connection.close()
 
 @app.route('/api/activity-logs/bill/<bill_name>')
+@versioned_get('activity_logs', 'bill_details')
 def api_get_bill_activity_logs(bill_name):
     """API endpoint to get activity logs for a specific bill (optionally filtered by date).
     Now also looks up by bill_id if the bill_name matches a bill in bill_details."""
+    date_filter = request.args.get('date')
+    day_start = day_end = None
+    if date_filter:
+        try:
+            day_start, day_end = day_range(date_filter)
+        except ValueError:
+            return jsonify({'success': False, 'error': 'Invalid date'}), 400
+    
+    stream_format = get_stream_format()
+    if stream_format:
+        connection = get_db_connection()
+        if not connection:
+            return jsonify({'success': False, 'error': 'Database connection failed'}), 500
+        try:
+            base_query, params = bill_activity_log_query(connection.cursor(dictionary=True), bill_name, day_start, day_end)
+        except mysql.connector.Error as err:
+            logger.error(f"Database error: {err}")
+            return jsonify({'success': False, 'error': str(err)}), 500
+        finally:
+            connection.close()
+        return stream_log_rows(base_query, params, stream_format, iso_dates=True)
+    
+    logs = query_cache.get('activity-logs/bill', (bill_name, day_start), ('activity_logs', 'bill_details'),
+                           lambda: query_bill_activity_logs(bill_name, day_start, day_end))
+    if logs is None:
+        return jsonify({'success': False, 'error': 'Database query failed'}), 500
+    return jsonify({'success': True, 'data': logs})
+
+@app.route('/api/activity-logs/by-bill-id/<int:bill_id>')
+@versioned_get('activity_logs', 'bill_details')
+def api_get_activity_logs_by_bill_id(bill_id):
+    """API endpoint to get activity logs for a specific bill by bill_id."""
     connection = get_db_connection()
     if not connection:
         return jsonify({'success': False, 'error': 'Database connection failed'}), 500
@@ -1367,38 +4036,36 @@ def api_get_bill_activity_logs(bill_name):
     try:
         cursor = connection.cursor(dictionary=True)
         date_filter = request.args.get('date')
+        day_start = day_end = None
+        if date_filter:
+            try:
+                day_start, day_end = day_range(date_filter)
+            except ValueError:
+                return jsonify({'success': False, 'error': 'Invalid date'}), 400
         
-        # First, try to find the bill_id for this bill_name
-        cursor.execute("SELECT id FROM bill_details WHERE bill_name = %s", (bill_name,))
-        bill_row = cursor.fetchone()
-        bill_id = bill_row['id'] if bill_row else None
-        
-        # Query logs by bill_id OR bill_name (to catch both old and new logs)
-        if bill_id:
-            base_query = """
-                SELECT * FROM activity_logs 
-                WHERE activity_type = 'Bill Discussion' 
-                  AND (bill_id = %s OR bill_name = %s)
-            """
-            params = [bill_id, bill_name]
-        else:
-            base_query = """
-                SELECT * FROM activity_logs 
-                WHERE activity_type = 'Bill Discussion' 
-                  AND bill_name = %s
-            """
-            params = [bill_name]
+        base_query = f"""
+            SELECT a.*, b.bill_name as current_bill_name 
+            FROM {activity_log_source(day_start, day_end, alias='a')}
+            LEFT JOIN bill_details b ON a.bill_id = b.id
+            WHERE a.activity_type = 'Bill Discussion' 
+              AND a.bill_id = %s
+        """
+        params = [bill_id]
         
         if date_filter:
-            base_query += " AND DATE(start_time) = %s"
-            params.append(date_filter)
+            base_query += " AND a.start_time >= %s AND a.start_time < %s"
+            params.extend([day_start, day_end])
         
-        base_query += " ORDER BY start_time DESC"
+        base_query += " ORDER BY a.start_time DESC"
+
+        stream_format = get_stream_format()
+        if stream_format:
+            return stream_log_rows(base_query, params, stream_format, iso_dates=True)
+
         cursor.execute(base_query, tuple(params))
         
         logs = cursor.fetchall()
         
-        # Convert datetime objects to strings
         for log in logs:
             if log.get('start_time'):
                 log['start_time'] = log['start_time'].isoformat()
@@ -1411,53 +4078,737 @@ def api_get_bill_activity_logs(bill_name):
     except mysql.connector.Error as err:
         logger.error(f"Database error: {err}")
         return jsonify({'success': False, 'error': str(err)}), 500
-    finally:
-        connection.close()
+    finally:
+        connection.close()
+
+# ============ LOG EXPORT API ============
+
+EXPORT_CATEGORIES = {
+    'zero-hour': 'Zero Hour',
+    'member-speaking': 'Member Speaking',
+    'bill-discussion': 'Bill Discussion',
+}
+EXPORT_MIMETYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+ZERO_HOUR_DEFAULT_ALLOTTED = 180
+
+def iter_query_rows(query, params, chunk_size=STREAM_CHUNK_ROWS):
+    """Yield dict rows from an unbuffered cursor, fetching chunk_size rows at a time."""
+    connection = get_db_connection()
+    if not connection:
+        raise mysql.connector.Error(msg='Database connection failed')
+    try:
+        cursor = connection.cursor(dictionary=True, buffered=False)
+        cursor.execute(query, tuple(params))
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            for row in rows:
+                yield row
+    finally:
+        connection.close()
+
+def format_duration(seconds):
+    """Format seconds like the frontend does: '1h 2m 3s' or '2m 3s'."""
+    seconds = int(seconds or 0)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours > 0:
+        return f"{hours}h {minutes}m {secs}s"
+    return f"{minutes}m {secs}s"
+
+def get_export_range():
+    """Parse from/to (or a single date) query params into a [start, end) datetime range.
+    Raises ValueError for malformed dates."""
+    date_from = request.args.get('from') or request.args.get('date')
+    date_to = request.args.get('to') or date_from
+    if not date_from:
+        return None, None, 'all'
+    start, _ = day_range(date_from)
+    _, end = day_range(date_to)
+    if end <= start:
+        raise ValueError('"to" date must not be before "from" date')
+    label = date_from if date_from == date_to else f"{date_from}_to_{date_to}"
+    return start, end, label
+
+def export_response(rows, header, filename_base, sheet_name, export_format, bold_rows=None):
+    """Wrap an export row iterator in a streaming CSV or XLSX download."""
+    import re
+    safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', filename_base).strip('_') or 'export'
+    if export_format == 'xlsx':
+        body = xlsx_stream(sheet_name, header, rows, bold_rows=bold_rows)
+    else:
+        body = csv_stream(header, rows)
+    response = Response(stream_with_context(body), mimetype=EXPORT_MIMETYPES[export_format])
+    response.headers['Content-Disposition'] = f'attachment; filename="{safe_name}.{export_format}"'
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+def category_export_rows(activity_type, start=None, end=None):
+    """Return (header, row iterator) for a category's logs, oldest first, with a total row."""
+    query = f"""
+        SELECT start_time, member_name, party, heading, chairperson,
+               allotted_seconds, duration_seconds, bill_name, notes
+        FROM {activity_log_source(start, end)}
+        WHERE activity_type = %s
+    """
+    params = [activity_type]
+    if start:
+        query += " AND start_time >= %s AND start_time < %s"
+        params.extend([start, end])
+    query += " ORDER BY start_time, id"
+
+    if activity_type == 'Member Speaking':
+        header = ['S.No', 'Date', 'Time', 'Member Name', 'Party', 'Heading', 'Chairperson', 'Duration', 'Notes']
+    elif activity_type == 'Zero Hour':
+        header = ['S.No', 'Date', 'Time', 'Member Name', 'Party', 'Chairperson', 'Allotted', 'Duration', 'Notes']
+    else:
+        header = ['S.No', 'Date', 'Time', 'Bill', 'Member Name', 'Party', 'Chairperson', 'Duration', 'Notes']
+
+    def rows():
+        total = 0
+        for index, log in enumerate(iter_query_rows(query, params), 1):
+            start_time = log['start_time']
+            date_str = start_time.strftime('%d-%m-%Y') if start_time else '-'
+            time_str = start_time.strftime('%I:%M:%S %p') if start_time else '-'
+            duration = log.get('duration_seconds') or 0
+            total += duration
+            if activity_type == 'Member Speaking':
+                yield [index, date_str, time_str, log['member_name'] or '-', log['party'] or '-',
+                       log['heading'] or '-', log['chairperson'] or '-', format_duration(duration), log['notes'] or '-']
+            elif activity_type == 'Zero Hour':
+                allotted = log.get('allotted_seconds') or ZERO_HOUR_DEFAULT_ALLOTTED
+                yield [index, date_str, time_str, log['member_name'] or '-', log['party'] or '-',
+                       log['chairperson'] or '-', format_duration(allotted), format_duration(duration), log['notes'] or '-']
+            else:
+                yield [index, date_str, time_str, log['bill_name'] or '-', log['member_name'] or '-',
+                       log['party'] or '-', log['chairperson'] or '-', format_duration(duration), log['notes'] or '-']
+        total_row = [''] * len(header)
+        total_row[-3] = 'Total:'
+        total_row[-2] = format_duration(total)
+        yield total_row
+
+    return header, rows()
+
+def bill_export_rows(bill_id, bill_name, start=None, end=None):
+    """Return (header, row iterator) for a bill's speeches grouped by normalized party
+    key (as the bill totals are) and member, with member, party and grand totals."""
+    query = f"""
+        SELECT {party_key_sql('party')} AS party_key, TRIM(party) AS party, seat_no, member_name,
+               start_time, duration_seconds
+        FROM {activity_log_source(start, end)}
+        WHERE activity_type = 'Bill Discussion'
+          AND (bill_id = %s OR (bill_id IS NULL AND bill_name = %s))
+    """
+    params = [bill_id, bill_name]
+    if start:
+        query += " AND start_time >= %s AND start_time < %s"
+        params.extend([start, end])
+    query += " ORDER BY party_key, seat_no, member_name, start_time, id"
+
+    header = ['Party', 'Seat No', 'Member Name', 'Speech Date/Time', 'Speech Duration', 'Member Total', 'Party Total']
+
+    def rows():
+        # Rows arrive grouped by party then member, so totals are emitted on group change
+        # Spellings of one party ("BJP", "bjp ") share a key; the group shows the first one seen
+        grand_total = 0
+        party_key = party = member_key = member_label = None
+        party_total = member_total = 0
+        for log in iter_query_rows(query, params):
+            key = (log['seat_no'] or '', log['member_name'] or '')
+            if member_key is not None and (log['party_key'] != party_key or key != member_key):
+                yield ['', member_key[0] or '-', f"{member_label} Total:", '', '', format_duration(member_total), '']
+                member_total = 0
+            if party_key is not None and log['party_key'] != party_key:
+                yield [f"{party} Total:", '', '', '', '', '', format_duration(party_total)]
+                party_total = 0
+            if log['party_key'] != party_key:
+                party_key, party = log['party_key'], log['party'] or 'Others'
+            member_key, member_label = key, log['member_name'] or '-'
+            duration = log['duration_seconds'] or 0
+            member_total += duration
+            party_total += duration
+            grand_total += duration
+            start_time = log['start_time']
+            yield [party, log['seat_no'] or '-', member_label,
+                   start_time.strftime('%d-%m-%Y %I:%M:%S %p') if start_time else '-',
+                   format_duration(duration), '', '']
+        if member_key is not None:
+            yield ['', member_key[0] or '-', f"{member_label} Total:", '', '', format_duration(member_total), '']
+            yield [f"{party} Total:", '', '', '', '', '', format_duration(party_total)]
+        yield ['Grand Total:', '', '', '', '', '', format_duration(grand_total)]
+
+    return header, rows()
+
+def get_bill_name(bill_id):
+    """Look up a bill's current name; returns None if the bill does not exist."""
+    connection = get_db_connection()
+    if not connection:
+        raise mysql.connector.Error(msg='Database connection failed')
+    try:
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute("SELECT bill_name FROM bill_details WHERE id = %s", (bill_id,))
+        bill = cursor.fetchone()
+        return bill['bill_name'] if bill else None
+    finally:
+        connection.close()
+
+@app.route('/api/export/logs/<category>')
+def api_export_category_logs(category):
+    """Stream Zero Hour / Member Speaking / Bill Discussion logs as CSV or XLSX.
+    Query params: format=csv|xlsx, from=YYYY-MM-DD, to=YYYY-MM-DD (or date=)."""
+    activity_type = EXPORT_CATEGORIES.get(category)
+    if not activity_type:
+        return jsonify({'success': False, 'error': f'Unknown export category: {category}'}), 404
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_MIMETYPES:
+        return jsonify({'success': False, 'error': 'format must be csv or xlsx'}), 400
+    try:
+        start, end, range_label = get_export_range()
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    header, rows = category_export_rows(activity_type, start, end)
+    return export_response(rows, header, f"{activity_type}_{range_label}", activity_type,
+                           export_format, bold_rows=is_total_row)
+
+@app.route('/api/export/bill/<int:bill_id>')
+def api_export_bill_logs(bill_id):
+    """Stream a per-bill party/member speech breakdown as CSV or XLSX, optionally date-ranged."""
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_MIMETYPES:
+        return jsonify({'success': False, 'error': 'format must be csv or xlsx'}), 400
+    try:
+        start, end, range_label = get_export_range()
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    try:
+        bill_name = get_bill_name(bill_id)
+    except mysql.connector.Error as err:
+        logger.error(f"Database error: {err}")
+        return jsonify({'success': False, 'error': str(err)}), 500
+    if bill_name is None:
+        return jsonify({'success': False, 'error': 'Bill not found'}), 404
+
+    header, rows = bill_export_rows(bill_id, bill_name, start, end)
+    return export_response(rows, header, f"Bill_Discussion_{bill_name}_{range_label}", 'Bill Discussion',
+                           export_format, bold_rows=is_total_row)
+
+@app.route('/api/export/bill')
+def api_export_bill_logs_by_name():
+    """Same export for logs not linked to a bill record yet, matched by bill name.
+    Query params: name=<bill name> plus the format/from/to params above."""
+    bill_name = (request.args.get('name') or '').strip()
+    if not bill_name:
+        return jsonify({'success': False, 'error': 'name is required'}), 400
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_MIMETYPES:
+        return jsonify({'success': False, 'error': 'format must be csv or xlsx'}), 400
+    try:
+        start, end, range_label = get_export_range()
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    header, rows = bill_export_rows(None, bill_name, start, end)
+    return export_response(rows, header, f"Bill_Discussion_{bill_name}_{range_label}", 'Bill Discussion',
+                           export_format, bold_rows=is_total_row)
+
+# ============ PDF REPORTS ============
+
+REPORT_WORKERS = int(os.getenv('REPORT_WORKERS', '2'))
+REPORT_CACHE_SIZE = int(os.getenv('REPORT_CACHE_SIZE', '32'))
+REPORT_JOB_LIMIT = 256   # render jobs remembered for polling; the oldest are forgotten first
+
+class HubThreadExecutor:
+    """submit()/shutdown() over the eventlet/gevent native thread pool, for
+    cooperative modes. After monkey_patch() a ProcessPoolExecutor's manager
+    thread and result pipes are green, and forked workers inherit the patched
+    hub, so the pool can hang; a render in a plain green thread would block
+    every other connection. Here each render runs in a real OS thread while
+    the calling greenlet yields; at most `workers` render at once."""
+    def __init__(self, workers):
+        self.slots = threading.BoundedSemaphore(workers)
+        if SERVER_MODE == 'eventlet':
+            from eventlet import tpool
+            self._call = tpool.execute
+            self._spawn = eventlet.spawn
+        else:
+            import gevent
+            self._call = lambda fn, *args: gevent.get_hub().threadpool.apply(fn, args)
+            self._spawn = gevent.spawn
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+        future = Future()
+
+        def run():
+            with self.slots:
+                if not future.set_running_or_notify_cancel():
+                    return
+                try:
+                    future.set_result(self._call(fn, *args))
+                except BaseException as exc:
+                    future.set_exception(exc)
+        self._spawn(run)
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass   # renders in flight finish on their own; nothing is queued outside the hub
+
+class ReportRenderer:
+    """Renders PDF reports in a small process pool (native threads in the
+    cooperative server modes, see HubThreadExecutor) and caches the bytes.
+
+    Cache keys include the activity_logs/bill_details data versions, so any
+    write to those tables makes the next request render afresh while older
+    entries age out of the LRU. Concurrent requests for the same key share
+    one render. A request that misses gets a job id and polls /api/reports/jobs/<id>
+    instead of holding its thread until the render finishes.
+    """
+    def __init__(self, workers, cache_size):
+        self.workers = max(1, workers)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.pending = {}
+        self.jobs = OrderedDict()   # job id -> (future, filename base)
+        self.lock = threading.Lock()
+        self.executor = None
+        self.hits = 0
+        self.misses = 0
+
+    def _get_executor(self):
+        # Created lazily so importing app (and the EXE's startup) never forks workers
+        if self.executor is None and COOPERATIVE_SERVER:
+            self.executor = HubThreadExecutor(self.workers)
+        elif self.executor is None:
+            # spawn, not fork: the server's listener and writer threads are already running
+            # and a forked child would inherit their locks mid-use
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                mp_context=multiprocessing.get_context('spawn'))
+        return self.executor
+
+    def get(self, key, build_spec):
+        """Return (pdf_bytes, None) on a cache hit, else (None, future) for the render."""
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                self.hits += 1
+                return self.cache[key], None
+            self.misses += 1
+            future = self.pending.get(key)
+            if future is not None:
+                return None, future
+
+        spec = build_spec()
+        with self.lock:
+            future = self.pending.get(key)
+            if future is None:
+                from pdf_reports import render_pdf_report
+                future = self._get_executor().submit(render_pdf_report, spec)
+                self.pending[key] = future
+                future.add_done_callback(lambda f, key=key: self._store(key, f))
+        return None, future
+
+    def add_job(self, future, filename_base):
+        """Remember a render for polling; returns its job id."""
+        job_id = uuid.uuid4().hex
+        with self.lock:
+            self.jobs[job_id] = (future, filename_base)
+            while len(self.jobs) > REPORT_JOB_LIMIT:
+                self.jobs.popitem(last=False)
+        return job_id
+
+    def get_job(self, job_id):
+        """Return (future, filename base) for a job, or None if unknown or expired.
+        A finished job is forgotten once read; its PDF stays in the cache."""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is not None and job[0].done():
+                del self.jobs[job_id]
+            return job
+
+    def _store(self, key, future):
+        with self.lock:
+            self.pending.pop(key, None)
+            if future.cancelled() or future.exception() is not None:
+                return
+            self.cache[key] = future.result()
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    def stats(self):
+        with self.lock:
+            return {
+                'cached': len(self.cache),
+                'rendering': len(self.pending),
+                'jobs': len(self.jobs),
+                'hits': self.hits,
+                'misses': self.misses,
+                'workers': self.workers,
+                'executor': 'threads' if COOPERATIVE_SERVER else 'processes',
+            }
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+report_renderer = ReportRenderer(REPORT_WORKERS, REPORT_CACHE_SIZE)
+
+def report_versions():
+    return get_data_version('activity_logs'), get_data_version('bill_details')
+
+def range_subtitle(start, end):
+    if not start:
+        return 'All dates'
+    last_day = end - timedelta(days=1)
+    if last_day.date() == start.date():
+        return f"Date: {start.strftime('%d-%m-%Y')}"
+    return f"From {start.strftime('%d-%m-%Y')} to {last_day.strftime('%d-%m-%Y')}"
+
+def pdf_response(pdf, filename_base, cache_status):
+    import re
+    safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', filename_base).strip('_') or 'report'
+    response = Response(pdf, mimetype='application/pdf')
+    disposition = 'attachment' if request.args.get('download') == '1' else 'inline'
+    response.headers['Content-Disposition'] = f'{disposition}; filename="{safe_name}.pdf"'
+    response.headers['X-Report-Cache'] = cache_status
+    return response
+
+def report_job_response(future, filename_base):
+    """Return the finished render, or 500 if it failed; None while it is still running."""
+    if not future.done():
+        return None
+    try:
+        return pdf_response(future.result(), filename_base, 'miss')
+    except Exception as e:
+        logger.error(f"PDF report render failed: {e}")
+        return jsonify({'success': False, 'error': f'Report rendering failed: {e}'}), 500
+
+def report_response(key, build_spec, filename_base):
+    """Serve a cached PDF, or start the render and answer 202 with a job id to poll."""
+    from pdf_reports import REPORTLAB_AVAILABLE
+    if not REPORTLAB_AVAILABLE:
+        return jsonify({'success': False, 'error': 'PDF reports unavailable: reportlab is not installed'}), 503
+    try:
+        pdf, future = report_renderer.get(key, build_spec)
+    except mysql.connector.Error as err:
+        logger.error(f"Database error: {err}")
+        return jsonify({'success': False, 'error': str(err)}), 500
+    if pdf is not None:
+        return pdf_response(pdf, filename_base, 'hit')
+    finished = report_job_response(future, filename_base)
+    if finished is not None:
+        return finished
 
-@app.route('/api/activity-logs/by-bill-id/<int:bill_id>')
-def api_get_activity_logs_by_bill_id(bill_id):
-    """API endpoint to get activity logs for a specific bill by bill_id."""
-    connection = get_db_connection()
-    if not connection:
-        return jsonify({'success': False, 'error': 'Database connection failed'}), 500
-    
+    job_id = report_renderer.add_job(future, filename_base)
+    status_url = f"/api/reports/jobs/{job_id}"
+    response = jsonify({'success': True, 'status': 'rendering', 'job_id': job_id, 'status_url': status_url})
+    response.headers['Location'] = status_url
+    response.headers['Retry-After'] = '1'
+    return response, 202
+
+@app.route('/api/reports/jobs/<job_id>')
+def api_report_job(job_id):
+    """API endpoint to poll a PDF report render: 202 while rendering, then the PDF (once)"""
+    job = report_renderer.get_job(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Unknown or expired report job'}), 404
+    future, filename_base = job
+    finished = report_job_response(future, filename_base)
+    if finished is not None:
+        return finished
+    response = jsonify({'success': True, 'status': 'rendering', 'job_id': job_id})
+    response.headers['Retry-After'] = '1'
+    return response, 202
+
+@app.route('/api/reports/bill/<int:bill_id>.pdf')
+def api_report_bill(bill_id):
+    """API endpoint to get a per-bill party/member speech report as PDF (optional from/to)"""
     try:
-        cursor = connection.cursor(dictionary=True)
-        date_filter = request.args.get('date')
-        
-        base_query = """
-            SELECT a.*, b.bill_name as current_bill_name 
-            FROM activity_logs a
-            LEFT JOIN bill_details b ON a.bill_id = b.id
-            WHERE a.activity_type = 'Bill Discussion' 
-              AND a.bill_id = %s
-        """
-        params = [bill_id]
-        
-        if date_filter:
-            base_query += " AND DATE(a.start_time) = %s"
-            params.append(date_filter)
-        
-        base_query += " ORDER BY a.start_time DESC"
-        cursor.execute(base_query, tuple(params))
-        
-        logs = cursor.fetchall()
-        
-        for log in logs:
-            if log.get('start_time'):
-                log['start_time'] = log['start_time'].isoformat()
-            if log.get('end_time'):
-                log['end_time'] = log['end_time'].isoformat()
-            if log.get('created_at'):
-                log['created_at'] = log['created_at'].isoformat()
-        
-        return jsonify({'success': True, 'data': logs})
+        start, end, range_label = get_export_range()
+        bill_name = get_bill_name(bill_id)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except mysql.connector.Error as err:
         logger.error(f"Database error: {err}")
         return jsonify({'success': False, 'error': str(err)}), 500
+    if bill_name is None:
+        return jsonify({'success': False, 'error': 'Bill not found'}), 404
+
+    def build_spec():
+        header, rows = bill_export_rows(bill_id, bill_name, start, end)
+        return {
+            'title': f"Bill Discussion Report - {bill_name}",
+            'subtitle': range_subtitle(start, end),
+            'generated_at': get_ist_now().strftime('%d-%m-%Y %I:%M:%S %p'),
+            'sections': [{'heading': None, 'header': header, 'rows': list(rows)}],
+        }
+
+    key = ('bill', bill_id, start, end) + report_versions()
+    return report_response(key, build_spec, f"Bill_Discussion_{bill_name}_{range_label}")
+
+@app.route('/api/reports/day/<date_str>.pdf')
+def api_report_day(date_str):
+    """API endpoint to get all Zero Hour, Member Speaking and Bill Discussion logs for one day as PDF"""
+    try:
+        start, end = day_range(date_str)
+    except ValueError:
+        return jsonify({'success': False, 'error': 'Date must be YYYY-MM-DD'}), 400
+
+    def build_spec():
+        sections = []
+        for activity_type in EXPORT_CATEGORIES.values():
+            header, rows = category_export_rows(activity_type, start, end)
+            sections.append({'heading': activity_type, 'header': header, 'rows': list(rows)})
+        return {
+            'title': 'Daily Proceedings Report',
+            'subtitle': range_subtitle(start, end),
+            'generated_at': get_ist_now().strftime('%d-%m-%Y %I:%M:%S %p'),
+            'sections': sections,
+        }
+
+    key = ('day', date_str) + report_versions()
+    return report_response(key, build_spec, f"Daily_Report_{date_str}")
+
+@app.route('/api/reports/category/<category>.pdf')
+def api_report_category(category):
+    """API endpoint to get one log category as PDF (optional from/to or date)"""
+    activity_type = EXPORT_CATEGORIES.get(category)
+    if not activity_type:
+        return jsonify({'success': False, 'error': f'Unknown report category: {category}'}), 404
+    try:
+        start, end, range_label = get_export_range()
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    def build_spec():
+        header, rows = category_export_rows(activity_type, start, end)
+        return {
+            'title': f"{activity_type} Report",
+            'subtitle': range_subtitle(start, end),
+            'generated_at': get_ist_now().strftime('%d-%m-%Y %I:%M:%S %p'),
+            'sections': [{'heading': None, 'header': header, 'rows': list(rows)}],
+        }
+
+    key = ('category', activity_type, start, end) + report_versions()
+    return report_response(key, build_spec, f"{activity_type}_{range_label}")
+
+@app.route('/api/cache/stats')
+def api_query_cache_stats():
+    """API endpoint to get read-endpoint cache hit/miss counts and the current data versions."""
+    return jsonify({'success': True, 'data': query_cache.stats()})
+
+@app.route('/api/reports/stats')
+def api_report_stats():
+    """API endpoint to get PDF report cache statistics"""
+    return jsonify({'success': True, 'data': report_renderer.stats()})
+
+# ============ LATENCY TRACING API ============
+
+@app.route('/api/latency-stats')
+def api_get_latency_stats():
+    """Per-stage seat-to-screen latency histograms (ms since seat signal receipt)."""
+    return jsonify({'success': True, 'data': latency_tracker.stats()})
+
+@app.route('/api/event-dispatcher/stats')
+def api_get_event_dispatcher_stats():
+    """Outbound Socket.IO queue depth, coalesced/overflow counts and send timings."""
+    return jsonify({'success': True, 'data': event_dispatcher.stats()})
+
+@app.route('/api/latency-stats/reset', methods=['POST'])
+def api_reset_latency_stats():
+    """Clear latency histograms, e.g. before a load test run."""
+    latency_tracker.reset()
+    return jsonify({'success': True, 'message': 'Latency stats reset'})
+
+# ============ REHEARSAL MODE ============
+# Replays a recorded sitting into the live stack against a scratch database:
+# seats go through the real UDPReceiver socket, activity logs through the
+# /api/activity-log route and timer/chairperson events through the dispatcher.
+
+REHEARSAL_MIN_SPEED = 1
+REHEARSAL_MAX_SPEED = 50
+# Reference tables copied into the scratch database; activity_logs starts empty
+REHEARSAL_REFERENCE_TABLES = ['parliament_seats', 'chairpersons', 'bill_details', 'users']
+
+rehearsal_mode = {'enabled': False, 'database': None}
+
+def prepare_rehearsal_database(scratch_db=None):
+    """Create/refresh the scratch database and point DB_CONFIG at it."""
+    live_db = DB_CONFIG['database']
+    scratch_db = scratch_db or os.getenv('REHEARSAL_DB_NAME') or f"{live_db}_rehearsal"
+    if scratch_db == live_db:
+        raise ValueError("Rehearsal database must differ from the live database")
+
+    server_config = {k: v for k, v in DB_CONFIG.items() if k != 'database'}
+    connection = mysql.connector.connect(**server_config, connection_timeout=5)
+    try:
+        cursor = connection.cursor()
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{scratch_db}` CHARACTER SET utf8mb4")
+        for table in REHEARSAL_REFERENCE_TABLES:
+            try:
+                cursor.execute(f"DROP TABLE IF EXISTS `{scratch_db}`.`{table}`")
+                cursor.execute(f"CREATE TABLE `{scratch_db}`.`{table}` LIKE `{live_db}`.`{table}`")
+                cursor.execute(f"INSERT INTO `{scratch_db}`.`{table}` SELECT * FROM `{live_db}`.`{table}`")
+            except mysql.connector.Error as err:
+                logger.warning(f"Rehearsal: could not copy {table}: {err}")
+        try:
+            cursor.execute(f"DROP TABLE IF EXISTS `{scratch_db}`.`activity_logs`")
+            cursor.execute(f"CREATE TABLE `{scratch_db}`.`activity_logs` LIKE `{live_db}`.`activity_logs`")
+        except mysql.connector.Error as err:
+            logger.warning(f"Rehearsal: activity_logs will be created on first insert: {err}")
+        connection.commit()
     finally:
         connection.close()
 
+    DB_CONFIG['database'] = scratch_db
+    rehearsal_mode['enabled'] = True
+    rehearsal_mode['database'] = scratch_db
+    # Never record a rehearsal over a real sitting's recording
+    session_recorder.path = None
+    logger.info(f"Rehearsal mode: using scratch database '{scratch_db}' (live: '{live_db}')")
+    return scratch_db
+
+def load_session_recording(path):
+    """Load a JSONL session recording, sorted by offset."""
+    import json
+    events = []
+    with open(path, encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+                event['t'] = float(event.get('t', 0))
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"{path}:{line_no}: invalid recording line ({e})")
+            if event.get('type') != 'header':
+                events.append(event)
+    events.sort(key=lambda e: e['t'])
+    return events
+
+class RehearsalPlayer:
+    """Replays a recorded session at 1x-50x through the live ingestion paths."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.thread = None
+        self.running = False
+        self.status = {'state': 'idle'}
+
+    def start(self, path, speed=1.0):
+        speed = float(speed)
+        if speed < REHEARSAL_MIN_SPEED or speed > REHEARSAL_MAX_SPEED:
+            raise ValueError(f"Speed must be between {REHEARSAL_MIN_SPEED}x and {REHEARSAL_MAX_SPEED}x")
+        events = load_session_recording(path)
+        with self.lock:
+            if self.running:
+                raise RuntimeError("A rehearsal is already running")
+            self.running = True
+            self.status = {
+                'state': 'running', 'file': path, 'speed': speed,
+                'total': len(events), 'replayed': 0, 'errors': 0,
+                'by_type': {}, 'lag_ms_max': 0.0,
+                'duration_s': round(events[-1]['t'] / speed, 1) if events else 0,
+                'started_at': get_ist_now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+        self.thread = threading.Thread(target=self._run, args=(events, speed), daemon=True)
+        self.thread.start()
+        logger.info(f"Rehearsal started: {len(events)} events from {path} at {speed}x")
+
+    def stop(self):
+        with self.lock:
+            self.running = False
+
+    def _run(self, events, speed):
+        udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        client = app.test_client()
+        started = time.monotonic()
+        try:
+            for event in events:
+                due = started + event['t'] / speed
+                while self.running and time.monotonic() < due:
+                    time.sleep(min(0.05, max(0.0, due - time.monotonic())))
+                if not self.running:
+                    break
+                lag_ms = (time.monotonic() - due) * 1000.0
+                try:
+                    self._dispatch(event, udp_sock, client)
+                    ok = True
+                except Exception as e:
+                    ok = False
+                    logger.error(f"Rehearsal event error ({event.get('type')}): {e}")
+                with self.lock:
+                    self.status['replayed'] += 1
+                    if not ok:
+                        self.status['errors'] += 1
+                    counts = self.status['by_type']
+                    counts[event.get('type')] = counts.get(event.get('type'), 0) + 1
+                    self.status['lag_ms_max'] = round(max(self.status['lag_ms_max'], lag_ms), 1)
+        finally:
+            udp_sock.close()
+            with self.lock:
+                self.status['state'] = 'finished' if self.running else 'stopped'
+                self.status['elapsed_s'] = round(time.monotonic() - started, 1)
+                self.running = False
+            logger.info(f"Rehearsal {self.status['state']}: {self.status['replayed']} events, {self.status['errors']} errors")
+
+    def _dispatch(self, event, udp_sock, client):
+        event_type = event.get('type')
+        data = event.get('data') or {}
+        if event_type == 'seat':
+            udp_sock.sendto(str(data.get('seat_no', '')).encode(), (udp_receiver.host, udp_receiver.port))
+        elif event_type == 'activity_log':
+            response = client.post('/api/activity-log', json=data)
+            if response.status_code >= 400:
+                raise RuntimeError(f"activity-log returned {response.status_code}")
+        elif event_type == 'timer':
+            event_dispatcher.publish('timer_sync', data)
+        elif event_type == 'chairperson':
+            event_dispatcher.publish('chairperson_update', data)
+        else:
+            raise ValueError(f"Unknown event type: {event_type}")
+
+    def get_status(self):
+        with self.lock:
+            return dict(self.status, by_type=dict(self.status.get('by_type', {})))
+
+rehearsal_player = RehearsalPlayer()
+
+@app.route('/api/rehearsal/status')
+def api_get_rehearsal_status():
+    """Rehearsal mode flag and replay progress."""
+    return jsonify({'success': True, 'mode': rehearsal_mode, 'data': rehearsal_player.get_status()})
+
+@app.route('/api/rehearsal/start', methods=['POST'])
+def api_start_rehearsal():
+    """Start replaying a recording. Only available when running in rehearsal mode."""
+    if not rehearsal_mode['enabled']:
+        return jsonify({'success': False, 'error': 'Server is not running in rehearsal mode'}), 403
+    data = request.get_json() or {}
+    path = data.get('file', '')
+    if not path or not os.path.isfile(path):
+        return jsonify({'success': False, 'error': 'Recording file not found'}), 400
+    try:
+        rehearsal_player.start(path, data.get('speed', 1))
+    except (ValueError, RuntimeError, OSError) as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    return jsonify({'success': True, 'data': rehearsal_player.get_status()})
+
+@app.route('/api/rehearsal/stop', methods=['POST'])
+def api_stop_rehearsal():
+    """Stop the running replay."""
+    rehearsal_player.stop()
+    return jsonify({'success': True, 'data': rehearsal_player.get_status()})
+
 # ============ BROADCAST FEED API ============
 
 @app.route('/api/broadcast-feed', methods=['GET'])
@@ -1475,32 +4826,483 @@ def api_set_broadcast_feed():
         broadcast_state['mode'] = data.get('mode', 'Idle')
         broadcast_state['payload'] = data.get('payload') or {}
         broadcast_state['updated_at'] = datetime.now(IST).strftime('%Y-%m-%d %H:%M:%S')
+        event_dispatcher.publish('broadcast_state', dict(broadcast_state))
+        shared_state_changed_at['broadcast_state'] = time.time()
+        share_state('broadcast_state')
         return jsonify({'success': True})
     except Exception as err:
         logger.error(f"Broadcast feed error: {err}")
         return jsonify({'success': False, 'error': str(err)}), 500
 
+# ============ CLUSTER ============
+# With SERVER_WORKERS > 1 each worker keeps its own copy of the broadcast feed,
+# the timer, data versions and the archive list; changes are published on the
+# state bus and applied by the other workers. Socket.IO emits need none of this:
+# they already reach every worker through the message queue.
+
+# Wall-clock time of the last broadcast feed / timer change (0 = none seen yet);
+# the newer copy wins when workers exchange state
+shared_state_changed_at = {'broadcast_state': 0.0, 'timer_state': 0.0}
+
+def share_state(kind):
+    state = broadcast_state if kind == 'broadcast_state' else timer_state
+    cluster_bus.publish(kind, {'state': dict(state), 'changed_at': shared_state_changed_at[kind]})
+
+def set_timer_state(data):
+    timer_state.update(data)
+    shared_state_changed_at['timer_state'] = time.time()
+    share_state('timer_state')
+
+@cluster_bus.on('data_version')
+def apply_data_version(data):
+    if data.get('table') in data_versions:
+        merge_data_version_clock(data['table'], data.get('clock') or {})
+
+@cluster_bus.on('bill_versions')
+def apply_bill_versions(data):
+    merge_bill_version_clocks(data)
+
+@cluster_bus.on('write_clocks')
+def apply_write_clocks(data):
+    for table, clock in (data.get('tables') or {}).items():
+        if table in data_versions:
+            merge_data_version_clock(table, clock)
+    merge_bill_version_clocks(data.get('bills') or {})
+
+def apply_shared_state(kind, data):
+    if data.get('changed_at', 0) <= shared_state_changed_at[kind]:
+        return
+    # Updated in place (no clear()), so a concurrent /api/broadcast-feed read never sees it empty
+    state = broadcast_state if kind == 'broadcast_state' else timer_state
+    state.update(data.get('state') or {})
+    shared_state_changed_at[kind] = data['changed_at']
+
+cluster_bus.on('broadcast_state', lambda data: apply_shared_state('broadcast_state', data))
+cluster_bus.on('timer_state', lambda data: apply_shared_state('timer_state', data))
+
+def share_archived_log_months():
+    with archived_log_months_lock:
+        archives = [[month, oldest.strftime('%Y-%m-%d %H:%M:%S'), newest.strftime('%Y-%m-%d %H:%M:%S')]
+                    for month, oldest, newest in archived_log_months]
+    cluster_bus.publish('archived_log_months', archives)
+
+@cluster_bus.on('archived_log_months')
+def apply_archived_log_months(data):
+    global archived_log_months
+    archives = [(month, datetime.strptime(oldest, '%Y-%m-%d %H:%M:%S'), datetime.strptime(newest, '%Y-%m-%d %H:%M:%S'))
+                for month, oldest, newest in data]
+    with archived_log_months_lock:
+        archived_log_months = archives
+
+@cluster_bus.on('job_cancel')
+def apply_job_cancel(data):
+    job_runner.cancel_local(data.get('job_id'))
+
+@cluster_bus.on('latency_stamp')
+def apply_latency_stamp(data):
+    if IS_PRIMARY_WORKER:
+        latency_tracker.stamp(data.get('trace_id'), data.get('stage'))
+
+@cluster_bus.on_connect
+def request_cluster_state():
+    """A (re)started worker asks the others for the state it missed."""
+    cluster_bus.publish('state_request')
+
+@cluster_bus.on('state_request')
+def answer_state_request(data):
+    for kind, changed_at in shared_state_changed_at.items():
+        if changed_at:
+            share_state(kind)
+    # Write clocks, so a restarted worker's validators match the others' again
+    with data_versions_lock:
+        clocks = {
+            'tables': {table: dict(clock) for table, clock in data_version_clocks.items()},
+            'bills': {'epoch': dict(bill_epoch_clock),
+                      'bills': {str(bill_id): dict(clock) for bill_id, clock in bill_version_clocks.items()}},
+        }
+    cluster_bus.publish('write_clocks', clocks)
+    if IS_PRIMARY_WORKER:
+        # The primary runs partition maintenance, so its archive list is the current one
+        share_archived_log_months()
+
+@app.route('/api/cluster/status')
+def api_cluster_status():
+    """API endpoint for this worker's place in the cluster and its state bus counters"""
+    return jsonify({'success': True, 'data': {
+        'workers': SERVER_WORKERS if CLUSTER_WORKER else 1,
+        'worker_index': WORKER_INDEX,
+        'primary': IS_PRIMARY_WORKER,
+        'pid': os.getpid(),
+        'message_queue': SOCKETIO_MESSAGE_QUEUE.split('://', 1)[0] or None,   # scheme only; URLs may hold a password
+        'state_bus': cluster_bus.stats(),
+    }})
+
+# ============ BILL TIME ROLLUPS ============
+
+# Per-bill totals by party and by seat (per sitting date), maintained in the
+# same transaction as every activity_logs write so consumed-time reads scale
+# with the number of parties and speakers rather than the number of speeches.
+BILL_ROLLUP_TABLES = ('bill_party_time', 'bill_seat_time')
+
+# activity_logs.party_key and bill_party_allocations.party_key hold the same
+# normalized form, so logs join to allocations without per-row Python matching.
+# MySQL computes every party key (Python's strip()/lower() differ from TRIM/LOWER
+# on tabs and some Unicode); the expression is idempotent, so an existing key can
+# be passed through it again.
+def party_key_sql(expr):
+    return f"LOWER(TRIM(COALESCE({expr}, '')))"
+
+bill_rollups_ready = False
+
+MYSQL_DUPLICATE_ERRNOS = (1060, 1061)   # duplicate column name, duplicate key name
+
+def migrate_party_key_column():
+    """Startup migration: add the generated activity_logs.party_key column and its
+    index to a table created before they existed. Adding a STORED column rebuilds
+    the table, so this runs once in the primary before it serves, never from a
+    request (new tables get the column from ensure_activity_log_table)."""
+    connection = get_db_connection()
+    if not connection:
+        return
+    try:
+        ensure_activity_log_table(connection)
+        cursor = connection.cursor()
+        cursor.execute("SHOW COLUMNS FROM activity_logs LIKE 'party_key'")
+        if cursor.fetchone() is None:
+            logger.info("Adding activity_logs.party_key (one-time table rebuild)...")
+            cursor.execute(f"ALTER TABLE activity_logs ADD COLUMN party_key VARCHAR(100) AS ({party_key_sql('party')}) STORED")
+            logger.info("activity_logs.party_key added")
+        try:
+            cursor.execute("CREATE INDEX idx_activity_bill_party ON activity_logs (activity_type, bill_id, party_key)")
+        except mysql.connector.Error as err:
+            if err.errno not in MYSQL_DUPLICATE_ERRNOS:
+                raise
+    except mysql.connector.Error as err:
+        logger.error(f"party_key migration failed: {err}")
+    finally:
+        connection.close()
+
+def ensure_party_key_schema(connection):
+    """Create the bill_party_allocations table. Returns whether activity_logs has
+    its party_key column yet (see migrate_party_key_column), so the caller retries later."""
+    cursor = connection.cursor()
+    cursor.execute("SHOW TABLES LIKE 'bill_party_allocations'")
+    is_new = cursor.fetchone() is None
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS bill_party_allocations (
+            bill_id INT NOT NULL,
+            party_key VARCHAR(100) NOT NULL,
+            party VARCHAR(100) NOT NULL,
+            allotted_seconds INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (bill_id, party_key)
+        )
+    """)
+    if is_new:
+        try:
+            dict_cursor = connection.cursor(dictionary=True)
+            dict_cursor.execute("SELECT id, party_allocations FROM bill_details")
+            for bill in dict_cursor.fetchall():
+                sync_bill_party_allocations(connection, bill['id'], normalize_bill_row(bill)['party_allocations'])
+            connection.commit()
+        except mysql.connector.Error as err:
+            connection.rollback()
+            if err.errno != 1146:  # no bill_details yet
+                logger.warning(f"Could not backfill bill party allocations: {err}")
+    try:
+        cursor.execute("SHOW COLUMNS FROM activity_logs LIKE 'party_key'")
+        return cursor.fetchone() is not None
+    except mysql.connector.Error:
+        return False
+
+def sync_bill_party_allocations(connection, bill_id, party_allocations):
+    """Mirror a bill's party_allocations JSON into bill_party_allocations; the caller commits."""
+    cursor = connection.cursor()
+    cursor.execute("DELETE FROM bill_party_allocations WHERE bill_id = %s", (bill_id,))
+    rows = []
+    for allocation in party_allocations or []:
+        name = (allocation.get('party') or '').strip()
+        if not name:
+            continue
+        allotted = int(allocation.get('hours') or 0) * 3600 + int(allocation.get('minutes') or 0) * 60
+        rows.append((bill_id, name, allocation.get('party'), allotted))
+    if rows:
+        # A party listed twice keeps its last entry, as the old dict lookup did
+        cursor.executemany(f"""
+            INSERT INTO bill_party_allocations (bill_id, party_key, party, allotted_seconds)
+            VALUES (%s, {party_key_sql('%s')}, %s, %s)
+            ON DUPLICATE KEY UPDATE party = VALUES(party), allotted_seconds = VALUES(allotted_seconds)
+        """, rows)
+
+def ensure_bill_rollup_tables(connection):
+    """Create the rollup tables once per process; backfill them if they are new."""
+    global bill_rollups_ready
+    if bill_rollups_ready:
+        return
+    logs_ready = ensure_party_key_schema(connection)
+    cursor = connection.cursor()
+    cursor.execute("SHOW TABLES LIKE 'bill_party_time'")
+    is_new = cursor.fetchone() is None
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS bill_party_time (
+            bill_id INT NOT NULL,
+            party_key VARCHAR(100) NOT NULL,
+            log_date DATE NOT NULL,
+            duration_seconds BIGINT NOT NULL DEFAULT 0,
+            speech_count INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (bill_id, party_key, log_date)
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS bill_seat_time (
+            bill_id INT NOT NULL,
+            seat_no VARCHAR(20) NOT NULL,
+            log_date DATE NOT NULL,
+            duration_seconds BIGINT NOT NULL DEFAULT 0,
+            spoken_seconds BIGINT NOT NULL DEFAULT 0,
+            speech_count INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (bill_id, seat_no, log_date)
+        )
+    """)
+    if is_new:
+        try:
+            rebuild_bill_rollups(connection)
+            connection.commit()
+            logger.info("Backfilled bill time rollups from activity logs")
+        except mysql.connector.Error as err:
+            connection.rollback()
+            logger.warning(f"Could not backfill bill time rollups: {err}")
+    bill_rollups_ready = logs_ready
+
+def apply_bill_rollup(connection, where_sql, params, sign):
+    """Add (sign=1) or subtract (sign=-1) the Bill Discussion logs matching
+    `where_sql` to/from the rollups. Call with -1 before a row is changed or
+    deleted and +1 after it is inserted or changed; the caller commits.
+    Returns the set of affected bill ids."""
+    cursor = connection.cursor(dictionary=True)
+    cursor.execute(f"""
+        SELECT bill_id, bill_name, party_key, seat_no, DATE(start_time) AS log_date,
+               COALESCE(duration_seconds, 0) AS duration_seconds,
+               COALESCE(spoken_seconds, 0) AS spoken_seconds
+        FROM activity_logs
+        WHERE activity_type = 'Bill Discussion' AND ({where_sql})
+    """, tuple(params))
+    return apply_bill_rollup_rows(connection, cursor.fetchall(), sign)
+
+def apply_bill_rollup_rows(connection, logs, sign):
+    """Apply rollup deltas for Bill Discussion log dicts with bill_id, bill_name,
+    party_key, seat_no, log_date, duration_seconds and spoken_seconds. party_key
+    may also be a raw party name; it is normalized by the INSERT."""
+    if not logs:
+        return set()
+    cursor = connection.cursor(dictionary=True)
+
+    # Logs saved before bill ids existed belong to every bill with that name
+    bill_ids_by_name = {}
+    party_deltas = {}
+    seat_deltas = {}
+    for log in logs:
+        if log['bill_id']:
+            bill_ids = [log['bill_id']]
+        else:
+            name = log['bill_name']
+            if name not in bill_ids_by_name:
+                cursor.execute("SELECT id FROM bill_details WHERE bill_name = %s", (name,))
+                bill_ids_by_name[name] = [row['id'] for row in cursor.fetchall()]
+            bill_ids = bill_ids_by_name[name]
+        for bill_id in bill_ids:
+            key = (bill_id, log['party_key'] or '', log['log_date'])
+            totals = party_deltas.setdefault(key, [0, 0])
+            totals[0] += log['duration_seconds'] or 0
+            totals[1] += 1
+            key = (bill_id, (log['seat_no'] or '').strip(), log['log_date'])
+            totals = seat_deltas.setdefault(key, [0, 0, 0])
+            totals[0] += log['duration_seconds'] or 0
+            totals[1] += log['spoken_seconds'] or 0
+            totals[2] += 1
+
+    if party_deltas:
+        # Names that normalize to one key land on the same row and add up
+        cursor.executemany(f"""
+            INSERT INTO bill_party_time (bill_id, party_key, log_date, duration_seconds, speech_count)
+            VALUES (%s, {party_key_sql('%s')}, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                duration_seconds = duration_seconds + VALUES(duration_seconds),
+                speech_count = speech_count + VALUES(speech_count)
+        """, [(*key, sign * d, sign * c) for key, (d, c) in party_deltas.items()])
+        cursor.executemany("""
+            INSERT INTO bill_seat_time (bill_id, seat_no, log_date, duration_seconds, spoken_seconds, speech_count)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                duration_seconds = duration_seconds + VALUES(duration_seconds),
+                spoken_seconds = spoken_seconds + VALUES(spoken_seconds),
+                speech_count = speech_count + VALUES(speech_count)
+        """, [(*key, sign * d, sign * sp, sign * c) for key, (d, sp, c) in seat_deltas.items()])
+
+    bill_ids = {key[0] for key in party_deltas}
+    if sign < 0 and bill_ids:
+        placeholders = ', '.join(['%s'] * len(bill_ids))
+        for table in BILL_ROLLUP_TABLES:
+            cursor.execute(f"DELETE FROM {table} WHERE bill_id IN ({placeholders}) AND speech_count <= 0",
+                           tuple(bill_ids))
+    return bill_ids
+
+def rebuild_bill_rollups(connection, bill_ids=None):
+    """Recompute rollups from activity_logs for the given bills (all bills if None).
+    Used after bulk re-linking (rename, merge, migrate); the caller commits."""
+    cursor = connection.cursor()
+    bill_filter = ''
+    params = ()
+    if bill_ids is not None:
+        bill_ids = [bill_id for bill_id in bill_ids if bill_id]
+        if not bill_ids:
+            return
+        bill_filter = f"WHERE b.id IN ({', '.join(['%s'] * len(bill_ids))})"
+        params = tuple(bill_ids)
+        for table in BILL_ROLLUP_TABLES:
+            cursor.execute(f"DELETE FROM {table} WHERE bill_id IN ({', '.join(['%s'] * len(bill_ids))})", params)
+    else:
+        for table in BILL_ROLLUP_TABLES:
+            cursor.execute(f"DELETE FROM {table}")
+
+    # Archived months are read-only but still count towards bill totals
+    bill_join = f"""
+        FROM bill_details b
+        JOIN {activity_log_source(alias='a')}
+          ON a.activity_type = 'Bill Discussion'
+         AND (a.bill_id = b.id OR (a.bill_id IS NULL AND a.bill_name = b.bill_name))
+    """
+    try:
+        cursor.execute("SELECT 1 FROM activity_logs LIMIT 1")
+        cursor.fetchall()
+    except mysql.connector.Error as err:
+        if err.errno == 1146:
+            return  # no activity_logs table yet, nothing to roll up
+        raise
+    cursor.execute(f"""
+        INSERT INTO bill_party_time (bill_id, party_key, log_date, duration_seconds, speech_count)
+        SELECT b.id, a.party_key, DATE(a.start_time),
+               SUM(COALESCE(a.duration_seconds, 0)), COUNT(*)
+        {bill_join}
+        {bill_filter}
+        GROUP BY b.id, a.party_key, DATE(a.start_time)
+    """, params)
+    cursor.execute(f"""
+        INSERT INTO bill_seat_time (bill_id, seat_no, log_date, duration_seconds, spoken_seconds, speech_count)
+        SELECT b.id, TRIM(COALESCE(a.seat_no, '')), DATE(a.start_time),
+               SUM(COALESCE(a.duration_seconds, 0)), SUM(COALESCE(a.spoken_seconds, 0)), COUNT(*)
+        {bill_join}
+        {bill_filter}
+        GROUP BY b.id, TRIM(COALESCE(a.seat_no, '')), DATE(a.start_time)
+    """, params)
+
+def delete_bill_rollups(connection, bill_id):
+    cursor = connection.cursor()
+    for table in BILL_ROLLUP_TABLES:
+        cursor.execute(f"DELETE FROM {table} WHERE bill_id = %s", (bill_id,))
+
+def normalize_bill_row(bill):
+    """Parse a bill_details row's JSON columns and format its timestamps in place."""
+    import json
+    if bill.get('party_allocations'):
+        if isinstance(bill['party_allocations'], str):
+            bill['party_allocations'] = json.loads(bill['party_allocations'])
+    else:
+        bill['party_allocations'] = []
+    
+    if bill.get('others_time'):
+        if isinstance(bill['others_time'], str):
+            bill['others_time'] = json.loads(bill['others_time'])
+        if bill['others_time'] is None:
+            bill['others_time'] = {'hours': 0, 'minutes': 0, 'members': []}
+        else:
+            bill['others_time']['hours'] = bill['others_time'].get('hours', 0)
+            bill['others_time']['minutes'] = bill['others_time'].get('minutes', 0)
+            bill['others_time']['members'] = bill['others_time'].get('members', [])
+    else:
+        bill['others_time'] = {'hours': 0, 'minutes': 0, 'members': []}
+    
+    if bill.get('created_at'):
+        bill['created_at'] = bill['created_at'].strftime('%Y-%m-%d %H:%M:%S')
+    if bill.get('updated_at'):
+        bill['updated_at'] = bill['updated_at'].strftime('%Y-%m-%d %H:%M:%S')
+    return bill
+
+def read_bill_time_totals(cursor, bill_id, date_param=None):
+    """Read a bill's totals in one round trip (dictionary cursor).
+    Party rollups LEFT JOIN the bill's allocations on the normalized party key;
+    anything unallocated (or without a party) is grouped as 'Others'.
+    Returns (consumed seconds per allocated party or 'Others',
+             duration seconds per seat, spoken seconds per seat)."""
+    date_sql = " AND t.log_date = %s" if date_param else ""
+    params = (bill_id, date_param) if date_param else (bill_id,)
+    cursor.execute(f"""
+        SELECT 'party' AS kind, COALESCE(al.party, 'Others') AS name,
+               SUM(t.duration_seconds) AS duration, 0 AS spoken
+        FROM bill_party_time t
+        LEFT JOIN bill_party_allocations al
+          ON al.bill_id = t.bill_id AND al.party_key = t.party_key AND t.party_key <> ''
+        WHERE t.bill_id = %s{date_sql}
+        GROUP BY COALESCE(al.party, 'Others')
+        UNION ALL
+        SELECT 'member' AS kind, t.seat_no AS name,
+               SUM(t.duration_seconds) AS duration, SUM(t.spoken_seconds) AS spoken
+        FROM bill_seat_time t
+        WHERE t.bill_id = %s AND t.seat_no <> ''{date_sql}
+        GROUP BY t.seat_no
+    """, params + params)
+    consumed_time = {}
+    seat_durations = {}
+    seat_spoken = {}
+    for row in cursor.fetchall():
+        if row['kind'] == 'party':
+            consumed_time[row['name']] = int(row['duration'] or 0)
+        else:
+            seat_durations[str(row['name'])] = int(row['duration'] or 0)
+            seat_spoken[str(row['name'])] = int(row['spoken'] or 0)
+    return consumed_time, seat_durations, seat_spoken
+
+def publish_bill_time_updates(connection, bill_ids=None):
+    """Bump the bills' snapshot versions and push `bill_time_updated` with fresh
+    party and member totals (every non-archived bill if None). Call after the
+    write is committed; a deleted bill is announced with `bill: None`."""
+    if bill_ids is not None:
+        bill_ids = {int(bill_id) for bill_id in bill_ids if bill_id}
+        if not bill_ids:
+            return
+    bump_bill_versions(bill_ids)
+    try:
+        cursor = connection.cursor(dictionary=True)
+        if bill_ids is None:
+            cursor.execute("SELECT * FROM bill_details WHERE COALESCE(status, 'Active') <> 'Past'")
+        else:
+            placeholders = ', '.join(['%s'] * len(bill_ids))
+            cursor.execute(f"SELECT * FROM bill_details WHERE id IN ({placeholders})", tuple(bill_ids))
+        bills = cursor.fetchall()
+        for bill in bills:
+            normalize_bill_row(bill)
+            consumed_time, seat_durations, seat_spoken = read_bill_time_totals(cursor, bill['id'])
+            event_dispatcher.publish('bill_time_updated', {
+                'bill_id': bill['id'],
+                'bill': bill,
+                # Same shapes as /api/bill-consumed-time and /api/bill-member-totals
+                'consumed_time': {**consumed_time, **{f"member_{seat}": t for seat, t in seat_durations.items()}},
+                'member_totals': seat_spoken,
+            })
+        for bill_id in (bill_ids or set()) - {bill['id'] for bill in bills}:
+            event_dispatcher.publish('bill_time_updated', {'bill_id': bill_id, 'bill': None})
+    except mysql.connector.Error as err:
+        logger.warning(f"Could not publish bill time update: {err}")
+
 # ============ BILL DETAILS API ENDPOINTS ============
 
-@app.route('/api/bill-details')
-def api_get_bill_details():
-    """API endpoint to get bill details (optionally filtered by status)."""
+def query_bill_details(status_value=None):
+    """Load bill_details rows (newest first) with parsed JSON columns; None if the query failed."""
     connection = get_db_connection()
     if not connection:
-        return jsonify({'success': False, 'error': 'Database connection failed'}), 500
+        return None
     
     try:
         cursor = connection.cursor(dictionary=True)
-        status_param = request.args.get('status')
-        status_value = None
-        if status_param:
-            status_norm = status_param.strip().lower()
-            if status_norm in ('current', 'active'):
-                status_value = 'Active'
-            elif status_norm in ('past', 'archived', 'inactive'):
-                status_value = 'Past'
-            else:
-                status_value = status_param
         
         # Create table if not exists
         cursor.execute("""
@@ -1528,38 +5330,34 @@ def api_get_bill_details():
         bills = cursor.fetchall()
         
         # Parse JSON fields
-        import json
         for bill in bills:
-            if bill.get('party_allocations'):
-                if isinstance(bill['party_allocations'], str):
-                    bill['party_allocations'] = json.loads(bill['party_allocations'])
-            else:
-                bill['party_allocations'] = []
-            
-            if bill.get('others_time'):
-                if isinstance(bill['others_time'], str):
-                    bill['others_time'] = json.loads(bill['others_time'])
-                if bill['others_time'] is None:
-                    bill['others_time'] = {'hours': 0, 'minutes': 0, 'members': []}
-                else:
-                    bill['others_time']['hours'] = bill['others_time'].get('hours', 0)
-                    bill['others_time']['minutes'] = bill['others_time'].get('minutes', 0)
-                    bill['others_time']['members'] = bill['others_time'].get('members', [])
-            else:
-                bill['others_time'] = {'hours': 0, 'minutes': 0, 'members': []}
-            
-            if bill.get('created_at'):
-                bill['created_at'] = bill['created_at'].strftime('%Y-%m-%d %H:%M:%S')
-            if bill.get('updated_at'):
-                bill['updated_at'] = bill['updated_at'].strftime('%Y-%m-%d %H:%M:%S')
-        
-        return jsonify({'success': True, 'data': bills})
+            normalize_bill_row(bill)
+        return bills
     except mysql.connector.Error as err:
         logger.error(f"Database error: {err}")
-        return jsonify({'success': True, 'data': []})
+        return None
     finally:
         connection.close()
 
+@app.route('/api/bill-details')
+@versioned_get('bill_details')
+def api_get_bill_details():
+    """API endpoint to get bill details (optionally filtered by status)."""
+    status_param = request.args.get('status')
+    status_value = None
+    if status_param:
+        status_norm = status_param.strip().lower()
+        if status_norm in ('current', 'active'):
+            status_value = 'Active'
+        elif status_norm in ('past', 'archived', 'inactive'):
+            status_value = 'Past'
+        else:
+            status_value = status_param
+    
+    bills = query_cache.get('bill-details', (status_value,), ('bill_details',),
+                            lambda: query_bill_details(status_value))
+    return jsonify({'success': True, 'data': bills or []})
+
 @app.route('/api/bill-details', methods=['POST'])
 def api_add_bill_details():
     """API endpoint to add a new bill."""
@@ -1592,14 +5390,21 @@ def api_add_bill_details():
             )
         """)
         
+        ensure_bill_rollup_tables(connection)
         cursor.execute("""
             INSERT INTO bill_details (bill_name, party_allocations, others_time, status)
             VALUES (%s, %s, %s, %s)
         """, (bill_name, json.dumps(party_allocations), json.dumps(others_time), 'Active'))
+        # Logs recorded under this name before the bill existed count towards it
+        bill_id = cursor.lastrowid
+        sync_bill_party_allocations(connection, bill_id, party_allocations)
+        rebuild_bill_rollups(connection, [bill_id])
         
         connection.commit()
+        bump_data_version('bill_details')
+        publish_bill_time_updates(connection, [bill_id])
         logger.info(f"Added bill: {bill_name}")
-        return jsonify({'success': True, 'message': 'Bill created successfully', 'id': cursor.lastrowid})
+        return jsonify({'success': True, 'message': 'Bill created successfully', 'id': bill_id})
     except mysql.connector.Error as err:
         logger.error(f"Database error: {err}")
         return jsonify({'success': False, 'error': str(err)}), 500
@@ -1632,6 +5437,7 @@ def api_update_bill_details(id):
             return jsonify({'success': False, 'error': 'Bill not found'}), 404
         
         old_bill_name = existing_bill['bill_name']
+        ensure_bill_rollup_tables(connection)
         
         update_sql = """
             UPDATE bill_details 
@@ -1640,8 +5446,10 @@ def api_update_bill_details(id):
         """
         params = (bill_name, json.dumps(party_allocations), json.dumps(others_time), id)
         cursor.execute(update_sql, params)
+        sync_bill_party_allocations(connection, id, party_allocations)
         
         connection.commit()
+        bump_data_version('bill_details')
         
         if cursor.rowcount > 0:
             logger.info(f"Updated bill: {id}")
@@ -1653,11 +5461,19 @@ def api_update_bill_details(id):
                     SET bill_name = %s, bill_id = %s
                     WHERE bill_id = %s OR bill_name = %s
                 """, (bill_name, id, id, old_bill_name))
+                # Archived logs follow the rename, or those still matched by name drop out of the totals
+                _, archived_bill_ids = apply_to_archived_logs(
+                    connection, "UPDATE {table} SET bill_name = %s, bill_id = %s",
+                    "bill_id = %s OR bill_name = %s", (bill_name, id), (id, old_bill_name))
+                rebuild_bill_rollups(connection, archived_bill_ids | {id})
                 connection.commit()
+                bump_data_version('activity_logs')
                 logger.info(f"Updated {cursor.rowcount} activity log entries for bill rename {old_bill_name} -> {bill_name}")
             except mysql.connector.Error as log_err:
                 logger.error(f"Error updating activity logs after bill rename: {log_err}")
             
+            # Allocations may have changed, which changes the party/Others split
+            publish_bill_time_updates(connection, [id])
             return jsonify({'success': True, 'message': 'Bill updated successfully'})
         else:
             return jsonify({'success': False, 'error': 'Bill not found'}), 404
@@ -1695,9 +5511,11 @@ def api_update_bill_status(id):
             WHERE id = %s
         """, (status_value, id))
         connection.commit()
+        bump_data_version('bill_details')
         
         if cursor.rowcount > 0:
             logger.info(f"Updated bill {id} status to {status_value}")
+            publish_bill_time_updates(connection, [id])
             return jsonify({'success': True, 'message': f'Bill marked as {status_value.lower()}.'})
         else:
             return jsonify({'success': False, 'error': 'Bill not found'}), 404
@@ -1716,11 +5534,16 @@ def api_delete_bill_details(id):
     
     try:
         cursor = connection.cursor()
+        ensure_bill_rollup_tables(connection)
         cursor.execute("DELETE FROM bill_details WHERE id = %s", (id,))
+        delete_bill_rollups(connection, id)
+        sync_bill_party_allocations(connection, id, [])
         connection.commit()
+        bump_data_version('bill_details')
         
         if cursor.rowcount > 0:
             logger.info(f"Deleted bill: {id}")
+            publish_bill_time_updates(connection, [id])
             return jsonify({'success': True, 'message': 'Bill deleted successfully'})
         else:
             return jsonify({'success': False, 'error': 'Bill not found'}), 404
@@ -1793,12 +5616,18 @@ def api_create_activity_log():
         except mysql.connector.Error:
             pass  # Column already exists
         
+        ensure_bill_rollup_tables(connection)
         cursor.execute('''
             INSERT INTO activity_logs (activity_type, member_name, chairperson, start_time, end_time, duration_seconds, bill_name, party, seat_no, heading, notes)
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         ''', (activity_type, member_name, chairperson, start_time, end_time, duration_seconds, bill_name, party, seat_no, heading, notes))
+        rollup_bill_ids = set()
+        if activity_type == 'Bill Discussion':
+            rollup_bill_ids = apply_bill_rollup(connection, "id = %s", (cursor.lastrowid,), 1)
         
         connection.commit()
+        bump_data_version('activity_logs')
+        publish_bill_time_updates(connection, rollup_bill_ids)
         
         return jsonify({'success': True, 'message': 'Activity logged successfully'})
     except mysql.connector.Error as err:
@@ -1808,6 +5637,7 @@ def api_create_activity_log():
         connection.close()
 
 @app.route('/api/bill-consumed-time/<int:bill_id>')
+@versioned_get('activity_logs', 'bill_details')
 def api_get_bill_consumed_time(bill_id):
     """API endpoint to get consumed time per party for a specific bill."""
     connection = get_db_connection()
@@ -1816,86 +5646,26 @@ def api_get_bill_consumed_time(bill_id):
     
     try:
         cursor = connection.cursor(dictionary=True)
-        import json
         
-        # First get the bill details including allocated parties
-        cursor.execute("SELECT bill_name, party_allocations FROM bill_details WHERE id = %s", (bill_id,))
+        cursor.execute("SELECT id FROM bill_details WHERE id = %s", (bill_id,))
         bill = cursor.fetchone()
         
         if not bill:
             return jsonify({'success': False, 'error': 'Bill not found'}), 404
         
-        bill_name = bill['bill_name']
         date_param = request.args.get('date')
         
-        # Parse allocated parties list
-        party_allocations = bill.get('party_allocations')
-        if party_allocations:
-            if isinstance(party_allocations, str):
-                party_allocations = json.loads(party_allocations)
-        else:
-            party_allocations = []
-        
-        # Get list of party names that have allocated time
-        allocated_party_names = [p.get('party', '') for p in party_allocations]
-        
-        # Get all activity logs for this bill - party is now stored directly in activity_logs
-        query = """
-            SELECT party, duration_seconds, seat_no
-            FROM activity_logs 
-            WHERE activity_type = 'Bill Discussion' 
-              AND (bill_id = %s OR (bill_id IS NULL AND bill_name = %s))
-        """
-        params = [bill_id, bill_name]
-        if date_param:
-            query += " AND DATE(start_time) = %s"
-            params.append(date_param)
-        cursor.execute(query, tuple(params))
-        
-        results = cursor.fetchall()
+        # Per-party and per-seat totals come from the rollup tables, so this is
+        # O(parties + speakers) regardless of how many speeches were logged
+        ensure_bill_rollup_tables(connection)
+        consumed_time, seat_durations, seat_spoken = read_bill_time_totals(cursor, bill_id, date_param)
+        member_totals = {f"member_{seat}": total for seat, total in seat_durations.items()}
         
-        # Create lowercase lookup for allocated parties
-        allocated_party_lower = {p.lower().strip(): p for p in allocated_party_names}
-        
-        # Calculate consumed time - if party is in allocated list, use party; otherwise use Others
-        consumed_time = {}
-        member_totals = {}
-        for row in results:
-            member_party = row['party']
-            duration = row['duration_seconds'] or 0
-            seat_no = row.get('seat_no')
-            
-            # Check if member's party is in the allocated parties list (case-insensitive)
-            if member_party:
-                member_party_lower = member_party.lower().strip()
-                if member_party_lower in allocated_party_lower:
-                    # Use the original party name from allocations
-                    original_party = allocated_party_lower[member_party_lower]
-                    if original_party not in consumed_time:
-                        consumed_time[original_party] = 0
-                    consumed_time[original_party] += duration
-                else:
-                    # Party not in allocated list, count under Others
-                    if 'Others' not in consumed_time:
-                        consumed_time['Others'] = 0
-                    consumed_time['Others'] += duration
-            else:
-                # No party, count under Others
-                if 'Others' not in consumed_time:
-                    consumed_time['Others'] = 0
-                consumed_time['Others'] += duration
-        
-            # Track member-level totals (if seat number available)
-            if seat_no:
-                member_key = f"member_{seat_no}"
-                if member_key not in member_totals:
-                    member_totals[member_key] = 0
-                member_totals[member_key] += duration
-        
-        # Combine party totals and member totals into single dict (front-end expects both)
+        # Combine party totals and member totals into single dict (front-end expects both);
+        # member_totals carries the spoken seconds served by /api/bill-member-totals
         combined_data = {**consumed_time, **member_totals}
         
-        return jsonify({'success': True, 'data': combined_data})
+        return jsonify({'success': True, 'data': combined_data, 'member_totals': seat_spoken})
     except mysql.connector.Error as err:
         logger.error(f"Database error: {err}")
         return jsonify({'success': True, 'data': {}})
@@ -1903,6 +5673,7 @@ def api_get_bill_consumed_time(bill_id):
         connection.close()
 
 @app.route('/api/bill-member-totals/<int:bill_id>')
+@versioned_get('activity_logs', 'bill_details')
 def api_get_bill_member_totals(bill_id):
     """Return cumulative spoken time per member (seat) for a given bill discussion."""
     connection = get_db_connection()
@@ -1911,34 +5682,14 @@ def api_get_bill_member_totals(bill_id):
     
     try:
         cursor = connection.cursor(dictionary=True)
-        cursor.execute("SELECT bill_name FROM bill_details WHERE id = %s", (bill_id,))
+        cursor.execute("SELECT id FROM bill_details WHERE id = %s", (bill_id,))
         bill = cursor.fetchone()
         if not bill:
             return jsonify({'success': False, 'error': 'Bill not found'}), 404
         
-        bill_name = bill['bill_name']
         date_param = request.args.get('date')
-        query = """
-            SELECT seat_no, SUM(spoken_seconds) AS total_spoken
-            FROM activity_logs
-            WHERE activity_type = 'Bill Discussion'
-              AND (bill_id = %s OR (bill_id IS NULL AND bill_name = %s))
-        """
-        params = [bill_id, bill_name]
-        if date_param:
-            query += " AND DATE(start_time) = %s"
-            params.append(date_param)
-        query += " GROUP BY seat_no"
-        cursor.execute(query, tuple(params))
-        
-        results = cursor.fetchall()
-        totals = {}
-        for row in results:
-            seat_no = row['seat_no']
-            total_spoken = row['total_spoken'] or 0
-            if seat_no is None:
-                continue
-            totals[str(seat_no)] = total_spoken
+        ensure_bill_rollup_tables(connection)
+        _, _, totals = read_bill_time_totals(cursor, bill_id, date_param)
         return jsonify({'success': True, 'data': totals})
     except mysql.connector.Error as err:
         logger.error(f"Database error fetching member totals: {err}")
@@ -1946,6 +5697,142 @@ def api_get_bill_member_totals(bill_id):
     finally:
         connection.close()
 
+@app.route('/api/bill-log-summary')
+@versioned_get('activity_logs', 'bill_details')
+def api_get_bill_log_summary():
+    """API endpoint to get every bill's all-time speech count, speaker count and
+    total time, read from the rollups (so archived months are included)."""
+    connection = get_db_connection()
+    if not connection:
+        return jsonify({'success': False, 'error': 'Database connection failed'}), 500
+    
+    try:
+        ensure_bill_rollup_tables(connection)
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute("""
+            SELECT b.id AS bill_id,
+                   CAST(COALESCE(SUM(t.duration_seconds), 0) AS SIGNED) AS total_seconds,
+                   CAST(COALESCE(SUM(t.speech_count), 0) AS SIGNED) AS speech_count,
+                   COUNT(DISTINCT t.seat_no) AS speaker_count
+            FROM bill_details b
+            LEFT JOIN bill_seat_time t ON t.bill_id = b.id
+            GROUP BY b.id
+        """)
+        return jsonify({'success': True, 'data': cursor.fetchall()})
+    except mysql.connector.Error as err:
+        logger.error(f"Database error fetching bill log summary: {err}")
+        return jsonify({'success': False, 'error': str(err)}), 500
+    finally:
+        connection.close()
+
+
+# ============ BILL SNAPSHOT API ============
+
+SNAPSHOT_RECENT_SPEECHES = 20
+SNAPSHOT_CACHE_SIZE = 64
+
+# bill_id -> (version, etag, body); refilled lazily after a bill's version moves
+bill_snapshot_cache = OrderedDict()
+bill_snapshot_lock = threading.Lock()
+
+def build_bill_snapshot(connection, bill_id):
+    """Everything the Bill Discussion screen needs for one bill, or None if it does not exist."""
+    cursor = connection.cursor(dictionary=True)
+    cursor.execute("SELECT * FROM bill_details WHERE id = %s", (bill_id,))
+    bill = cursor.fetchone()
+    if not bill:
+        return None
+    normalize_bill_row(bill)
+    
+    ensure_bill_rollup_tables(connection)
+    consumed_time, seat_durations, seat_spoken = read_bill_time_totals(cursor, bill_id)
+    
+    # Remaining time per allocated party, plus Others from others_time
+    allotted = {}
+    for allocation in bill['party_allocations']:
+        if allocation.get('party'):
+            allotted[allocation['party']] = (int(allocation.get('hours') or 0) * 3600
+                                             + int(allocation.get('minutes') or 0) * 60)
+    others = bill['others_time']
+    allotted['Others'] = int(others.get('hours') or 0) * 3600 + int(others.get('minutes') or 0) * 60
+    remaining = {party: seconds - consumed_time.get(party, 0) for party, seconds in allotted.items()}
+    
+    cursor.execute("""
+        SELECT id, member_name, party, seat_no, chairperson, start_time, end_time,
+               duration_seconds, spoken_seconds, notes
+        FROM activity_logs
+        WHERE activity_type = 'Bill Discussion'
+          AND (bill_id = %s OR (bill_id IS NULL AND bill_name = %s))
+        ORDER BY start_time DESC, id DESC
+        LIMIT %s
+    """, (bill_id, bill['bill_name'], SNAPSHOT_RECENT_SPEECHES))
+    recent_speeches = cursor.fetchall()
+    for speech in recent_speeches:
+        for field in ('start_time', 'end_time'):
+            if speech.get(field):
+                speech[field] = speech[field].strftime('%Y-%m-%d %H:%M:%S')
+    
+    total_allotted = sum(allotted.values())
+    total_consumed = sum(consumed_time.values())
+    return {
+        'bill': bill,
+        'consumed_time': consumed_time,
+        'member_durations': seat_durations,
+        'member_totals': seat_spoken,
+        'allotted': allotted,
+        'remaining': remaining,
+        'totals': {
+            'allotted_seconds': total_allotted,
+            'consumed_seconds': total_consumed,
+            'remaining_seconds': total_allotted - total_consumed,
+        },
+        'recent_speeches': recent_speeches,
+    }
+
+@app.route('/api/bills/<int:bill_id>/snapshot')
+def api_get_bill_snapshot(bill_id):
+    """API endpoint to get a bill's allocations, consumed and remaining time, member totals
+    and recent speeches in one response. Cached per bill version; honours If-None-Match."""
+    import json
+    version = get_bill_version(bill_id)
+    with bill_snapshot_lock:
+        cached = bill_snapshot_cache.get(bill_id)
+        if cached and cached[0] == version:
+            bill_snapshot_cache.move_to_end(bill_id)
+        else:
+            cached = None
+    
+    if cached is None:
+        connection = get_db_connection()
+        if not connection:
+            return jsonify({'success': False, 'error': 'Database connection failed'}), 500
+        try:
+            snapshot = build_bill_snapshot(connection, bill_id)
+        except mysql.connector.Error as err:
+            logger.error(f"Database error building bill snapshot: {err}")
+            return jsonify({'success': False, 'error': str(err)}), 500
+        finally:
+            connection.close()
+        if snapshot is None:
+            return jsonify({'success': False, 'error': 'Bill not found'}), 404
+        snapshot['version'] = version
+        body = json.dumps({'success': True, 'data': snapshot}, default=str)
+        cached = (version, f'"bill-{bill_id}-{version}"', body)
+        with bill_snapshot_lock:
+            bill_snapshot_cache[bill_id] = cached
+            bill_snapshot_cache.move_to_end(bill_id)
+            while len(bill_snapshot_cache) > SNAPSHOT_CACHE_SIZE:
+                bill_snapshot_cache.popitem(last=False)
+    
+    _, etag, body = cached
+    # Weak comparison: compress_response() weakens the tag on compressed responses
+    if request.if_none_match.contains_weak(etag.strip('"')):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 # React SPA fallback (for packaged demo / production build)
 @app.route('/<path:asset_path>')
@@ -1953,8 +5840,8 @@ def serve_react_assets(asset_path):
     if os.path.exists(os.path.join(REACT_DIST_DIR, 'index.html')):
         file_path = os.path.join(REACT_DIST_DIR, asset_path)
         if os.path.isfile(file_path):
-            return send_from_directory(REACT_DIST_DIR, asset_path)
-        return send_from_directory(REACT_DIST_DIR, 'index.html')
+            return send_react_file(asset_path)
+        return send_react_file('index.html')
     return abort(404)
 
 # WebSocket Events
@@ -1963,6 +5850,8 @@ def handle_connect():
     """Handle client connection."""
     logger.info(f"Client connected: {request.sid}")
     emit('connected', {'status': 'Connected to Parliament Server'})
+    if timer_state:
+        emit('timer_sync', dict(timer_state))
 
 @socketio.on('disconnect')
 def handle_disconnect():
@@ -1980,26 +5869,109 @@ def handle_request_member(data):
         else:
             emit('member_data', {'success': False, 'error': 'Member not found'})
 
+@socketio.on('seat_rendered')
+def handle_seat_rendered(data):
+    """Optional client acknowledgement that a traced seat's member is on screen."""
+    if isinstance(data, dict):
+        stamp_latency(data.get('trace_id'), 'render')
+
 @socketio.on('timer_update')
 def handle_timer_update(data):
     """Broadcast timer updates to all clients."""
-    emit('timer_sync', data, broadcast=True)
+    session_recorder.record('timer', data)
+    if isinstance(data, dict):
+        set_timer_state(data)
+    event_dispatcher.publish('timer_sync', data)
 
 @socketio.on('select_chairperson')
 def handle_select_chairperson(data):
     """Broadcast chairperson selection to all clients."""
-    emit('chairperson_update', data, broadcast=True)
+    session_recorder.record('chairperson', data)
+    event_dispatcher.publish('chairperson_update', data)
 
 # Start the application
 if __name__ == '__main__':
-    # Run position migration
-    migrate_chairperson_positions()
+    import argparse
+    import multiprocessing
+    # Needed for the PDF report worker processes in the frozen (PyInstaller) EXE
+    multiprocessing.freeze_support()
+    parser = argparse.ArgumentParser(description='Parliament Talk Time Management web server')
+    parser.add_argument('--rehearsal', metavar='RECORDING',
+                        help='replay a recorded session (JSONL) against a scratch database')
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help=f'rehearsal replay speed ({REHEARSAL_MIN_SPEED}-{REHEARSAL_MAX_SPEED}x)')
+    parser.add_argument('--rehearsal-db', help='scratch database name (default: <DB_NAME>_rehearsal)')
+    parser.add_argument('--partition-activity-logs', action='store_true',
+                        help='convert activity_logs to monthly partitions (one table rebuild) and exit')
+    args = parser.parse_args()
+
+    if args.partition_activity_logs:
+        if not ACTIVITY_LOG_PARTITIONING:
+            raise SystemExit('Partitioning is disabled (ACTIVITY_LOG_PARTITIONING=0)')
+        status = activity_log_maintenance.run_once(convert=True)
+        if status['last_error']:
+            raise SystemExit(f"Partitioning failed: {status['last_error']}")
+        logger.info(f"activity_logs partitioned; archived: {', '.join(status['archived']) or 'none'}")
+        raise SystemExit(0)
+
+    if args.rehearsal:
+        prepare_rehearsal_database(args.rehearsal_db)
+        # Keep rehearsal logs out of the live spool (and live logs out of the scratch DB)
+        activity_log_writer.spool_path = ACTIVITY_LOG_SPOOL.replace('.jsonl', '') + '_rehearsal.jsonl'
+        activity_log_writer.rejected_path = activity_log_writer.spool_path + '.rejected'
+
+    # Run position and party_key migrations (once per cluster)
+    if IS_PRIMARY_WORKER:
+        migrate_chairperson_positions()
+        migrate_party_key_column()
     
-    # Start UDP receiver
-    udp_receiver.start()
+    # The reloader (development mode only) would start a second replay in the watcher
+    # process; cluster workers are restarted by their supervisor instead
+    use_reloader = SERVER_MODE == 'development' and not args.rehearsal and not CLUSTER_WORKER
+    serving_process = not use_reloader or os.environ.get('WERKZEUG_RUN_MAIN') == 'true'
     
+    # Start outbound event dispatcher and, in the primary worker only, the seat
+    # receivers (their ports can only be bound once; emits reach every worker's clients)
+    event_dispatcher.start()
+    if IS_PRIMARY_WORKER:
+        udp_receiver.start()
+        hex_listener.start()
+        if os.path.exists(os.path.join(REACT_DIST_DIR, 'index.html')):
+            threading.Thread(target=precompress_react_dist, name='precompress', daemon=True).start()
+    # Replay spooled activity logs only in the process that serves requests,
+    # not in the reloader's watcher process
+    if serving_process:
+        cluster_bus.start()
+        activity_log_writer.start()
+        if IS_PRIMARY_WORKER:
+            activity_log_maintenance.start()
+            if not args.rehearsal:
+                threading.Thread(target=drain_orphan_spools, name='spool-drain', daemon=True).start()
+
+    if args.rehearsal:
+        # Give the receivers a moment to bind before the first replayed event
+        threading.Timer(2.0, rehearsal_player.start, args=(args.rehearsal, args.speed)).start()
+
     try:
-        logger.info("Starting Parliament Web Server on http://localhost:5000")
-        socketio.run(app, host='0.0.0.0', port=5000, debug=True)
+        if CLUSTER_WORKER:
+            logger.info(f"Starting worker {WORKER_INDEX + 1}/{SERVER_WORKERS} on port {SERVER_PORT} ({SERVER_MODE} mode)")
+        else:
+            logger.info(f"Starting Parliament Web Server on http://localhost:{SERVER_PORT} ({SERVER_MODE} mode)")
+        if SERVER_MODE == 'development':
+            socketio.run(app, host=SERVER_HOST, port=SERVER_PORT, debug=True, use_reloader=use_reloader)
+        elif SERVER_MODE == 'threading':
+            socketio.run(app, host=SERVER_HOST, port=SERVER_PORT, allow_unsafe_werkzeug=True)
+        else:
+            # eventlet.wsgi / gevent pywsgi, picked by Flask-SocketIO from async_mode
+            socketio.run(app, host=SERVER_HOST, port=SERVER_PORT)
     finally:
+        cluster_bus.stop()
         udp_receiver.stop()
+        hex_listener.stop()
+        event_dispatcher.stop()
+        activity_log_writer.stop()
+        activity_log_maintenance.stop()
+        rehearsal_player.stop()
+        report_renderer.shutdown()
+        job_runner.shutdown()
+        session_recorder.close()
@@ -0,0 +1,596 @@
+"""
+Multi-worker scale-out.
+With SERVER_WORKERS > 1, app.py becomes a supervisor (supervise()) that starts
+N worker processes of itself on 127.0.0.1:SERVER_PORT+1..+N, a local message
+broker, and a front proxy on SERVER_HOST:SERVER_PORT:
+
+  MessageBroker   per-channel fan-out of length-prefixed frames over a Unix socket
+                  (127.0.0.1 TCP where Unix sockets are unavailable); a local,
+                  no-network stand-in for Redis pub/sub
+  BrokerManager   python-socketio client manager on that broker, so an emit in
+                  any worker reaches the clients of every worker
+  StateBus        JSON messages between workers (broadcast feed, timer, data
+                  version bumps), over the broker or a redis:// URL
+  StickyProxy     routes each connection by its Engine.IO session id (prefixed
+                  with the owning worker's index, see worker_session_id()), so a
+                  websocket or long-polling session always reaches the worker
+                  that owns it; requests without a session go to the least busy
+                  worker and are closed after one response, except paths pinned
+                  to worker 0 (per-process stats, PDF reports still rendering)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from urllib.parse import urlsplit
+
+import socketio
+
+logger = logging.getLogger(__name__)
+
+BROKER_SCHEMES = ('broker+unix', 'broker+tcp')
+BROKER_MAX_FRAME = 16 * 1024 * 1024      # bytes; larger frames close the connection
+BROKER_MAX_BACKLOG = 8 * 1024 * 1024     # bytes queued for a slow subscriber before it is dropped
+BROKER_SEND_TIMEOUT = 2.0                # seconds a publish may block before the connection is replaced
+BROKER_CONTROL_CHANNEL = '!broker'       # first frame of a connection: b'publish' or b'subscribe <channel>'
+RECONNECT_MAX_DELAY = 5.0                # seconds between broker/redis reconnect attempts
+PROXY_HEAD_TIMEOUT = 30                  # seconds to receive a request head
+PROXY_BUFFER = 64 * 1024
+WORKER_RESTART_DELAY = 2.0               # seconds before a crashed worker is restarted
+WORKER_STOP_TIMEOUT = 10
+
+SESSION_ID_PATTERN = re.compile(rb'[?&]sid=(\d+)\.')
+
+
+def default_broker_url(port):
+    """Local broker address for a server on `port` (one broker per server instance)."""
+    if hasattr(socket, 'AF_UNIX'):
+        return f"broker+unix://{os.path.join(tempfile.gettempdir(), f'parliament_broker_{port}.sock')}"
+    return f"broker+tcp://127.0.0.1:{port + 100}"
+
+
+def parse_broker_url(url):
+    """(family, address) for a broker+unix:///path or broker+tcp://host:port URL."""
+    parts = urlsplit(url)
+    if parts.scheme == 'broker+unix':
+        return socket.AF_UNIX, parts.path
+    if parts.scheme == 'broker+tcp':
+        return socket.AF_INET, (parts.hostname or '127.0.0.1', parts.port or 5100)
+    raise ValueError(f"Not a broker URL: {url!r} (expected {' or '.join(s + '://' for s in BROKER_SCHEMES)})")
+
+
+def is_broker_url(url):
+    return (url or '').startswith(tuple(scheme + '://' for scheme in BROKER_SCHEMES))
+
+
+def worker_session_id(worker_index, generate_id):
+    """Engine.IO id generator that prefixes ids with the worker index ("2.<id>"),
+    which is what the sticky proxy routes on."""
+    def generate():
+        return f"{worker_index}.{generate_id()}"
+    return generate
+
+
+# ============ BROKER CLIENT ============
+
+def encode_frame(channel, body):
+    payload = channel.encode() + b'\n' + body
+    return len(payload).to_bytes(4, 'big') + payload
+
+
+def connect_broker(url, hello, timeout=5.0, send_timeout=None):
+    """Connect and introduce the connection (see BROKER_CONTROL_CHANNEL)."""
+    family, address = parse_broker_url(url)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(address)
+        sock.sendall(encode_frame(BROKER_CONTROL_CHANNEL, hello))
+    except OSError:
+        sock.close()
+        raise
+    sock.settimeout(send_timeout)
+    return sock
+
+
+def _recv_exactly(sock, size):
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError('broker closed the connection')
+        data += chunk
+    return data
+
+
+class BrokerPublisher:
+    """Thread-safe publish-only connection; reconnects once per failed send.
+    The broker never writes to it, and a send blocked for BROKER_SEND_TIMEOUT
+    replaces the connection, so a publisher can never wedge its callers.
+    Messages published while the broker is unreachable are dropped (and counted)."""
+    def __init__(self, url):
+        self.url = url
+        self.sock = None
+        self.lock = threading.Lock()
+        self.dropped = 0
+
+    def publish(self, channel, body):
+        frame = encode_frame(channel, body)
+        with self.lock:
+            for attempt in range(2):
+                try:
+                    if self.sock is None:
+                        self.sock = connect_broker(self.url, b'publish', send_timeout=BROKER_SEND_TIMEOUT)
+                    self.sock.sendall(frame)
+                    return True
+                except OSError as e:
+                    self._close()
+                    if attempt:
+                        self.dropped += 1
+                        logger.warning(f"Broker publish failed on {channel}: {e}")
+            return False
+
+    def _close(self):
+        if self.sock:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
+
+    def close(self):
+        with self.lock:
+            self._close()
+
+
+def subscribe(url, channel, on_connect=None, stop_event=None):
+    """Yield message bodies published on `channel`, reconnecting to the broker
+    with backoff until stop_event is set. on_connect() runs after each
+    (re)connect, once the subscription is live."""
+    channel_prefix = channel.encode() + b'\n'
+    delay = 0.5
+    while not (stop_event and stop_event.is_set()):
+        try:
+            sock = connect_broker(url, b'subscribe ' + channel.encode())
+        except OSError as e:
+            logger.warning(f"Message broker unreachable ({e}); retrying in {delay:.1f}s")
+            time.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+            continue
+        delay = 0.5
+        try:
+            if on_connect:
+                on_connect()
+            while not (stop_event and stop_event.is_set()):
+                size = int.from_bytes(_recv_exactly(sock, 4), 'big')
+                payload = _recv_exactly(sock, size)
+                if payload.startswith(channel_prefix):
+                    yield payload[len(channel_prefix):]
+        except OSError as e:
+            if not (stop_event and stop_event.is_set()):
+                logger.warning(f"Message broker connection lost: {e}")
+        finally:
+            sock.close()
+
+
+class BrokerManager(socketio.PubSubManager):
+    """Socket.IO client manager that shares emits between workers through the
+    local broker. Messages are JSON (not pickled like the Redis manager), so
+    the broker socket never carries anything that is executed on load."""
+    name = 'broker'
+
+    def __init__(self, url, channel='socketio', write_only=False, logger=None):
+        parse_broker_url(url)
+        self.url = url
+        self.publisher = BrokerPublisher(url)
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+
+    def _publish(self, data):
+        self.publisher.publish(self.channel, json.dumps(data, default=str).encode())
+
+    def _listen(self):
+        for body in subscribe(self.url, self.channel):
+            try:
+                yield json.loads(body)
+            except ValueError:
+                continue
+
+
+# ============ STATE BUS ============
+
+class StateBus:
+    """Small JSON messages between the workers of one server.
+
+    publish(kind, data) reaches every other worker (never the sender); handlers
+    registered with on(kind) run on the bus thread. Without a URL (a single
+    process) publish() does nothing. Delivery is best effort: a message sent
+    while the broker is down is lost, so state kept in sync this way must also
+    be bounded by other means (the query cache TTL, re-publishing on change).
+    """
+    def __init__(self, url, channel='parliament-state'):
+        self.url = url or ''
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self.handlers = {}
+        self.connect_hooks = []
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.publisher = None
+        self.redis = None
+        self.metrics = {'published': 0, 'received': 0, 'handler_errors': 0, 'connects': 0}
+        self.metrics_lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return bool(self.url)
+
+    def on(self, kind, handler=None):
+        """Register handler(data) for `kind`; usable as a decorator."""
+        def register(func):
+            self.handlers[kind] = func
+            return func
+        return register(handler) if handler else register
+
+    def on_connect(self, hook):
+        """Run hook() each time the bus (re)subscribes, e.g. to ask for current state."""
+        self.connect_hooks.append(hook)
+        return hook
+
+    def publish(self, kind, data=None):
+        if not self.url:
+            return
+        body = json.dumps({'origin': self.origin, 'kind': kind, 'data': data}, default=str).encode()
+        try:
+            if is_broker_url(self.url):
+                if self.publisher is None:
+                    self.publisher = BrokerPublisher(self.url)
+                if not self.publisher.publish(self.channel, body):
+                    return
+            else:
+                self._redis().publish(self.channel, body)
+        except Exception as e:
+            logger.warning(f"State bus publish failed ({kind}): {e}")
+            return
+        with self.metrics_lock:
+            self.metrics['published'] += 1
+
+    def start(self):
+        if not self.url or (self.thread and self.thread.is_alive()):
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name='state-bus', daemon=True)
+        self.thread.start()
+        logger.info(f"State bus listening on {self.url} ({self.channel})")
+
+    def stop(self):
+        self.stop_event.set()
+        if self.publisher:
+            self.publisher.close()
+
+    def stats(self):
+        with self.metrics_lock:
+            stats = dict(self.metrics)
+        stats['enabled'] = self.enabled
+        stats['dropped'] = self.publisher.dropped if self.publisher else 0
+        return stats
+
+    def _redis(self):
+        if self.redis is None:
+            import redis
+            self.redis = redis.Redis.from_url(self.url)
+        return self.redis
+
+    def _connected(self):
+        with self.metrics_lock:
+            self.metrics['connects'] += 1
+        for hook in self.connect_hooks:
+            try:
+                hook()
+            except Exception as e:
+                logger.error(f"State bus connect hook error: {e}")
+
+    def _messages(self):
+        if is_broker_url(self.url):
+            yield from subscribe(self.url, self.channel, self._connected, self.stop_event)
+            return
+        delay = 0.5
+        while not self.stop_event.is_set():
+            try:
+                pubsub = self._redis().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                self._connected()
+                delay = 0.5
+                while not self.stop_event.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message:
+                        yield message['data']
+            except Exception as e:
+                logger.warning(f"State bus connection lost ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    def _run(self):
+        for body in self._messages():
+            try:
+                message = json.loads(body)
+            except ValueError:
+                continue
+            if message.get('origin') == self.origin:
+                continue
+            handler = self.handlers.get(message.get('kind'))
+            if not handler:
+                continue
+            with self.metrics_lock:
+                self.metrics['received'] += 1
+            try:
+                handler(message.get('data'))
+            except Exception as e:
+                with self.metrics_lock:
+                    self.metrics['handler_errors'] += 1
+                logger.error(f"State bus handler error ({message.get('kind')}): {e}")
+
+
+# ============ SUPERVISOR (broker, proxy, workers) ============
+
+class MessageBroker:
+    """Delivers each frame to every subscriber of its channel, the sender's own
+    subscription included (the same delivery Redis pub/sub gives the Socket.IO
+    managers). A connection's first frame says what it is: publish-only
+    connections are never written to; subscribers only receive their channel."""
+    def __init__(self, url):
+        self.url = url
+        self.family, self.address = parse_broker_url(url)
+        self.subscribers = {}     # channel (bytes) -> set of writers
+        self.server = None
+
+    async def start(self):
+        if self.family == getattr(socket, 'AF_UNIX', None):
+            if os.path.exists(self.address):
+                os.unlink(self.address)   # left by a previous run
+            self.server = await asyncio.start_unix_server(self._handle, path=self.address)
+            os.chmod(self.address, 0o600)
+        else:
+            host, port = self.address
+            self.server = await asyncio.start_server(self._handle, host, port)
+        logger.info(f"Message broker listening on {self.url}")
+
+    def close(self):
+        if self.server:
+            self.server.close()
+        if self.family == getattr(socket, 'AF_UNIX', None) and os.path.exists(self.address):
+            os.unlink(self.address)
+
+    async def _read_frame(self, reader):
+        """(channel, frame) for the next frame, or None if it is oversized."""
+        header = await reader.readexactly(4)
+        size = int.from_bytes(header, 'big')
+        if size > BROKER_MAX_FRAME:
+            return None
+        payload = await reader.readexactly(size)
+        return payload.split(b'\n', 1)[0], header + payload
+
+    async def _handle(self, reader, writer):
+        channel = None
+        try:
+            hello = await self._read_frame(reader)
+            if hello is None or hello[0] != BROKER_CONTROL_CHANNEL.encode():
+                return
+            command = hello[1][4:].split(b'\n', 1)[1]
+            if command.startswith(b'subscribe '):
+                channel = command[len(b'subscribe '):]
+                self.subscribers.setdefault(channel, set()).add(writer)
+            elif command != b'publish':
+                return
+            while True:
+                frame = await self._read_frame(reader)
+                if frame is None:
+                    break
+                self._deliver(*frame)
+        except (asyncio.IncompleteReadError, ConnectionError, OSError):
+            pass
+        finally:
+            if channel is not None:
+                self.subscribers.get(channel, set()).discard(writer)
+            writer.close()
+
+    def _deliver(self, channel, frame):
+        subscribers = self.subscribers.get(channel, set())
+        for client in list(subscribers):
+            if client.transport.get_write_buffer_size() > BROKER_MAX_BACKLOG:
+                # A stuck subscriber is cut off; it reconnects and resumes from new messages
+                subscribers.discard(client)
+                client.close()
+                logger.warning("Message broker dropped a subscriber that stopped reading")
+            else:
+                client.write(frame)
+
+
+def close_after_response(head):
+    """Rewrite a request head to ask the worker to close after responding, so
+    the next request on the client's connection is routed afresh."""
+    lines = head[:-4].split(b'\r\n')
+    kept = [line for line in lines[1:]
+            if not line.lower().startswith((b'connection:', b'keep-alive:', b'proxy-connection:'))]
+    return b'\r\n'.join([lines[0]] + kept + [b'Connection: close']) + b'\r\n\r\n'
+
+
+class StickyProxy:
+    """TCP front end for the workers.
+
+    A request carrying an Engine.IO sid goes to the worker named in the sid;
+    websocket connections without one go to the least busy worker and stay
+    there for their lifetime. Other requests also go to the least busy worker
+    and get "Connection: close", so each HTTP request is balanced on its own.
+    Requests for a path starting with one of `primary_paths` go to worker 0.
+    """
+    def __init__(self, host, port, worker_ports, primary_paths=()):
+        self.host = host
+        self.port = port
+        self.worker_ports = list(worker_ports)
+        self.primary_paths = tuple(path.encode() for path in primary_paths)
+        self.active = [0] * len(self.worker_ports)
+        self.next_worker = 0
+        self.server = None
+        self.metrics = {'connections': 0, 'sticky': 0, 'pinned': 0, 'balanced': 0, 'failed': 0}
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info(f"Sticky proxy listening on {self.host}:{self.port} -> workers on ports "
+                    f"{self.worker_ports[0]}-{self.worker_ports[-1]}")
+
+    def close(self):
+        if self.server:
+            self.server.close()
+
+    def _candidates(self, preferred):
+        """Worker indexes to try in order: the session owner, then the least busy."""
+        count = len(self.worker_ports)
+        start = self.next_worker
+        self.next_worker = (self.next_worker + 1) % count
+        order = sorted(range(count), key=lambda i: (self.active[i], (i - start) % count))
+        if preferred is not None and 0 <= preferred < count:
+            order.remove(preferred)
+            order.insert(0, preferred)
+        return order
+
+    async def _handle(self, client_reader, client_writer):
+        self.metrics['connections'] += 1
+        try:
+            head = await asyncio.wait_for(client_reader.readuntil(b'\r\n\r\n'), PROXY_HEAD_TIMEOUT)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ConnectionError):
+            client_writer.close()
+            return
+
+        request_line = head.split(b'\r\n', 1)[0]
+        match = SESSION_ID_PATTERN.search(request_line)
+        preferred = int(match.group(1)) if match else None
+        target = request_line.split(b' ')[1] if request_line.count(b' ') >= 2 else b''
+        if preferred is None and self.primary_paths and target.startswith(self.primary_paths):
+            preferred = 0
+            self.metrics['pinned'] += 1
+        else:
+            self.metrics['sticky' if match else 'balanced'] += 1
+        websocket = b'\r\nupgrade: websocket' in head.lower()
+        if not websocket:
+            head = close_after_response(head)
+
+        for index in self._candidates(preferred):
+            try:
+                upstream_reader, upstream_writer = await asyncio.open_connection('127.0.0.1', self.worker_ports[index])
+                break
+            except OSError:
+                continue   # worker (re)starting; a stale session id gets "unknown session" from the next one
+        else:
+            self.metrics['failed'] += 1
+            client_writer.write(b'HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+            client_writer.close()
+            return
+
+        self.active[index] += 1
+        try:
+            upstream_writer.write(head)
+            to_worker = asyncio.ensure_future(self._pipe(client_reader, upstream_writer, half_close=True))
+            # The exchange ends when the worker closes (after one response, or when a websocket ends)
+            await self._pipe(upstream_reader, client_writer, mark_close=not websocket)
+            to_worker.cancel()
+        finally:
+            self.active[index] -= 1
+            upstream_writer.close()
+            client_writer.close()
+
+    async def _pipe(self, reader, writer, half_close=False, mark_close=False):
+        try:
+            if mark_close:
+                # Tell the client too, so it does not reuse a connection the worker is about to close
+                head = await reader.readuntil(b'\r\n\r\n')
+                if b'\r\nconnection:' not in head.lower():
+                    head = head[:-2] + b'Connection: close\r\n\r\n'
+                writer.write(head)
+            while True:
+                data = await reader.read(PROXY_BUFFER)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+            if half_close and writer.can_write_eof():
+                writer.write_eof()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, OSError):
+            pass
+
+
+class Supervisor:
+    """Runs the broker and proxy, keeps the worker processes up, and stops them on exit."""
+    def __init__(self, command, host, port, workers, message_queue, env=None, primary_paths=()):
+        self.command = command
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.message_queue = message_queue
+        self.worker_ports = [port + 1 + index for index in range(workers)]
+        self.env = dict(env if env is not None else os.environ)
+        self.env['CLUSTER_STARTED_AT'] = str(time.time())
+        self.processes = [None] * workers
+        self.broker = MessageBroker(message_queue) if is_broker_url(message_queue) else None
+        self.proxy = StickyProxy(host, port, self.worker_ports, primary_paths)
+        self.stopping = False
+
+    def spawn(self, index):
+        env = dict(self.env, WORKER_INDEX=str(index), SERVER_WORKERS=str(self.workers),
+                   SERVER_HOST='127.0.0.1', SERVER_PORT=str(self.worker_ports[index]),
+                   SOCKETIO_MESSAGE_QUEUE=self.message_queue)
+        self.processes[index] = subprocess.Popen(self.command, env=env)
+        logger.info(f"Worker {index} started (pid {self.processes[index].pid}, port {self.worker_ports[index]})")
+
+    async def run(self):
+        if self.broker:
+            await self.broker.start()
+        await self.proxy.start()
+        for index in range(self.workers):
+            self.spawn(index)
+        while not self.stopping:
+            await asyncio.sleep(WORKER_RESTART_DELAY)
+            for index, process in enumerate(self.processes):
+                if process.poll() is not None:
+                    logger.warning(f"Worker {index} exited with code {process.returncode}; restarting")
+                    self.spawn(index)
+
+    def stop(self):
+        self.stopping = True
+        self.proxy.close()
+        for process in self.processes:
+            if process and process.poll() is None:
+                process.terminate()
+        for process in self.processes:
+            if process:
+                try:
+                    process.wait(timeout=WORKER_STOP_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+        if self.broker:
+            self.broker.close()
+
+
+def supervise(script, argv, host, port, workers, primary_paths=()):
+    """Run `workers` copies of `script` behind the sticky proxy until interrupted."""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - [supervisor] %(message)s')
+    message_queue = os.getenv('SOCKETIO_MESSAGE_QUEUE', '').strip() or default_broker_url(port)
+    # The packaged EXE is its own interpreter
+    command = [sys.executable] + ([] if getattr(sys, 'frozen', False) else [os.path.abspath(script)]) + list(argv)
+    supervisor = Supervisor(command, host, port, workers, message_queue, primary_paths=primary_paths)
+    logger.info(f"Starting {workers} workers on http://{host}:{port} (message queue {message_queue})")
+    try:
+        asyncio.run(supervisor.run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        supervisor.stop()
+    return 0
@@ -0,0 +1,136 @@
+"""
+Member and chairperson name matching.
+name_key() reduces a display name to a comparison key: case-folded,
+honorifics (Shri, Smt, Dr, ...) and punctuation dropped, whitespace collapsed
+and tokens sorted, so "SHRI DEREK O' BRIEN" and "O'Brien, Derek" share a key.
+The key is stored in an indexed name_key column on parliament_seats and
+chairpersons so name joins are equality lookups. NameIndex resolves free
+text (activity log names, imported rows) against those keys, falling back
+to a token/trigram index for partial names and misspellings.
+"""
+
+import unicodedata
+
+NAME_KEY_LENGTH = 255
+FUZZY_CUTOFF = 0.6   # trigram Jaccard similarity for the fuzzy tier
+
+# Compared after punctuation is removed ("Dr." -> "dr", "Smt." -> "smt")
+HONORIFICS = frozenset([
+    'shri', 'sh', 'shree', 'sri', 'smt', 'shrimati', 'srimati', 'sushri', 'kumari', 'km', 'kum',
+    'dr', 'prof', 'mr', 'mrs', 'ms', 'miss', 'adv', 'hon', 'honble', 'justice', 'sardar', 'thiru',
+    'thirumathi', 'selvi', 'capt', 'col', 'gen', 'lt', 'retd',
+    'श्री', 'श्रीमती', 'सुश्री', 'कुमारी', 'डॉ', 'डा', 'प्रो',
+])
+
+
+def normalize_name(name):
+    """Case-folded name with punctuation removed and whitespace collapsed; token order kept."""
+    chars = []
+    for char in unicodedata.normalize('NFKC', name or '').casefold():
+        # Punctuation and symbols become spaces; Devanagari vowel signs (marks) are kept
+        chars.append(' ' if unicodedata.category(char)[0] in 'PSZC' else char)
+    return ' '.join(''.join(chars).split())
+
+
+def name_tokens(name):
+    """Normalized tokens without honorifics (kept if the name is nothing but honorifics)."""
+    tokens = normalize_name(name).split()
+    return [token for token in tokens if token not in HONORIFICS] or tokens
+
+
+def name_key(name):
+    """Order-independent comparison key for a name ('' for blank names)."""
+    return ' '.join(sorted(name_tokens(name)))[:NAME_KEY_LENGTH]
+
+
+def same_person(a, b):
+    """True when two names only differ in case, honorifics, punctuation or word order."""
+    return bool(name_key(a)) and name_key(a) == name_key(b)
+
+
+def _trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """In-memory index from names to ids (seat numbers, chairperson ids).
+
+    match() tries, in order: the exact stripped name, the name_key, then a
+    fuzzy tier (every query token appears in the candidate, or trigram
+    similarity >= FUZZY_CUTOFF). It returns the first tier with any hit, so
+    callers can treat more than one id as ambiguous.
+    """
+    def __init__(self, entries=()):
+        self.names = {}
+        self.exact = {}
+        self.keys = {}
+        self.key_trigrams = {}
+        self.postings = {}
+        for entry_id, name in entries:
+            self.add(entry_id, name)
+
+    def add(self, entry_id, name):
+        name = (name or '').strip()
+        key = name_key(name)
+        if not key:
+            return
+        entry_id = str(entry_id)
+        self.names[entry_id] = name
+        self.exact.setdefault(name, set()).add(entry_id)
+        if key not in self.keys:
+            self.key_trigrams[key] = _trigrams(key)
+            for gram in self.key_trigrams[key]:
+                self.postings.setdefault(gram, set()).add(key)
+        self.keys.setdefault(key, set()).add(entry_id)
+
+    def match(self, name):
+        """Returns (tier, ids); tier is 'exact', 'normalized', 'fuzzy' or None."""
+        name = (name or '').strip()
+        if not name:
+            return None, set()
+        if name in self.exact:
+            return 'exact', set(self.exact[name])
+        key = name_key(name)
+        if key in self.keys:
+            return 'normalized', set(self.keys[key])
+        if not key:
+            return None, set()
+
+        tokens = set(key.split())
+        grams = _trigrams(key)
+        shared = {}
+        for gram in grams:
+            for other in self.postings.get(gram, ()):
+                shared[other] = shared.get(other, 0) + 1
+        ids = set()
+        for other, count in shared.items():
+            similarity = count / float(len(grams) + len(self.key_trigrams[other]) - count)
+            if similarity >= FUZZY_CUTOFF or tokens <= set(other.split()):
+                ids |= self.keys[other]
+        return ('fuzzy', ids) if ids else (None, set())
+
+    def describe(self, ids):
+        """[{'id', 'name'}] for reporting ambiguous matches."""
+        return [{'id': entry_id, 'name': self.names.get(entry_id)} for entry_id in sorted(ids)]
+
+
+def add_name_key_column(cursor, table):
+    """Add the name_key column and its index to `table`; existing ones are left alone."""
+    for statement in [f"ALTER TABLE {table} ADD COLUMN name_key VARCHAR({NAME_KEY_LENGTH}) NULL",
+                      f"CREATE INDEX idx_{table}_name_key ON {table} (name_key)"]:
+        try:
+            cursor.execute(statement)
+        except Exception:
+            pass  # already exists (or the table does not; the caller's next query will say so)
+
+
+def sync_name_keys(cursor, table, id_column):
+    """Fill or correct `table`.name_key for every row whose stored key is stale.
+    Takes a plain (tuple) cursor; the caller commits. Returns rows updated."""
+    cursor.execute(f"SELECT {id_column}, name, name_key FROM {table}")
+    updates = [(name_key(name), row_id) for row_id, name, stored in cursor.fetchall()
+               if (stored or '') != name_key(name)]
+    if updates:
+        cursor.executemany(f"UPDATE {table} SET name_key = %s WHERE {id_column} = %s", updates)
+    return len(updates)
@@ -0,0 +1,105 @@
+"""
+Server-side PDF rendering for log reports.
+render_pdf_report() is a plain top-level function taking only picklable data,
+so it can run in a worker process without touching Flask or the database.
+"""
+
+import io
+import os
+from xml.sax.saxutils import escape
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import mm
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+
+HEADER_COLOR = '#991b1b'
+TOTAL_ROW_COLOR = '#fee2e2'
+
+# Optional TTF with Devanagari glyphs (e.g. C:\Windows\Fonts\Nirmala.ttf) for Hindi names
+PDF_FONT_PATH = os.getenv('PDF_FONT_PATH')
+
+_registered_font = None
+
+
+def _body_font():
+    """Register PDF_FONT_PATH once per worker process; fall back to Helvetica."""
+    global _registered_font
+    if _registered_font is None:
+        _registered_font = 'Helvetica'
+        if PDF_FONT_PATH and os.path.exists(PDF_FONT_PATH):
+            try:
+                pdfmetrics.registerFont(TTFont('ReportFont', PDF_FONT_PATH))
+                _registered_font = 'ReportFont'
+            except Exception:
+                pass
+    return _registered_font
+
+
+def is_total_row(row):
+    """True for rows ending a group (a cell ending in 'Total:'); shared with the CSV/XLSX exports."""
+    return any(isinstance(value, str) and value.endswith('Total:') for value in row)
+
+
+def render_pdf_report(spec):
+    """Render a report spec to PDF bytes.
+
+    spec = {
+        'title': str, 'subtitle': str, 'generated_at': str,
+        'sections': [{'heading': str or None, 'header': [...], 'rows': [[...], ...]}],
+    }
+    Rows ending a group (cells ending in 'Total:') are shaded and bold.
+    """
+    if not REPORTLAB_AVAILABLE:
+        raise RuntimeError('reportlab is not installed')
+
+    font = _body_font()
+    bold_font = 'Helvetica-Bold' if font == 'Helvetica' else font
+    styles = getSampleStyleSheet()
+    title_style = styles['Title']
+    title_style.textColor = colors.HexColor(HEADER_COLOR)
+    normal_style = styles['Normal']
+    normal_style.fontName = font
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=landscape(A4), leftMargin=12 * mm, rightMargin=12 * mm,
+                            topMargin=12 * mm, bottomMargin=12 * mm, title=spec.get('title', 'Report'))
+    # Paragraph parses its text as markup; names like 'A & B' or '<draft>' must be escaped
+    story = [Paragraph(escape(spec.get('title', 'Report')), title_style)]
+    if spec.get('subtitle'):
+        story.append(Paragraph(escape(spec['subtitle']), normal_style))
+    if spec.get('generated_at'):
+        story.append(Paragraph(escape(f"Generated on: {spec['generated_at']}"), normal_style))
+    story.append(Spacer(1, 6 * mm))
+
+    for section in spec.get('sections', []):
+        if section.get('heading'):
+            story.append(Paragraph(escape(section['heading']), styles['Heading3']))
+        data = [list(section['header'])] + [['' if v is None else str(v) for v in row] for row in section['rows']]
+        table = Table(data, repeatRows=1)
+        commands = [
+            ('FONTNAME', (0, 0), (-1, -1), font),
+            ('FONTNAME', (0, 0), (-1, 0), bold_font),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(HEADER_COLOR)),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('GRID', (0, 0), (-1, -1), 0.25, colors.HexColor('#d1d5db')),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]
+        for index, row in enumerate(section['rows'], 1):
+            if is_total_row(row):
+                commands.append(('FONTNAME', (0, index), (-1, index), bold_font))
+                commands.append(('BACKGROUND', (0, index), (-1, index), colors.HexColor(TOTAL_ROW_COLOR)))
+        table.setStyle(TableStyle(commands))
+        story.append(table)
+        story.append(Spacer(1, 6 * mm))
+
+    doc.build(story)
+    return buffer.getvalue()